@@ -0,0 +1,75 @@
+import argparse
+import sys
+import time
+from decimal import Decimal
+sys.path.append('../..')
+
+from storescraper.product import Product  # noqa
+
+
+def sample_serialized_products(count, description=None):
+    # Serialized products like the ones returned by the workers, with the
+    # fields that Product validates (pictures, EAN) filled in. "description"
+    # is formatted with the index of each product
+    serialized_products = []
+
+    for i in range(count):
+        product = Product(
+            'Sample product {}'.format(i),
+            'SampleStore',
+            'Notebook',
+            'https://www.example.com/product/{}'.format(i),
+            'https://www.example.com/product/{}'.format(i),
+            str(i),
+            i % 10,
+            Decimal(100000 + i),
+            Decimal(90000 + i),
+            'CLP',
+            sku=str(i),
+            ean='7802920000015',
+            description=description.format(i) if description else None,
+            picture_urls=['https://www.example.com/pictures/{}-{}.jpg'.format(
+                i, picture) for picture in range(4)],
+            positions={'Notebook': i})
+        serialized_products.append(product.serialize())
+
+    return serialized_products
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compares the time taken by Product.deserialize and '
+                    'Product.from_trusted_dict to rebuild the products of '
+                    'a run.')
+
+    parser.add_argument('--products', type=int, nargs='?', default=50000,
+                        help='Number of products to deserialize')
+
+    parser.add_argument('--repetitions', type=int, nargs='?', default=3,
+                        help='Runs per method, the fastest one is reported')
+
+    args = parser.parse_args()
+    serialized_products = sample_serialized_products(args.products)
+
+    for method in [Product.deserialize, Product.from_trusted_dict]:
+        times = []
+
+        for _ in range(args.repetitions):
+            # deserialize modifies the dictionaries that it receives
+            copies = [dict(serialized_product)
+                      for serialized_product in serialized_products]
+            start = time.perf_counter()
+            products = [method(serialized_product)
+                        for serialized_product in copies]
+            times.append(time.perf_counter() - start)
+
+        assert [product.serialize() for product in products] == \
+            serialized_products
+
+        elapsed = min(times)
+        print('{:<30} {:>8.3f} s {:>10.1f} us/product'.format(
+            method.__name__, elapsed, elapsed / args.products * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,7 @@ import logging
 import sys
 sys.path.append('../..')
 
+from storescraper.executors import EXECUTORS  # noqa
 from storescraper.utils import get_store_class_by_name  # noqa
 
 
@@ -27,6 +28,16 @@ def main():
                         const=True,
                         help='Use asynchronous tasks (celery)')
 
+    parser.add_argument('--with_threads', type=bool, nargs='?', default=False,
+                        const=True,
+                        help='Use a local thread pool (ignored if '
+                             '--with_async is given)')
+
+    parser.add_argument('--executor', type=str, nargs='?', default=None,
+                        choices=list(EXECUTORS.keys()),
+                        help='Executor to use (overrides --with_async and '
+                             '--with_threads)')
+
     parser.add_argument('--extra_args', type=json.loads, nargs='?', default={},
                         help='Optional arguments to pass to the parser '
                              '(usually username/password) for private sites)')
@@ -37,6 +48,8 @@ def main():
     result = store.discover_entries_for_categories(
         categories=args.categories,
         use_async=args.with_async,
+        use_threads=args.with_threads,
+        executor=args.executor,
         extra_args=args.extra_args)
 
     for url, entry_metadata in result.items():
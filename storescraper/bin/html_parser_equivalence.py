@@ -0,0 +1,110 @@
+import argparse
+import json
+import logging
+import os
+import sys
+sys.path.append('../..')
+
+from parse_benchmark import DEFAULT_STORES, fixture_paths  # noqa
+from storescraper.paths import cache_path  # noqa
+from storescraper.utils import get_store_class_by_name  # noqa
+
+
+def scraping_results(store, fixtures_dir, html_parser):
+    # The discovered entries and products of the recorded fixtures of the
+    # store (see parse_benchmark.py) using the given parser by default
+    previous_html_parser = os.environ.get('STORESCRAPER_HTML_PARSER')
+    os.environ['STORESCRAPER_HTML_PARSER'] = html_parser
+
+    try:
+        http_cache_path, manifest_path = fixture_paths(
+            fixtures_dir, store.__name__)
+
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+        extra_args = {
+            'http_cache_mode': 'replay',
+            'http_cache_path': http_cache_path
+        }
+
+        results = {}
+
+        for category in manifest['categories']:
+            results[category] = store.discover_entries_for_category(
+                category, extra_args)
+
+        for url, category in manifest['urls']:
+            products = []
+            for product in store.products_for_url(url, category,
+                                                  extra_args):
+                serialized_product = product.serialize()
+                del serialized_product['timestamp']
+                products.append(serialized_product)
+            results[url] = products
+
+        return results
+    finally:
+        if previous_html_parser is None:
+            del os.environ['STORESCRAPER_HTML_PARSER']
+        else:
+            os.environ['STORESCRAPER_HTML_PARSER'] = previous_html_parser
+
+
+def main():
+    logging.basicConfig(level=logging.WARNING,
+                        format='%(asctime)s %(levelname)s %(message)s',
+                        filename='html_parser_equivalence.log',
+                        filemode='w')
+
+    parser = argparse.ArgumentParser(
+        description='Checks that the given stores extract the same URLs '
+                    'and products from their recorded fixtures with two '
+                    'HTML parsers for their make_soup and listing_soup '
+                    'soups, e.g. before switching a store to lxml.')
+
+    parser.add_argument('stores', type=str, nargs='*',
+                        default=DEFAULT_STORES,
+                        help='The names of the stores to check')
+
+    parser.add_argument('--fixtures_dir', type=str, nargs='?',
+                        default=cache_path('parse_benchmark'),
+                        help='Directory of the recorded responses (see '
+                             'parse_benchmark.py --record)')
+
+    parser.add_argument('--reference_parser', type=str, nargs='?',
+                        default='html.parser',
+                        help='Parser whose results are taken as correct')
+
+    parser.add_argument('--parser', type=str, nargs='?', default='lxml',
+                        help='Parser to check')
+
+    args = parser.parse_args()
+    different_stores = []
+
+    for store_name in args.stores:
+        store = get_store_class_by_name(store_name)
+        reference_results = scraping_results(store, args.fixtures_dir,
+                                             args.reference_parser)
+        results = scraping_results(store, args.fixtures_dir, args.parser)
+
+        different_keys = [key for key in reference_results
+                          if reference_results[key] != results[key]]
+
+        if different_keys:
+            different_stores.append(store_name)
+            print('{}: {} of {} pages differ'.format(
+                store_name, len(different_keys), len(reference_results)))
+            for key in different_keys:
+                print('  {}'.format(key))
+        else:
+            print('{}: OK'.format(store_name))
+
+    if different_stores:
+        print('The parsers disagree for: {}'.format(
+            ', '.join(different_stores)))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
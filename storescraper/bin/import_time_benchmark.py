@@ -0,0 +1,110 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+DEFAULT_MODULES = ['storescraper.store', 'storescraper.product']
+PROJECT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           '..', '..')
+
+
+def import_times(module_name):
+    # Imports the module in a new interpreter under "-X importtime" and
+    # returns {imported module: (self us, cumulative us)}
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c',
+         'import {}'.format(module_name)],
+        cwd=PROJECT_DIR, stderr=subprocess.PIPE, universal_newlines=True,
+        check=True)
+
+    times = {}
+
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '[us]' in line:
+            continue
+
+        self_time, cumulative_time, imported_module = \
+            line[len('import time:'):].split('|')
+        times[imported_module.strip()] = (int(self_time),
+                                          int(cumulative_time))
+
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Measures the time taken to import the given modules '
+                    'of storescraper (as reported by python -X '
+                    'importtime).')
+
+    parser.add_argument('modules', type=str, nargs='*',
+                        default=DEFAULT_MODULES,
+                        help='The modules to import')
+
+    parser.add_argument('--repetitions', type=int, nargs='?', default=5,
+                        help='Imports per module, the fastest one is '
+                             'reported')
+
+    parser.add_argument('--top', type=int, nargs='?', default=10,
+                        help='Number of slowest dependencies to show')
+
+    parser.add_argument('--baselines', type=str, nargs='?',
+                        default='import_time_baselines.json',
+                        help='JSON file with the baseline of each module')
+
+    parser.add_argument('--save_baselines', type=bool, nargs='?',
+                        default=False, const=True,
+                        help='Store the results as the new baselines')
+
+    parser.add_argument('--tolerance', type=float, nargs='?', default=0.25,
+                        help='Allowed slowdown over the baselines before '
+                             'failing')
+
+    args = parser.parse_args()
+
+    try:
+        with open(args.baselines) as f:
+            baselines = json.load(f)
+    except IOError:
+        baselines = {}
+
+    failed_modules = []
+
+    for module_name in args.modules:
+        runs = [import_times(module_name) for _ in range(args.repetitions)]
+        fastest_run = min(runs, key=lambda run: run[module_name][1])
+        import_time = fastest_run[module_name][1] / 1000
+
+        print('{}: {:.1f} ms ({} modules)'.format(
+            module_name, import_time, len(fastest_run)))
+
+        slowest_dependencies = sorted(
+            fastest_run.items(), key=lambda item: item[1][0],
+            reverse=True)[:args.top]
+
+        for dependency, (self_time, cumulative_time) in \
+                slowest_dependencies:
+            print('  {:<50} {:>10.1f} ms'.format(dependency,
+                                                 self_time / 1000))
+
+        baseline = baselines.get(module_name)
+        if baseline and not args.save_baselines and \
+                import_time > baseline * (1 + args.tolerance):
+            print('  Regression: {:.1f} ms > {:.1f} ms'.format(
+                import_time, baseline))
+            failed_modules.append(module_name)
+
+        baselines[module_name] = import_time
+
+    if args.save_baselines:
+        with open(args.baselines, 'w') as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+
+    if failed_modules:
+        print('Regressions found in: {}'.format(', '.join(failed_modules)))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+import argparse
+import json
+import logging
+import sys
+sys.path.append('../..')
+
+from storescraper.executors import EXECUTORS  # noqa
+from storescraper.orchestrator import MultiStoreScraper  # noqa
+
+
+def main():
+    logging.basicConfig(level=logging.INFO,
+                        format='%(asctime)s %(levelname)s %(message)s',
+                        filename='multi_store_products.log',
+                        filemode='w')
+
+    parser = argparse.ArgumentParser(
+        description='Retrieves the products of several stores at the same '
+                    'time, sharing a global concurrency budget.')
+
+    parser.add_argument('stores', type=str, nargs='+',
+                        help='The names of the stores to be parsed')
+
+    parser.add_argument('--categories', type=str, nargs='*',
+                        help='Specific categories to be parsed')
+
+    parser.add_argument('--concurrency', type=int, nargs='?', default=50,
+                        help='Maximum number of tasks running at the same '
+                             'time across all stores')
+
+    parser.add_argument('--executor', type=str, nargs='?', default='thread',
+                        choices=list(EXECUTORS.keys()),
+                        help='Executor to use')
+
+    parser.add_argument('--extra_args', type=json.loads, nargs='?', default={},
+                        help='Optional arguments to pass to the parser of '
+                             'each store, as {store_name: extra_args}')
+
+    args = parser.parse_args()
+
+    scraper = MultiStoreScraper(
+        args.stores,
+        categories=args.categories,
+        extra_args=args.extra_args,
+        concurrency=args.concurrency,
+        executor=args.executor,
+        product_batches=True)
+
+    for store_name, products_data, error in scraper.iter_results():
+        if error:
+            print('{}: Error\n{}'.format(store_name, error))
+            continue
+
+        products = products_data['products']
+        available_products = len([stock for stock in products.column('stock')
+                                  if stock != 0])
+        urls_with_error = products_data['discovery_urls_without_products']
+
+        print('{}: {} available, {} unavailable, {} with error'.format(
+            store_name, available_products,
+            len(products) - available_products, len(urls_with_error)))
+
+
+if __name__ == '__main__':
+    main()
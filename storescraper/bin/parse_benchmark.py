@@ -0,0 +1,214 @@
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+sys.path.append('../..')
+
+from storescraper.paths import cache_path  # noqa
+from storescraper.utils import get_store_class_by_name  # noqa
+
+DEFAULT_STORES = ['Falabella', 'Ripley', 'Paris', 'Hites', 'AbcDin']
+
+
+def fixture_paths(fixtures_dir, store_name):
+    # Each store has its recorded responses (see storescraper.http_cache)
+    # and a manifest with the categories and URLs to benchmark
+    return os.path.join(fixtures_dir, '{}.sqlite3'.format(store_name)), \
+        os.path.join(fixtures_dir, '{}.json'.format(store_name))
+
+
+def record_fixtures(store, fixtures_dir, categories, max_urls, extra_args):
+    http_cache_path, manifest_path = fixture_paths(
+        fixtures_dir, store.__name__)
+    extra_args = store._extra_args_with_preflight(extra_args)
+    extra_args.update({
+        'http_cache_mode': 'record',
+        'http_cache_path': http_cache_path
+    })
+
+    if not categories:
+        categories = store.categories()
+
+    manifest = {
+        'categories': [],
+        'urls': []
+    }
+
+    for category in categories:
+        print('Recording {} - {}'.format(store.__name__, category))
+        discovered_entries = store.discover_entries_for_category(
+            category, extra_args)
+        manifest['categories'].append(category)
+
+        for url in list(discovered_entries.keys())[:max_urls]:
+            store.products_for_url(url, category, extra_args)
+            manifest['urls'].append([url, category])
+
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+
+def replay_fixtures(store, fixtures_dir):
+    # Runs the scraping methods of the store against its recorded responses
+    # and returns the number of products found. Any request that was not
+    # recorded raises HttpCacheMissError
+    http_cache_path, manifest_path = fixture_paths(
+        fixtures_dir, store.__name__)
+
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+
+    extra_args = {
+        'http_cache_mode': 'replay',
+        'http_cache_path': http_cache_path
+    }
+
+    for category in manifest['categories']:
+        store.discover_entries_for_category(category, extra_args)
+
+    product_count = 0
+    for url, category in manifest['urls']:
+        product_count += len(store.products_for_url(url, category,
+                                                    extra_args))
+
+    return product_count
+
+
+def benchmark_store(store, fixtures_dir, repetitions):
+    # Best of "repetitions" runs for the time, and a separate run under
+    # tracemalloc (which slows everything down) for the allocations
+    times = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        product_count = replay_fixtures(store, fixtures_dir)
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        replay_fixtures(store, fixtures_dir)
+        current_memory, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    parse_time = min(times)
+
+    return {
+        'parse_time': parse_time,
+        'peak_memory_kb': peak_memory / 1024,
+        'products': product_count,
+        'products_per_second': product_count / parse_time
+        if parse_time else 0
+    }
+
+
+def regressions(result, baseline, tolerance):
+    # Metrics that got worse than the baseline by more than "tolerance"
+    # (e.g. 0.25 = 25%)
+    return ['{} {:.3f} > {:.3f}'.format(metric, result[metric],
+                                        baseline[metric])
+            for metric in ['parse_time', 'peak_memory_kb']
+            if result[metric] > baseline[metric] * (1 + tolerance)]
+
+
+def main():
+    logging.basicConfig(level=logging.WARNING,
+                        format='%(asctime)s %(levelname)s %(message)s',
+                        filename='parse_benchmark.log',
+                        filemode='w')
+
+    parser = argparse.ArgumentParser(
+        description='Measures the parsing time and memory of the given '
+                    'stores against recorded responses, without using the '
+                    'network.')
+
+    parser.add_argument('stores', type=str, nargs='*',
+                        default=DEFAULT_STORES,
+                        help='The names of the stores to benchmark')
+
+    parser.add_argument('--fixtures_dir', type=str, nargs='?',
+                        default=cache_path('parse_benchmark'),
+                        help='Directory of the recorded responses')
+
+    parser.add_argument('--record', type=bool, nargs='?', default=False,
+                        const=True,
+                        help='Record the fixtures of the stores from the '
+                             'live sites instead of benchmarking them')
+
+    parser.add_argument('--categories', type=str, nargs='*',
+                        help='Categories to record (default: all of them)')
+
+    parser.add_argument('--max_urls', type=int, nargs='?', default=20,
+                        help='Product URLs to record per category')
+
+    parser.add_argument('--extra_args', type=json.loads, nargs='?', default={},
+                        help='Optional arguments to pass to the parser '
+                             'while recording')
+
+    parser.add_argument('--repetitions', type=int, nargs='?', default=3,
+                        help='Runs per store, the fastest one is reported')
+
+    parser.add_argument('--baselines', type=str, nargs='?',
+                        default='parse_benchmark_baselines.json',
+                        help='JSON file with the baseline of each store')
+
+    parser.add_argument('--save_baselines', type=bool, nargs='?',
+                        default=False, const=True,
+                        help='Store the results as the new baselines')
+
+    parser.add_argument('--tolerance', type=float, nargs='?', default=0.25,
+                        help='Allowed slowdown over the baselines before '
+                             'failing')
+
+    args = parser.parse_args()
+    os.makedirs(args.fixtures_dir, exist_ok=True)
+
+    if args.record:
+        for store_name in args.stores:
+            record_fixtures(get_store_class_by_name(store_name),
+                            args.fixtures_dir, args.categories,
+                            args.max_urls, args.extra_args)
+        return
+
+    try:
+        with open(args.baselines) as f:
+            baselines = json.load(f)
+    except IOError:
+        baselines = {}
+
+    failed_stores = []
+
+    print('{:<20} {:>12} {:>12} {:>10} {:>14}'.format(
+        'Store', 'Time (s)', 'Peak (KB)', 'Products', 'Products/s'))
+
+    for store_name in args.stores:
+        store = get_store_class_by_name(store_name)
+        result = benchmark_store(store, args.fixtures_dir, args.repetitions)
+
+        print('{:<20} {:>12.3f} {:>12.1f} {:>10} {:>14.1f}'.format(
+            store_name, result['parse_time'], result['peak_memory_kb'],
+            result['products'], result['products_per_second']))
+
+        if store_name in baselines and not args.save_baselines:
+            store_regressions = regressions(result, baselines[store_name],
+                                            args.tolerance)
+            if store_regressions:
+                print('  Regression: {}'.format(
+                    ', '.join(store_regressions)))
+                failed_stores.append(store_name)
+
+        baselines[store_name] = result
+
+    if args.save_baselines:
+        with open(args.baselines, 'w') as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+
+    if failed_stores:
+        print('Regressions found in: {}'.format(', '.join(failed_stores)))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
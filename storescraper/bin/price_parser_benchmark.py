@@ -0,0 +1,94 @@
+import argparse
+import sys
+import timeit
+from decimal import Decimal, InvalidOperation
+sys.path.append('../..')
+
+from storescraper.currency import Currency, parse_number  # noqa
+from storescraper.utils import remove_words  # noqa
+
+# Price texts as found in the stores, with their currency and the price
+# they stand for
+SAMPLE_PRICES = [
+    ('$12.990', 'CLP', Decimal('12990')),
+    ('Precio internet: $ 1.299.990\n', 'CLP', Decimal('1299990')),
+    ('\n\t\t$\xa0349.990&nbsp;\t', 'CLP', Decimal('349990')),
+    ('CLP$ 89.990', 'CLP', Decimal('89990')),
+    ('$ 12.990,00', 'CLP', Decimal('12990')),
+    ('$ 54.999', 'ARS', Decimal('54999')),
+    ('R$ 1.234,56', 'BRL', Decimal('1234.56')),
+    ('$1,234.56', 'MXN', Decimal('1234.56')),
+    ('US$ 999.99', 'USD', Decimal('999.99')),
+    ('S/ 2,499.00', 'PEN', Decimal('2499')),
+]
+
+
+def remove_words_price(text, code):
+    # The parsing used by the stores before Currency.parse
+    return Decimal(remove_words(text))
+
+
+def check_sample_prices():
+    # Prints the sample prices that each implementation gets wrong
+    for parser in [remove_words_price, Currency.parse]:
+        for text, code, expected_price in SAMPLE_PRICES:
+            try:
+                price = parser(text, code)
+            except InvalidOperation:
+                price = None
+
+            if price != expected_price:
+                print('{}: {} ({}) is {}, not {}'.format(
+                    parser.__name__, repr(text), code, price,
+                    expected_price))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compares the speed of Currency.parse and '
+                    'Decimal(remove_words(...)) on sample CLP prices.')
+
+    parser.add_argument('--number', type=int, nargs='?', default=100000,
+                        help='Prices parsed per run')
+
+    parser.add_argument('--repetitions', type=int, nargs='?', default=5,
+                        help='Runs per implementation, the fastest one is '
+                             'reported')
+
+    args = parser.parse_args()
+
+    check_sample_prices()
+
+    # Only the texts that both implementations can parse
+    texts = []
+    for text, code, price in SAMPLE_PRICES:
+        try:
+            remove_words_price(text, code)
+        except InvalidOperation:
+            continue
+        if code == 'CLP':
+            texts.append(text)
+
+    batch_count = args.number // len(texts)
+
+    timers = [
+        ('Decimal(remove_words(text))',
+         lambda: [Decimal(remove_words(text)) for text in texts]),
+        ('Currency.parse(text, code)',
+         lambda: [Currency.parse(text, 'CLP') for text in texts]),
+        ('Currency.parse(text, code), uncached',
+         lambda: [(parse_number.cache_clear(), Currency.parse(text, 'CLP'))
+                  for text in texts]),
+        ('Currency.parse_many(texts, code)',
+         lambda: Currency.parse_many(texts, 'CLP')),
+    ]
+
+    for name, timer in timers:
+        elapsed = min(timeit.repeat(timer, number=batch_count,
+                                    repeat=args.repetitions))
+        print('{:<40} {:>10.0f} ns/price'.format(
+            name, elapsed / (batch_count * len(texts)) * 1e9))
+
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,7 @@ import logging
 import sys
 sys.path.append('../..')
 
+from storescraper.executors import EXECUTORS  # noqa
 from storescraper.utils import get_store_class_by_name  # noqa
 
 
@@ -26,6 +27,26 @@ def main():
                         const=True,
                         help='Use async tasks (celery)')
 
+    parser.add_argument('--with_threads', type=bool, nargs='?', default=False,
+                        const=True,
+                        help='Use a local thread pool (ignored if '
+                             '--with_async is given)')
+
+    parser.add_argument('--executor', type=str, nargs='?', default=None,
+                        choices=list(EXECUTORS.keys()),
+                        help='Executor to use (overrides --with_async and '
+                             '--with_threads)')
+
+    parser.add_argument('--pipelined', type=bool, nargs='?', default=False,
+                        const=True,
+                        help='Start retrieving products while the '
+                             'categories are still being discovered')
+
+    parser.add_argument('--adaptive_concurrency', type=bool, nargs='?',
+                        default=None, const=True,
+                        help='Adjust the products concurrency on the fly '
+                             'based on the latency and errors of the site')
+
     parser.add_argument('--extra_args', type=json.loads, nargs='?', default={},
                         help='Optional arguments to pass to the parser '
                              '(usually username/password) for private sites)')
@@ -36,19 +57,26 @@ def main():
     available_products = 0
     unavailable_products = 0
 
-    products_data = store.products(
-        categories=args.categories,
-        use_async=args.with_async,
-        extra_args=args.extra_args)
+    urls_with_error = []
+
+    for url, product in store.iter_products(
+            categories=args.categories,
+            use_async=args.with_async,
+            use_threads=args.with_threads,
+            executor=args.executor,
+            pipelined=args.pipelined,
+            adaptive_concurrency=args.adaptive_concurrency,
+            extra_args=args.extra_args):
+        if product is None:
+            urls_with_error.append(url)
+            continue
 
-    for product in products_data['products']:
         if product.is_available():
             available_products += 1
         else:
             unavailable_products += 1
         print(product, '\n')
 
-    urls_with_error = products_data['discovery_urls_without_products']
     print('Discovery URLs without products:')
     if not urls_with_error:
         print('* No empty URLs found')
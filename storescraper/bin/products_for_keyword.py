@@ -4,6 +4,7 @@ import logging
 import sys
 sys.path.append('../..')
 
+from storescraper.executors import EXECUTORS  # noqa
 from storescraper.utils import get_store_class_by_name  # noqa
 
 
@@ -29,6 +30,16 @@ def main():
                         const=True,
                         help='Use async tasks (celery)')
 
+    parser.add_argument('--with_threads', type=bool, nargs='?', default=False,
+                        const=True,
+                        help='Use a local thread pool (ignored if '
+                             '--with_async is given)')
+
+    parser.add_argument('--executor', type=str, nargs='?', default=None,
+                        choices=list(EXECUTORS.keys()),
+                        help='Executor to use (overrides --with_async and '
+                             '--with_threads)')
+
     parser.add_argument('--extra_args', type=json.loads, nargs='?', default={},
                         help='Optional arguments to pass to the parser '
                              '(usually username/password) for private sites)')
@@ -44,6 +55,8 @@ def main():
     products_data = store.products_for_keyword(
         keyword, threshold,
         use_async=args.with_async,
+        use_threads=args.with_threads,
+        executor=args.executor,
         extra_args=args.extra_args)
 
     for product in products_data['products']:
@@ -0,0 +1,81 @@
+import argparse
+import sys
+import time
+sys.path.append('../..')
+
+from kombu.serialization import dumps, loads, prepare_accept_content  # noqa
+
+from deserialize_benchmark import sample_serialized_products  # noqa
+from storescraper.serialization import PRODUCT_SERIALIZER, \
+    register_product_serializer  # noqa
+
+# Formatted with the index of each product, see sample_serialized_products
+SAMPLE_DESCRIPTION = '## Especificaciones del producto {0}\n\n' + '\n'.join(
+    '* Caracter\u00edstica {}: {}{{0}}'.format(i, 17 ** i) for i in range(40))
+
+
+def benchmark_serializer(serializer, value, repetitions):
+    # Returns the size of the message and the fastest encoding and decoding
+    # times of the value with the given kombu serializer
+    accept = prepare_accept_content([serializer])
+    encoding_times = []
+    decoding_times = []
+
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        content_type, content_encoding, data = dumps(value, serializer)
+        encoding_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        decoded_value = loads(data, content_type, content_encoding,
+                              accept=accept)
+        decoding_times.append(time.perf_counter() - start)
+
+    assert decoded_value == value
+
+    return len(data), min(encoding_times), min(decoding_times)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compares the size and speed of the "{}" serializer '
+                    'with Celery\'s JSON serializer on products_for_url and '
+                    'products_for_urls task results.'.format(
+                        PRODUCT_SERIALIZER))
+
+    parser.add_argument('--products', type=int, nargs='?', default=1000,
+                        help='Number of products of the products_for_urls '
+                             'result')
+
+    parser.add_argument('--repetitions', type=int, nargs='?', default=5,
+                        help='Runs per serializer, the fastest one is '
+                             'reported')
+
+    args = parser.parse_args()
+    register_product_serializer()
+
+    serialized_products = sample_serialized_products(
+        args.products, description=SAMPLE_DESCRIPTION)
+
+    results = [
+        ('products_for_url', serialized_products[:1]),
+        ('products_for_urls', {
+            'products': serialized_products,
+            'discovery_urls_without_products': []
+        })
+    ]
+
+    print('{:<20} {:<14} {:>12} {:>12} {:>12}'.format(
+        'Result', 'Serializer', 'Size (KB)', 'Encode (ms)', 'Decode (ms)'))
+
+    for result_name, value in results:
+        for serializer in ['json', PRODUCT_SERIALIZER]:
+            size, encoding_time, decoding_time = benchmark_serializer(
+                serializer, value, args.repetitions)
+            print('{:<20} {:<14} {:>12.1f} {:>12.2f} {:>12.2f}'.format(
+                result_name, serializer, size / 1024, encoding_time * 1000,
+                decoding_time * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+import contextvars
+import fcntl
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from .paths import cache_path
+
+LEARNED_CONCURRENCY_FILENAME = 'learned_concurrency.json'
+
+
+class ThrottlingCounter:
+    # Counts the 429 / 5xx responses received by the sessions of this
+    # process (see session_with_proxy) for each store, so the adaptive
+    # controllers can notice a site pushing back even if the store doesn't
+    # fail. Responses are attributed to the store method call running in
+    # the current thread / task (see "counting"), the ones received outside
+    # of such a call are ignored
+    def __init__(self):
+        self.counts = defaultdict(int)
+        self.lock = threading.Lock()
+        self.current_call = contextvars.ContextVar(
+            'storescraper_throttling_call', default=None)
+
+    @contextmanager
+    def counting(self, store_name, local=True):
+        # Attributes the throttled responses of the block to the store.
+        # Yields a dictionary whose "count" is the number of them. Calls
+        # running on behalf of another process (e.g. a Celery task) use
+        # local=False, as the count is reported back to that process (see
+        # throttling_report) instead of being added to the local one
+        call = {'store_name': store_name, 'local': local, 'count': 0}
+        token = self.current_call.set(call)
+
+        try:
+            yield call
+        finally:
+            self.current_call.reset(token)
+
+    def record_response(self, response, *args, **kwargs):
+        # Response hook of the requests sessions
+        self.record_status(response.status_code)
+
+    def record_status(self, status_code):
+        if status_code != 429 and status_code < 500:
+            return
+
+        call = self.current_call.get()
+
+        if call is None:
+            return
+
+        with self.lock:
+            call['count'] += 1
+            if call['local']:
+                self.counts[call['store_name']] += 1
+
+    def add(self, store_name, count):
+        with self.lock:
+            self.counts[store_name] += count
+
+    def count(self, store_name):
+        return self.counts[store_name]
+
+
+throttling_counter = ThrottlingCounter()
+
+
+def throttling_report(result, count):
+    # Result of a store method call made on behalf of another process, with
+    # the number of throttled responses that it received
+    return {
+        'result': result,
+        'throttled_responses': count
+    }
+
+
+def unpack_throttling_report(store_name, report):
+    # Adds the throttled responses of the report to the local counter and
+    # returns the result of the call
+    throttling_counter.add(store_name, report['throttled_responses'])
+    return report['result']
+
+
+def load_learned_concurrency(key):
+    try:
+        with open(cache_path(LEARNED_CONCURRENCY_FILENAME)) as f:
+            return json.load(f).get(key)
+    except (IOError, ValueError):
+        return None
+
+
+def save_learned_concurrency(key, value):
+    # Locked, so that concurrent runs of different stores don't lose each
+    # other's limits
+    path = cache_path(LEARNED_CONCURRENCY_FILENAME)
+
+    with open(path + '.lock', 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            try:
+                with open(path) as f:
+                    learned_concurrency = json.load(f)
+            except (IOError, ValueError):
+                learned_concurrency = {}
+
+            learned_concurrency[key] = value
+
+            temp_path = '{}.{}'.format(path, os.getpid())
+            with open(temp_path, 'w') as f:
+                json.dump(learned_concurrency, f, indent=2, sort_keys=True)
+            os.replace(temp_path, path)
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class AdaptiveConcurrency:
+    # AIMD (additive increase, multiplicative decrease) controller of the
+    # number of tasks running at the same time. The limit grows by one
+    # after each "limit" healthy tasks and is multiplied by
+    # "decrease_factor" when a task fails, takes more than
+    # "latency_tolerance" times the usual latency or a 429 / 5xx response is
+    # received for the store. "key" is the name of the store, under which
+    # the learned limit is remembered between runs (see "save")
+    def __init__(self, key, initial, minimum=1, maximum=50,
+                 decrease_factor=0.5, latency_tolerance=3.0):
+        self.key = key
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+
+        learned_limit = load_learned_concurrency(key)
+        if learned_limit is None:
+            learned_limit = initial
+        self.limit = self._clamp(learned_limit)
+        self.saved_limit = learned_limit
+
+        self.healthy_tasks = 0
+        self.usual_latency = None
+        self.last_decrease = 0
+        self.throttling_count = throttling_counter.count(key)
+
+    def record(self, latency, failed=False):
+        throttling_count = throttling_counter.count(self.key)
+        throttled = throttling_count > self.throttling_count
+        self.throttling_count = throttling_count
+
+        slow = self.usual_latency is not None and \
+            latency > self.latency_tolerance * self.usual_latency
+
+        if failed or throttled or slow:
+            self._decrease()
+            return
+
+        if self.usual_latency is None:
+            self.usual_latency = latency
+        else:
+            self.usual_latency = 0.9 * self.usual_latency + 0.1 * latency
+
+        self.healthy_tasks += 1
+        if self.healthy_tasks >= self.limit:
+            self._set_limit(self.limit + 1)
+
+    def _decrease(self):
+        # The tasks that were already running when the site started pushing
+        # back will probably fail too, so back off at most once per
+        # usual latency
+        now = time.time()
+        if now - self.last_decrease < (self.usual_latency or 0):
+            return
+
+        self.last_decrease = now
+        self._set_limit(int(self.limit * self.decrease_factor))
+
+    def _set_limit(self, limit):
+        self.healthy_tasks = 0
+        self.limit = self._clamp(limit)
+
+    def save(self):
+        # Called once the tasks of a run are finished, instead of on every
+        # change of the limit
+        if self.limit != self.saved_limit:
+            save_learned_concurrency(self.key, self.limit)
+            self.saved_limit = self.limit
+
+    def _clamp(self, limit):
+        return max(self.minimum, min(self.maximum, limit))
+
+
+def concurrency_limit(concurrency):
+    # Concurrency may be given as a number or an AdaptiveConcurrency
+    return getattr(concurrency, 'limit', concurrency)
+
+
+def max_concurrency(concurrency):
+    return getattr(concurrency, 'maximum', concurrency)
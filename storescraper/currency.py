@@ -1,4 +1,12 @@
-from .utils import format_currency
+import re
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+
+# A number of a text, with its digits optionally grouped by separators, e.g.
+# "1.234.567,89". Non breaking and thin spaces are only ever used as
+# thousands separators
+PRICE_NUMBER = r'[0-9]+(?:[.,\xa0\u202f][0-9]+)*'
+PRICE_NUMBER_REGEX = re.compile(PRICE_NUMBER)
 
 
 class Currency:
@@ -9,27 +17,143 @@ class Currency:
         self.decimal_separator = decimal_separator
         self.decimal_places = decimal_places
 
+        # Everything format_value needs is computed once per currency
+        self.quantized_precision = Decimal(10) ** -decimal_places
+        if (thousands_separador, decimal_separator) == (',', '.'):
+            self.separators_table = None
+        else:
+            self.separators_table = str.maketrans(
+                ',.', thousands_separador + decimal_separator)
+
+        # The number right after the symbol of the currency, e.g. "12.990"
+        # in "20% dcto $ 12.990"
+        self.price_regex = re.compile(
+            re.escape(prefix) + r'\s*(' + PRICE_NUMBER + ')')
+
     @classmethod
     def format(cls, value, code):
-        known_codes = {
-            'ARS': cls('$', '.', ',', 0),
-            'BRL': cls('R$', '.', ',', 2),
-            'CLP': cls('$', '.', ',', 0),
-            'COP': cls('$', '.', ',', 0),
-            'MXN': cls('$', '.', ',', 2),
-            'PEN': cls('S/', '.', ',', 2),
-            'USD': cls('$', ',', '.', 2),
-            'GTQ': cls('$', ',', '.', 2),
-            'HNL': cls('L.', ',', '.', 2),
-            'DOP': cls('$', ',', '.', 2),
-            'NIO': cls('C$', ',', '.', 2),
-            'CRC': cls('₡', ',', '.', 0),
-            'PYG': cls('₲', '.', ',', 0),
-            'UYU': cls('$', '.', ',', 0),
-        }
-
-        currency = known_codes[code]
-
-        return format_currency(
-            value, currency.prefix, currency.thousands_separator,
-            currency.decimal_separator, places=currency.decimal_places)
+        return CURRENCIES[code].format_value(value)
+
+    @classmethod
+    def format_many(cls, values, code):
+        # Formats e.g. the prices of every product of a report at once
+        format_value = CURRENCIES[code].format_value
+        return [format_value(value) for value in values]
+
+    def format_value(self, value):
+        # Same output as utils.format_currency (e.g. "$12.990" or
+        # "-R$1.234,50") but using the built in number formatting, and
+        # plain integers for the currencies without decimals
+        quantized_value = value.quantize(self.quantized_precision)
+
+        if self.decimal_places:
+            grouped_value = '{:,f}'.format(abs(quantized_value))
+        else:
+            grouped_value = '{:,}'.format(abs(int(quantized_value)))
+
+        if self.separators_table:
+            grouped_value = grouped_value.translate(self.separators_table)
+
+        if quantized_value.is_signed():
+            return '-' + self.prefix + grouped_value
+
+        return self.prefix + grouped_value
+
+    @classmethod
+    def parse(cls, text, code):
+        # Converts a price as displayed by a store (e.g. "Precio: $12.990"
+        # or "R$ 1.234,56") into a Decimal. The decimal separator of the
+        # number is inferred from the number itself when possible (e.g.
+        # "1,234.56" or "12,5") and from the separators of the currency
+        # otherwise (e.g. "1.234" is 1234 for CLP)
+        return CURRENCIES[code].parse_price(text)
+
+    @classmethod
+    def parse_many(cls, texts, code):
+        # Parses the prices of e.g. every product of a listing page at once
+        parse_price = CURRENCIES[code].parse_price
+        return [parse_price(text) for text in texts]
+
+    def parse_price(self, text):
+        # The price is the number that follows the symbol of the currency
+        # (e.g. 12990 in "20% dcto $12.990"). Texts without the symbol
+        # must have a single number (e.g. "1.234.567 ₲"), otherwise the
+        # price is ambiguous. Raises InvalidOperation if no price is found,
+        # like Decimal(remove_words(text)) did
+        match = self.price_regex.search(text)
+
+        if match:
+            number = match[1]
+        else:
+            numbers = PRICE_NUMBER_REGEX.findall(text)
+
+            if not numbers:
+                raise InvalidOperation('No price found in {}'.format(
+                    repr(text)))
+
+            if len(numbers) > 1:
+                raise InvalidOperation('Ambiguous price in {}'.format(
+                    repr(text)))
+
+            number = numbers[0]
+
+        return parse_number(number, self)
+
+
+# Stores show the same few prices over and over (e.g. "$9.990"), and
+# Decimals are immutable, so the parsed numbers are reused
+@lru_cache(maxsize=4096)
+def parse_number(number, currency):
+    # "number" is the group matched by PRICE_NUMBER_REGEX
+    if '\xa0' in number or '\u202f' in number:
+        number = number.replace('\xa0', '').replace('\u202f', '')
+
+    dot_index = number.rfind('.')
+    comma_index = number.rfind(',')
+
+    if dot_index == comma_index:
+        # Both are -1, e.g. "12990"
+        return Decimal(number)
+
+    if dot_index > comma_index:
+        separator, separator_index = '.', dot_index
+    else:
+        separator, separator_index = ',', comma_index
+
+    if dot_index != -1 and comma_index != -1:
+        # "1.234,56" or "1,234.56", the last one is the decimal separator
+        is_decimal = True
+    elif number.find(separator) != separator_index:
+        # "1.234.567"
+        is_decimal = False
+    elif len(number) - separator_index != 4:
+        # "12,5" or "1234.56"
+        is_decimal = True
+    else:
+        # "1.234" or "1,234" depend on the currency
+        is_decimal = currency.decimal_places and \
+            separator == currency.decimal_separator
+
+    if not is_decimal:
+        return Decimal(number.replace(separator, ''))
+
+    return Decimal(number[:separator_index].replace('.', '').replace(
+        ',', '') + '.' + number[separator_index + 1:])
+
+
+CURRENCIES = {
+    'ARS': Currency('$', '.', ',', 0),
+    'BRL': Currency('R$', '.', ',', 2),
+    'CLP': Currency('$', '.', ',', 0),
+    'COP': Currency('$', '.', ',', 0),
+    'MXN': Currency('$', '.', ',', 2),
+    'PEN': Currency('S/', '.', ',', 2),
+    'USD': Currency('$', ',', '.', 2),
+    'GTQ': Currency('$', ',', '.', 2),
+    'HNL': Currency('L.', ',', '.', 2),
+    'DOP': Currency('$', ',', '.', 2),
+    'NIO': Currency('C$', ',', '.', 2),
+    'CRC': Currency('₡', ',', '.', 0),
+    'PYG': Currency('₲', '.', ',', 0),
+    'UYU': Currency('$', '.', ',', 0),
+}
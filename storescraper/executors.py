@@ -0,0 +1,315 @@
+import asyncio
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, \
+    wait, FIRST_COMPLETED
+
+from celery.result import allow_join_result
+
+from .concurrency import AdaptiveConcurrency, concurrency_limit, \
+    max_concurrency, throttling_counter, throttling_report, \
+    unpack_throttling_report
+from .product import Product
+from .utils import get_store_class_by_name, close_shared_async_sessions
+
+
+def windowed_map(submit, wait_finished, args_iterable, concurrency,
+                 failed=None, budget=None):
+    # Keeps up to "concurrency" calls running at all times and submits the
+    # next one as soon as any of them finishes (instead of waiting for a
+    # whole chunk of calls and its slowest page). "args_iterable" is
+    # consumed lazily, only when a slot frees up. Yields (index, handle)
+    # pairs in completion order, "handle" being whatever "submit" returned.
+    # If concurrency is an AdaptiveConcurrency it is told the latency and
+    # outcome ("failed" callable) of each call and its limit is honored.
+    # "budget" is an optional semaphore shared with other maps (e.g. of
+    # other stores) that also bounds the number of running calls. The next
+    # args are taken before acquiring it, as producing them may depend on
+    # other maps (e.g. the discovery of the pipelined mode) that need it too
+    args_iterable = enumerate(args_iterable)
+    pending_handles = OrderedDict()
+    next_args = None
+
+    try:
+        while True:
+            while len(pending_handles) < concurrency_limit(concurrency):
+                if next_args is None:
+                    next_args = next(args_iterable, None)
+                    if next_args is None:
+                        break
+
+                # Only block waiting for the budget if none of our own calls
+                # is running, otherwise they could be the ones holding it
+                if budget is not None and \
+                        not budget.acquire(blocking=not pending_handles):
+                    break
+
+                idx, args = next_args
+                next_args = None
+
+                try:
+                    handle = submit(args)
+                except Exception:
+                    if budget is not None:
+                        budget.release()
+                    raise
+
+                pending_handles[handle] = idx, time.time()
+
+            if not pending_handles:
+                return
+
+            for handle in wait_finished(list(pending_handles.keys())):
+                idx, submitted_at = pending_handles.pop(handle)
+
+                if budget is not None:
+                    budget.release()
+
+                if isinstance(concurrency, AdaptiveConcurrency):
+                    concurrency.record(time.time() - submitted_at,
+                                       failed=bool(failed and failed(handle)))
+
+                yield idx, handle
+    finally:
+        if budget is not None:
+            for _ in pending_handles:
+                budget.release()
+
+        if isinstance(concurrency, AdaptiveConcurrency):
+            concurrency.save()
+
+
+def serialize_store_method_result(method_name, result):
+    if method_name == 'products_for_url':
+        return [product.serialize() for product in result]
+    return result
+
+
+def deserialize_store_method_result(method_name, result):
+    # The products were validated by the store that built them
+    if method_name == 'products_for_url':
+        return [Product.from_trusted_dict(serialized_product)
+                for serialized_product in result]
+    return result
+
+
+def call_local_store_method(store, method_name, *args):
+    # Store method call of the executors that run in this process, the
+    # throttled responses that it receives count for the store
+    with throttling_counter.counting(store.__name__):
+        return getattr(store, method_name)(*args)
+
+
+def call_store_method(store_class_name, method_name, *args):
+    # Entry point for the executors that run outside of this process, the
+    # store is referenced by name and the result returned serialized, along
+    # with the number of throttled responses (see throttling_report)
+    store = get_store_class_by_name(store_class_name)
+
+    with throttling_counter.counting(store_class_name, local=False) as call:
+        result = getattr(store, method_name)(*args)
+
+    return throttling_report(
+        serialize_store_method_result(method_name, result), call['count'])
+
+
+class Executor:
+    # Runs the scraping methods of a store ("discover_entries_for_category"
+    # and "products_for_url") for a list of arguments. Store takes care of
+    # merging the results, so every backend only has to implement "map"
+    name = None
+
+    def __init__(self, store, budget=None):
+        # budget: optional semaphore shared with other executors that
+        # bounds their total number of running calls
+        self.store = store
+        self.budget = budget
+
+    def map(self, method_name, args_iterable, concurrency):
+        # Calls store.method_name(*args) for each of the given args with at
+        # most "concurrency" calls running at the same time. Yields
+        # (index of the args, result) pairs in completion order
+        raise NotImplementedError('This method must be implemented by '
+                                  'subclasses of Executor')
+
+
+class SerialExecutor(Executor):
+    name = 'serial'
+
+    def map(self, method_name, args_iterable, concurrency):
+        for idx, args in enumerate(args_iterable):
+            if self.budget is None:
+                yield idx, call_local_store_method(self.store, method_name,
+                                                   *args)
+                continue
+
+            with self.budget:
+                result = call_local_store_method(self.store, method_name,
+                                                 *args)
+            yield idx, result
+
+
+class PoolExecutor(Executor):
+    pool_class = None
+
+    def map(self, method_name, args_iterable, concurrency):
+        with self.pool_class(
+                max_workers=max_concurrency(concurrency)) as pool:
+            def submit(args):
+                return self.submit(pool, method_name, args)
+
+            def wait_finished(futures):
+                return wait(futures, return_when=FIRST_COMPLETED).done
+
+            def failed(future):
+                return future.exception() is not None
+
+            for idx, future in windowed_map(submit, wait_finished,
+                                            args_iterable, concurrency,
+                                            failed, self.budget):
+                yield idx, self.result(method_name, future)
+
+    def submit(self, pool, method_name, args):
+        return pool.submit(call_local_store_method, self.store, method_name,
+                           *args)
+
+    def result(self, method_name, future):
+        return future.result()
+
+
+class ThreadExecutor(PoolExecutor):
+    # Most of the scraping is I/O bound, so a local thread pool gets
+    # close to the Celery throughput without a broker
+    name = 'thread'
+    pool_class = ThreadPoolExecutor
+
+
+class ProcessExecutor(PoolExecutor):
+    name = 'process'
+    pool_class = ProcessPoolExecutor
+
+    def submit(self, pool, method_name, args):
+        return pool.submit(call_store_method, self.store.__name__,
+                           method_name, *args)
+
+    def result(self, method_name, future):
+        result = unpack_throttling_report(self.store.__name__,
+                                          future.result())
+        return deserialize_store_method_result(method_name, result)
+
+
+class CeleryExecutor(Executor):
+    name = 'celery'
+    poll_interval = 0.1
+
+    def map(self, method_name, args_iterable, concurrency):
+        task = getattr(self.store, method_name + '_task')
+        task_results = {}
+
+        def submit(args):
+            signature = task.s(self.store.__name__, *args,
+                               report_throttling=True)
+            signature.set(
+                queue='storescraper'
+            )
+            return signature.apply_async()
+
+        def wait_finished(async_results):
+            finished_results = self.wait_finished(async_results)
+
+            # The throttled responses reported by the tasks are counted
+            # before windowed_map records them in the AdaptiveConcurrency
+            for async_result in finished_results:
+                # Prevents Celery error for running a task inside another
+                with allow_join_result():
+                    task_result = async_result.get(propagate=False)
+
+                if async_result.successful():
+                    task_results[async_result.id] = unpack_throttling_report(
+                        self.store.__name__, task_result)
+
+            return finished_results
+
+        # Failed tasks are not recorded as failures (no "failed" callable):
+        # a task only fails once its autoretries are exhausted, and its error
+        # then aborts the map, so the AdaptiveConcurrency is only lowered by
+        # the throttled responses and latency of the tasks
+        for idx, async_result in windowed_map(
+                submit, wait_finished, args_iterable, concurrency,
+                budget=self.budget):
+            if not async_result.successful():
+                async_result.maybe_throw()
+
+            yield idx, deserialize_store_method_result(
+                method_name, task_results.pop(async_result.id))
+
+    def wait_finished(self, async_results):
+        while True:
+            finished_results = [async_result
+                                for async_result in async_results
+                                if async_result.ready()]
+            if finished_results:
+                return finished_results
+            time.sleep(self.poll_interval)
+
+
+class AsyncioExecutor(Executor):
+    # Runs the "_async" versions of the store methods as coroutines on a
+    # single event loop, so stores with a native asyncio implementation can
+    # keep thousands of requests in flight. The loop is driven from "map"
+    # itself, so results are still yielded as soon as they are ready
+    name = 'asyncio'
+
+    def map(self, method_name, args_iterable, concurrency):
+        method = getattr(self.store, method_name + '_async')
+        loop = asyncio.new_event_loop()
+        # For the stores that fall back to their blocking implementation
+        fallback_pool = ThreadPoolExecutor(
+            max_workers=max_concurrency(concurrency))
+        loop.set_default_executor(fallback_pool)
+
+        async def call(args):
+            with throttling_counter.counting(self.store.__name__):
+                return await method(*args)
+
+        def submit(args):
+            return loop.create_task(call(args))
+
+        def wait_finished(tasks):
+            done, pending = loop.run_until_complete(
+                asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED))
+            return done
+
+        def failed(task):
+            return task.exception() is not None
+
+        try:
+            for idx, task in windowed_map(submit, wait_finished,
+                                          args_iterable, concurrency,
+                                          failed, self.budget):
+                yield idx, task.result()
+        finally:
+            loop.run_until_complete(self.cancel_pending_tasks())
+            loop.run_until_complete(close_shared_async_sessions())
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+            fallback_pool.shutdown()
+
+    @staticmethod
+    async def cancel_pending_tasks():
+        # Only relevant if the consumer of "map" stopped early
+        pending_tasks = [task for task in asyncio.all_tasks()
+                         if task is not asyncio.current_task()]
+        for task in pending_tasks:
+            task.cancel()
+        await asyncio.gather(*pending_tasks, return_exceptions=True)
+
+
+EXECUTORS = OrderedDict((executor_class.name, executor_class) for
+                        executor_class in [SerialExecutor, ThreadExecutor,
+                                           ProcessExecutor, CeleryExecutor,
+                                           AsyncioExecutor])
+
+
+def get_executor_class_by_name(executor_name):
+    return EXECUTORS[executor_name]
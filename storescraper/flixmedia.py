@@ -2,7 +2,8 @@ import json
 import re
 
 import requests
-from bs4 import BeautifulSoup
+
+from .utils import make_soup
 
 
 def flixmedia_video_urls(mpn):
@@ -24,7 +25,7 @@ def flixmedia_video_urls(mpn):
 
     url = 'https://media.flixcar.com/delivery/inpage/show/4800/cl/{}/html' \
           ''.format(product_id)
-    soup = BeautifulSoup(session.get(url).text, 'html.parser')
+    soup = make_soup(session.get(url).text)
 
     video_containers = soup.findAll('input', 'flix-jw')
     video_urls = []
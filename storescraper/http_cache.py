@@ -0,0 +1,247 @@
+import hashlib
+import http.client
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+from requests import Response
+from requests.adapters import HTTPAdapter
+from requests.cookies import extract_cookies_to_jar
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .paths import cache_path
+
+HTTP_CACHE_FILENAME = 'http_cache.sqlite3'
+
+# The body is stored already decoded, so these headers no longer apply
+SKIPPED_HEADERS = ['content-encoding', 'content-length', 'transfer-encoding']
+
+# Requests whose responses are stored in "cache" mode, and only if their
+# status code is below 400 (so e.g. a 500 or 429 isn't replayed for the
+# whole TTL)
+CACHEABLE_METHODS = ['GET', 'HEAD']
+
+
+class HttpCacheMissError(Exception):
+    pass
+
+
+class CachedRawResponse:
+    # Stands for the urllib3 response of a stored response, so that
+    # requests extracts its Set-Cookie headers into the cookies of the
+    # response and of the session, as it does for the network ones
+    def __init__(self, header_pairs):
+        self.msg = http.client.HTTPMessage()
+        for name, value in header_pairs:
+            self.msg[name] = value
+        # What extract_cookies_to_jar reads the headers from
+        self._original_response = self
+
+
+def response_header_pairs(response):
+    # (name, value) pairs of the headers to store. requests joins repeated
+    # headers with commas, which breaks Set-Cookie, so those are taken from
+    # the urllib3 response when possible
+    header_pairs = [(name, value) for name, value in response.headers.items()
+                    if name.lower() not in SKIPPED_HEADERS and
+                    name.lower() != 'set-cookie']
+
+    raw_headers = getattr(response.raw, 'headers', None)
+    if hasattr(raw_headers, 'getlist'):
+        set_cookies = raw_headers.getlist('Set-Cookie')
+    elif 'Set-Cookie' in response.headers:
+        set_cookies = [response.headers['Set-Cookie']]
+    else:
+        set_cookies = []
+
+    return header_pairs + [('Set-Cookie', set_cookie)
+                           for set_cookie in set_cookies]
+
+
+class HttpCache:
+    # Responses stored in a SQLite database (with zlib compressed bodies)
+    # shared by every session, thread and process using the same file
+    def __init__(self, path=None):
+        self.path = path or cache_path(HTTP_CACHE_FILENAME)
+        self.local = threading.local()
+
+        with self.connection() as connection:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                'key TEXT PRIMARY KEY, url TEXT, status_code INTEGER, '
+                'reason TEXT, headers TEXT, body BLOB, stored_at REAL)')
+
+    def connection(self):
+        # SQLite connections can't be shared between threads
+        if not hasattr(self.local, 'connection'):
+            self.local.connection = sqlite3.connect(self.path, timeout=30)
+        return self.local.connection
+
+    @staticmethod
+    def key(request):
+        body = request.body or b''
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+
+        request_hash = hashlib.sha1()
+        request_hash.update(request.method.encode('utf-8'))
+        request_hash.update(request.url.encode('utf-8'))
+        request_hash.update(body)
+        return request_hash.hexdigest()
+
+    def get(self, request, ttl=None):
+        # Returns the stored response for the request or None if there is
+        # none or it is older than "ttl" seconds
+        row = self.connection().execute(
+            'SELECT url, status_code, reason, headers, body, stored_at '
+            'FROM responses WHERE key = ?', (self.key(request),)).fetchone()
+
+        if row is None:
+            return None
+
+        url, status_code, reason, headers, body, stored_at = row
+
+        if ttl is not None and stored_at + ttl < time.time():
+            return None
+
+        # A list of (name, value) pairs, or a dictionary in the responses
+        # stored by older versions
+        header_pairs = json.loads(headers)
+        if isinstance(header_pairs, dict):
+            header_pairs = list(header_pairs.items())
+
+        response = Response()
+        response.url = url
+        response.status_code = status_code
+        response.reason = reason
+        response.headers = CaseInsensitiveDict()
+        for name, value in header_pairs:
+            if name in response.headers:
+                value = '{}, {}'.format(response.headers[name], value)
+            response.headers[name] = value
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = zlib.decompress(body)
+        response._content_consumed = True
+        response.raw = CachedRawResponse(header_pairs)
+        extract_cookies_to_jar(response.cookies, request, response.raw)
+        response.request = request
+        response.from_http_cache = True
+        return response
+
+    def store(self, request, response):
+        self.store_values(request, response.url, response.status_code,
+                          response.reason, response_header_pairs(response),
+                          response.content)
+
+    def store_values(self, request, url, status_code, reason, header_pairs,
+                     content):
+        # Same as store, for responses that don't come from requests (see
+        # AsyncSession)
+        with self.connection() as connection:
+            connection.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, '
+                '?)', (self.key(request), url, status_code, reason,
+                       json.dumps(header_pairs), zlib.compress(content),
+                       time.time()))
+
+
+class CachingAdapter(HTTPAdapter):
+    # Serves the requests of a session from an HttpCache. Modes:
+    # "cache": use the stored response if it is younger than "ttl" seconds
+    # (or of any age if ttl is None), otherwise fetch it and store it if the
+    # request is a GET / HEAD and it succeeded (status code below 400)
+    # "record": always fetch and store the response
+    # "replay": only use the stored responses, never hit the network
+    # Requests that reach the network are sent through "adapter" (e.g. a
+    # RateLimitedAdapter)
+    def __init__(self, http_cache, mode='cache', ttl=None, adapter=None,
+                 **kwargs):
+        if mode not in HTTP_CACHE_MODES:
+            raise ValueError('Invalid HTTP cache mode: {}'.format(mode))
+
+        self.http_cache = http_cache
+        self.mode = mode
+        self.ttl = ttl
+        self.adapter = adapter
+        super(CachingAdapter, self).__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        response = self.cached_response(request)
+
+        if response is not None:
+            response.connection = self
+            return response
+
+        if self.adapter:
+            response = self.adapter.send(request, **kwargs)
+        else:
+            response = super(CachingAdapter, self).send(request, **kwargs)
+
+        if self.stores_response(request, response.status_code):
+            self.http_cache.store(request, response)
+
+        return response
+
+    def cached_response(self, request):
+        # The stored response to use for the request according to the mode,
+        # or None if it must be fetched
+        cacheable = request.method in CACHEABLE_METHODS
+
+        if self.mode == 'replay' or (self.mode == 'cache' and cacheable):
+            ttl = None if self.mode == 'replay' else self.ttl
+            response = self.http_cache.get(request, ttl)
+
+            if response is not None:
+                return response
+
+            if self.mode == 'replay':
+                raise HttpCacheMissError('No stored response for {} {}'.format(
+                    request.method, request.url))
+
+        return None
+
+    def stores_response(self, request, status_code):
+        # Whether the fetched response of the request must be stored
+        return self.mode == 'record' or (
+            request.method in CACHEABLE_METHODS and status_code < 400)
+
+    def close(self):
+        if self.adapter:
+            self.adapter.close()
+        super(CachingAdapter, self).close()
+
+
+HTTP_CACHE_MODES = ['cache', 'record', 'replay']
+
+_http_caches = {}
+_http_caches_lock = threading.Lock()
+
+
+def get_caching_adapter(extra_args, adapter=None):
+    # Builds the CachingAdapter described by extra_args (if any):
+    # "http_cache_mode": "cache", "record" or "replay". Defaults to the
+    # STORESCRAPER_HTTP_CACHE environment variable, so scripts can replay
+    # a scraping without changing its extra_args
+    # "http_cache_ttl": freshness of the responses in "cache" mode
+    # "http_cache_path": database file, defaults to the one in the cache
+    # directory
+    extra_args = extra_args or {}
+    mode = extra_args.get('http_cache_mode',
+                          os.environ.get('STORESCRAPER_HTTP_CACHE'))
+
+    if not mode:
+        return None
+
+    path = extra_args.get('http_cache_path')
+
+    with _http_caches_lock:
+        if path not in _http_caches:
+            _http_caches[path] = HttpCache(path)
+        http_cache = _http_caches[path]
+
+    return CachingAdapter(http_cache, mode, extra_args.get('http_cache_ttl'),
+                          adapter)
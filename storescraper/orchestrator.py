@@ -0,0 +1,98 @@
+import logging
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+
+from .executors import get_executor_class_by_name
+from .product_batch import ProductBatch
+from .utils import get_store_class_by_name
+
+logger = logging.getLogger(__name__)
+
+
+class MultiStoreScraper:
+    # Scrapes several stores at the same time sharing a global budget of
+    # running tasks. Every store keeps its own window of tasks (so a slow
+    # store only holds the budget slots it is actually using) and their
+    # tasks are interleaved on the same executor backend
+    def __init__(self, store_names, categories=None, extra_args=None,
+                 concurrency=50, executor='thread',
+                 max_concurrent_stores=None, product_batches=False,
+                 **products_kwargs):
+        # store_names: names of the stores, as in get_store_class_by_name
+        # categories: optional list of categories, each store only scrapes
+        # the ones it supports
+        # extra_args: optional dict of {store_name: extra_args}
+        # concurrency: total number of tasks running at the same time
+        # product_batches: collect the products of each store into a
+        # ProductBatch instead of a list, which takes about half the memory
+        # but rebuilds the Product objects on each access
+        # products_kwargs: other arguments for each Store.products call
+        self.store_names = store_names
+        self.categories = categories
+        self.extra_args = extra_args or {}
+        self.executor_class = get_executor_class_by_name(executor)
+        self.budget = threading.BoundedSemaphore(concurrency)
+        self.max_concurrent_stores = max_concurrent_stores or \
+            len(store_names)
+        self.product_batches = product_batches
+        self.products_kwargs = products_kwargs
+
+    def iter_results(self):
+        # Yields (store_name, products_data, error) tuples as each store
+        # finishes, products_data being the result of Store.products or
+        # None if the store failed (with the traceback in "error")
+        if not self.store_names:
+            return
+
+        with ThreadPoolExecutor(
+                max_workers=self.max_concurrent_stores) as store_pool:
+            futures = {
+                store_pool.submit(self.store_products, store_name):
+                    store_name
+                for store_name in self.store_names
+            }
+
+            for future in as_completed(futures):
+                store_name = futures[future]
+
+                try:
+                    products_data = future.result()
+                except Exception:
+                    error = traceback.format_exc()
+                    logger.error('Error scraping {}: {}'.format(
+                        store_name, error))
+                    yield store_name, None, error
+                    continue
+
+                logger.info('Finished scraping {}'.format(store_name))
+                yield store_name, products_data, None
+
+    def store_products(self, store_name):
+        store = get_store_class_by_name(store_name)
+        logger.info('Scraping {}'.format(store_name))
+
+        kwargs = dict(
+            categories=self.categories,
+            extra_args=self.extra_args.get(store_name),
+            executor=partial(self.executor_class, budget=self.budget),
+            **self.products_kwargs)
+
+        if not self.product_batches:
+            return store.products(**kwargs)
+
+        # Same result as Store.products
+        products = ProductBatch()
+        discovery_urls_without_products = []
+
+        for entry_url, product in store.iter_products(**kwargs):
+            if product is None:
+                discovery_urls_without_products.append(entry_url)
+            else:
+                products.append(product)
+
+        return {
+            'products': products,
+            'discovery_urls_without_products': discovery_urls_without_products
+        }
@@ -0,0 +1,13 @@
+import os
+
+
+def cache_path(*paths):
+    # Path inside the directory where storescraper keeps the data it reuses
+    # between runs (learned concurrency, caches, etc). It can be changed
+    # with the STORESCRAPER_CACHE_DIR environment variable
+    cache_dir = os.environ.get(
+        'STORESCRAPER_CACHE_DIR',
+        os.path.join(os.path.expanduser('~'), '.cache', 'storescraper'))
+    path = os.path.join(cache_dir, *paths)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
@@ -0,0 +1,54 @@
+import hashlib
+import json
+import os
+import time
+
+from .paths import cache_path
+
+
+def preflight_cache_key(store_class_name, extra_args):
+    # The preflight result depends on the store and on the arguments used
+    # to obtain it (e.g. the proxy), so both are part of the key
+    serialized_args = json.dumps(extra_args or {}, sort_keys=True,
+                                 default=str)
+    return '{}-{}'.format(
+        store_class_name,
+        hashlib.sha1(serialized_args.encode('utf-8')).hexdigest())
+
+
+def _preflight_cache_path(key):
+    return cache_path('preflight', '{}.json'.format(key))
+
+
+def get_cached_preflight(key):
+    try:
+        with open(_preflight_cache_path(key)) as f:
+            cache_entry = json.load(f)
+    except (IOError, ValueError):
+        return None
+
+    if cache_entry['expires'] < time.time():
+        return None
+
+    return cache_entry['preflight_args']
+
+
+def cache_preflight(key, preflight_args, ttl):
+    # Written to a temporary file first so that the other workers never
+    # read a half written entry
+    path = _preflight_cache_path(key)
+    temp_path = '{}.{}'.format(path, os.getpid())
+
+    with open(temp_path, 'w') as f:
+        json.dump({
+            'expires': time.time() + ttl,
+            'preflight_args': preflight_args
+        }, f)
+    os.replace(temp_path, path)
+
+
+def invalidate_preflight(key):
+    try:
+        os.remove(_preflight_cache_path(key))
+    except FileNotFoundError:
+        pass
@@ -1,14 +1,26 @@
 import json
 from datetime import datetime
 from decimal import Decimal
-import dateutil.parser
-import validators
 
 import pytz
 
 from .utils import check_ean13
 from .currency import Currency
 
+# Imported by validate_url the first time a product has picture or video
+# URLs, validators is a hard dependency of Product but a slow import
+_validators = None
+
+
+def validate_url(url):
+    global _validators
+
+    if _validators is None:
+        import validators
+        _validators = validators
+
+    return _validators.url(url)
+
 
 class Product:
     VALID_CONDITIONS = [
@@ -18,6 +30,17 @@ class Product:
         'https://schema.org/UsedCondition',
     ]
 
+    # A full store run holds tens of thousands of products, __slots__
+    # saves the memory of an instance __dict__ for each of them
+    __slots__ = [
+        'name', 'store', 'category', 'url', 'discovery_url', 'key', 'stock',
+        'normal_price', 'offer_price', 'currency', 'part_number', 'sku',
+        'ean', 'description', 'cell_plan_name', 'cell_monthly_payment',
+        'picture_urls', 'video_urls', 'timestamp', 'condition', 'positions',
+        'review_count', 'review_avg_score', 'flixmedia_id',
+        'has_virtual_assistant', 'seller'
+    ]
+
     def __init__(self, name, store, category, url, discovery_url, key,
                  stock, normal_price, offer_price, currency, part_number=None,
                  sku=None, ean=None, description=None, cell_plan_name=None,
@@ -36,11 +59,11 @@ class Product:
 
         if picture_urls:
             for picture_url in picture_urls:
-                assert validators.url(picture_url), picture_url
+                assert validate_url(picture_url), picture_url
 
         if video_urls:
             for video_url in video_urls:
-                assert validators.url(video_url), video_url
+                assert validate_url(video_url), video_url
 
         if ean:
             assert check_ean13(ean), ean
@@ -203,10 +226,39 @@ class Product:
 
         serialized_data['cell_monthly_payment'] = cell_monthly_payment
 
+        import dateutil.parser
+
         serialized_data['timestamp'] = \
             dateutil.parser.parse(serialized_data['timestamp'])
         return cls(**serialized_data)
 
+    @classmethod
+    def from_trusted_dict(cls, serialized_data):
+        # Same as deserialize, but for data produced by serialize() on a
+        # product that was already validated when it was built (e.g. by a
+        # worker), so its fields are not checked again
+        product = cls.__new__(cls)
+
+        for field in cls.__slots__:
+            setattr(product, field, serialized_data.get(field))
+
+        product.normal_price = Decimal(serialized_data['normal_price'])
+        product.offer_price = Decimal(serialized_data['offer_price'])
+
+        if product.cell_monthly_payment:
+            product.cell_monthly_payment = \
+                Decimal(product.cell_monthly_payment)
+
+        # serialize() always uses isoformat(), so there is no need for the
+        # slower dateutil parser
+        product.timestamp = datetime.fromisoformat(
+            serialized_data['timestamp'])
+        product.condition = product.condition or \
+            'https://schema.org/NewCondition'
+        product.positions = product.positions or {}
+
+        return product
+
     def is_available(self):
         return self.stock != 0
 
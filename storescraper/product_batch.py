@@ -0,0 +1,250 @@
+from array import array
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytz
+
+from .product import Product
+
+EPOCH = datetime(1970, 1, 1, tzinfo=pytz.utc)
+ONE_MICROSECOND = timedelta(microseconds=1)
+
+# Bounds of the array('q') coefficients and array('b') exponents of the
+# prices
+MAX_PRICE_COEFFICIENT = 2 ** 63 - 1
+MIN_PRICE_EXPONENT = -128
+MAX_PRICE_EXPONENT = 127
+
+# Fields with a handful of distinct values in a run, stored as indexes into
+# a table of those values
+INTERNED_FIELDS = ['store', 'category', 'currency', 'condition']
+
+# Fields with a different value for almost every product
+STRING_FIELDS = ['name', 'url', 'key']
+
+PRICE_FIELDS = ['normal_price', 'offer_price']
+
+# Fields that most products don't have, only their values are stored as
+# {row: value}. The discovery URL is usually the URL of the product and
+# "positions" is usually empty, so those are only stored when they differ
+SPARSE_FIELDS = [
+    'discovery_url', 'part_number', 'sku', 'ean', 'description',
+    'cell_plan_name', 'cell_monthly_payment', 'picture_urls', 'video_urls',
+    'positions', 'review_count', 'review_avg_score', 'flixmedia_id',
+    'has_virtual_assistant', 'seller'
+]
+
+
+class ProductBatch:
+    # Column oriented container for the products of a scraping run, with
+    # the same iteration, len() and indexing as a list of Products. Prices,
+    # stocks and timestamps are kept in arrays of machine integers instead
+    # of one Python object per product, and the products are only built
+    # again when accessed. Reports and exports can read single fields of
+    # every product through column() or serialize() without building them
+    def __init__(self, products=None):
+        self.length = 0
+        self.interned_values = {field: [] for field in INTERNED_FIELDS}
+        self.interned_indexes = {field: {} for field in INTERNED_FIELDS}
+        self.interned_columns = {field: array('I')
+                                 for field in INTERNED_FIELDS}
+        self.string_columns = {field: [] for field in STRING_FIELDS}
+        # Prices as Decimal(coefficient).scaleb(exponent), e.g. "129.90" is
+        # 12990 and -2, which keeps their exact value and precision. The
+        # ones that don't fit (e.g. Decimal(1299099 / 100), built from a
+        # float) are kept as they are in {row: price} instead
+        self.price_coefficients = {field: array('q')
+                                   for field in PRICE_FIELDS}
+        self.price_exponents = {field: array('b') for field in PRICE_FIELDS}
+        self.unpacked_prices = {field: {} for field in PRICE_FIELDS}
+        self.stocks = array('q')
+        # Microseconds since the epoch, in UTC
+        self.timestamps = array('q')
+        self.sparse_columns = {field: {} for field in SPARSE_FIELDS}
+
+        if products:
+            self.extend(products)
+
+    def append(self, product):
+        row = self.length
+
+        for field in INTERNED_FIELDS:
+            value = getattr(product, field)
+            indexes = self.interned_indexes[field]
+            index = indexes.get(value)
+
+            if index is None:
+                index = len(self.interned_values[field])
+                self.interned_values[field].append(value)
+                indexes[value] = index
+
+            self.interned_columns[field].append(index)
+
+        for field in STRING_FIELDS:
+            self.string_columns[field].append(getattr(product, field))
+
+        for field in PRICE_FIELDS:
+            price = getattr(product, field)
+            coefficient, exponent = packed_price(price)
+
+            if coefficient is None:
+                self.unpacked_prices[field][row] = price
+                coefficient, exponent = 0, 0
+
+            self.price_coefficients[field].append(coefficient)
+            self.price_exponents[field].append(exponent)
+
+        self.stocks.append(product.stock)
+        self.timestamps.append(
+            (product.timestamp - EPOCH) // ONE_MICROSECOND)
+
+        for field in SPARSE_FIELDS:
+            value = getattr(product, field)
+
+            if field == 'discovery_url':
+                if value == product.url:
+                    continue
+            elif field == 'positions':
+                if not value:
+                    continue
+            elif value is None:
+                continue
+
+            self.sparse_columns[field][row] = value
+
+        self.length += 1
+
+    def extend(self, products):
+        for product in products:
+            self.append(product)
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        for row in range(self.length):
+            yield self.product(row)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.product(row)
+                    for row in range(*index.indices(self.length))]
+
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError('ProductBatch index out of range')
+
+        return self.product(index)
+
+    def column(self, field):
+        # The values of the given Product field for every product
+        if field in INTERNED_FIELDS:
+            values = self.interned_values[field]
+            return [values[index] for index in self.interned_columns[field]]
+
+        if field in STRING_FIELDS:
+            return list(self.string_columns[field])
+
+        if field in PRICE_FIELDS:
+            return [self.price(field, row) for row in range(self.length)]
+
+        if field == 'stock':
+            return list(self.stocks)
+
+        if field == 'timestamp':
+            return [EPOCH + timedelta(microseconds=timestamp)
+                    for timestamp in self.timestamps]
+
+        if field == 'discovery_url':
+            sparse_column = self.sparse_columns[field]
+            return [sparse_column.get(row, url) for row, url in
+                    enumerate(self.string_columns['url'])]
+
+        if field == 'positions':
+            sparse_column = self.sparse_columns[field]
+            return [sparse_column.get(row, {}) for row in range(self.length)]
+
+        if field in SPARSE_FIELDS:
+            sparse_column = self.sparse_columns[field]
+            return [sparse_column.get(row) for row in range(self.length)]
+
+        raise AttributeError('Invalid product field: {}'.format(field))
+
+    def price(self, field, row):
+        unpacked_price = self.unpacked_prices[field].get(row)
+
+        if unpacked_price is not None:
+            return unpacked_price
+
+        return Decimal(self.price_coefficients[field][row]).scaleb(
+            self.price_exponents[field][row])
+
+    def product(self, row):
+        # Builds the Product of the row without validating it again
+        product = Product.__new__(Product)
+
+        for field in INTERNED_FIELDS:
+            setattr(product, field, self.interned_values[field][
+                self.interned_columns[field][row]])
+
+        for field in STRING_FIELDS:
+            setattr(product, field, self.string_columns[field][row])
+
+        for field in PRICE_FIELDS:
+            setattr(product, field, self.price(field, row))
+
+        product.stock = self.stocks[row]
+        product.timestamp = EPOCH + timedelta(
+            microseconds=self.timestamps[row])
+
+        for field in SPARSE_FIELDS:
+            setattr(product, field, self.sparse_columns[field].get(row))
+
+        if product.discovery_url is None:
+            product.discovery_url = product.url
+        if product.positions is None:
+            product.positions = {}
+
+        return product
+
+    def serialize(self):
+        # Same as [product.serialize() for product in batch]
+        columns = {field: self.column(field) for field in Product.__slots__}
+        serialized_products = []
+
+        for row in range(self.length):
+            serialized_product = {field: columns[field][row]
+                                  for field in Product.__slots__}
+
+            for field in PRICE_FIELDS:
+                serialized_product[field] = str(serialized_product[field])
+
+            cell_monthly_payment = serialized_product['cell_monthly_payment']
+            if cell_monthly_payment is not None:
+                serialized_product['cell_monthly_payment'] = \
+                    str(cell_monthly_payment)
+
+            serialized_product['timestamp'] = \
+                serialized_product['timestamp'].isoformat()
+            serialized_products.append(serialized_product)
+
+        return serialized_products
+
+
+def packed_price(price):
+    # (coefficient, exponent) of the price as stored by ProductBatch, or
+    # (None, None) if it doesn't fit in the arrays (or is not finite)
+    sign, digits, exponent = price.as_tuple()
+
+    if not isinstance(exponent, int) or \
+            not MIN_PRICE_EXPONENT <= exponent <= MAX_PRICE_EXPONENT:
+        return None, None
+
+    coefficient = int(''.join(map(str, digits)) or '0')
+
+    # -0 would come back as 0
+    if coefficient > MAX_PRICE_COEFFICIENT or (sign and not coefficient):
+        return None, None
+
+    return -coefficient if sign else coefficient, exponent
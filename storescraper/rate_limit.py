@@ -0,0 +1,158 @@
+import asyncio
+import fcntl
+import os
+import tempfile
+import threading
+import time
+from urllib.parse import urlparse
+
+from requests.adapters import HTTPAdapter
+
+
+class LocalRateLimitBackend:
+    # Token buckets kept in memory, shared by all the sessions (and threads)
+    # of the current process
+    def __init__(self):
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def reserve(self, host, rate, burst):
+        with self.lock:
+            tokens, last_refill = self.buckets.get(host, (burst, None))
+            tokens, now = refill_bucket(tokens, last_refill, rate, burst)
+            self.buckets[host] = (tokens - 1, now)
+
+        return wait_for_token(tokens, rate)
+
+
+class FileRateLimitBackend:
+    # Token buckets kept in one file per host, guarded by a file lock, so
+    # they are shared by every process (e.g. Celery workers) of the machine
+    def __init__(self, directory=None):
+        if directory is None:
+            directory = os.path.join(tempfile.gettempdir(),
+                                     'storescraper_rate_limits')
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+
+    def reserve(self, host, rate, burst):
+        bucket_path = os.path.join(self.directory, host)
+
+        with open(bucket_path, 'a+') as bucket_file:
+            fcntl.flock(bucket_file, fcntl.LOCK_EX)
+            try:
+                bucket_file.seek(0)
+                contents = bucket_file.read().split()
+
+                if contents:
+                    tokens, last_refill = float(contents[0]), \
+                        float(contents[1])
+                else:
+                    tokens, last_refill = burst, None
+
+                tokens, now = refill_bucket(tokens, last_refill, rate, burst)
+
+                bucket_file.seek(0)
+                bucket_file.truncate()
+                bucket_file.write('{} {}'.format(tokens - 1, now))
+                bucket_file.flush()
+            finally:
+                fcntl.flock(bucket_file, fcntl.LOCK_UN)
+
+        return wait_for_token(tokens, rate)
+
+
+def refill_bucket(tokens, last_refill, rate, burst):
+    now = time.time()
+    if last_refill is not None:
+        tokens = min(burst, tokens + (now - last_refill) * rate)
+    return tokens, now
+
+
+def wait_for_token(tokens, rate):
+    # The token is always taken (the bucket may go negative), so concurrent
+    # callers queue up behind each other instead of racing for it
+    if tokens >= 1:
+        return 0
+    return (1 - tokens) / rate
+
+
+class RateLimiter:
+    # Limits the requests per second made to each host. "rates" maps host
+    # names to requests per second, with the optional "*" entry applying to
+    # any other host. Hosts without a rate are not limited
+    def __init__(self, rates, backend):
+        self.rates = rates
+        self.backend = backend
+
+    def rate_for_host(self, host):
+        return self.rates.get(host, self.rates.get('*'))
+
+    def reserve(self, url):
+        # Takes a token for the host of the URL, returns the seconds to wait
+        # before sending the request
+        host = urlparse(url).hostname
+        rate = self.rate_for_host(host)
+
+        if not rate:
+            return 0
+
+        return self.backend.reserve(host, rate, burst=max(1, rate))
+
+    def acquire(self, url):
+        wait_time = self.reserve(url)
+
+        if wait_time:
+            time.sleep(wait_time)
+
+    async def acquire_async(self, url):
+        # Same as acquire, without blocking the event loop (see AsyncSession)
+        wait_time = self.reserve(url)
+
+        if wait_time:
+            await asyncio.sleep(wait_time)
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    def __init__(self, rate_limiter, **kwargs):
+        self.rate_limiter = rate_limiter
+        super(RateLimitedAdapter, self).__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        self.rate_limiter.acquire(request.url)
+        return super(RateLimitedAdapter, self).send(request, **kwargs)
+
+
+RATE_LIMIT_BACKENDS = {
+    'local': LocalRateLimitBackend,
+    'file': FileRateLimitBackend,
+}
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+def get_rate_limiter(extra_args):
+    # Builds the rate limiter described by extra_args (if any):
+    # "rate_limits": {host: requests per second} (required)
+    # "rate_limit_backend": "local" (default) or "file" to share the limits
+    # between processes
+    # "rate_limit_dir": directory of the "file" backend
+    if not extra_args or not extra_args.get('rate_limits'):
+        return None
+
+    backend_name = extra_args.get('rate_limit_backend', 'local')
+    backend_args = ()
+    if backend_name == 'file':
+        backend_args = (extra_args.get('rate_limit_dir'),)
+
+    # The backends keep the token buckets, so they are reused by every
+    # session of the process
+    with _backends_lock:
+        backend_key = (backend_name,) + backend_args
+        if backend_key not in _backends:
+            _backends[backend_key] = \
+                RATE_LIMIT_BACKENDS[backend_name](*backend_args)
+        backend = _backends[backend_key]
+
+    return RateLimiter(extra_args['rate_limits'], backend)
@@ -1,16 +1,37 @@
+import asyncio
+import contextvars
+import queue
+import threading
 import traceback
 from collections import defaultdict, OrderedDict
 
-from celery import shared_task, group
-from celery.result import allow_join_result
+from celery import shared_task, group, chord
 from celery.utils.log import get_task_logger
 
 
-from .product import Product
-from .utils import get_store_class_by_name, chunks
+from .concurrency import AdaptiveConcurrency, max_concurrency, \
+    throttling_counter, throttling_report
+from .executors import get_executor_class_by_name
+from .preflight_cache import preflight_cache_key, get_cached_preflight, \
+    cache_preflight, invalidate_preflight
+from .serialization import register_product_serializer
+from .utils import get_store_class_by_name, InvalidSessionCookieException
 
 logger = get_task_logger(__name__)
 
+# The workers and the clients of the tasks below both import this module
+register_product_serializer()
+
+
+# Store attributes that limit the number of requests made to its site at
+# the same time
+CONCURRENCY_LIMIT_ATTRIBUTES = [
+    'preferred_discover_urls_concurrency',
+    'preferred_products_for_url_concurrency',
+    'prefer_adaptive_concurrency',
+    'max_products_for_url_concurrency'
+]
+
 
 class StoreScrapError(Exception):
     def __init__(self, message):
@@ -21,6 +42,20 @@ class Store:
     preferred_discover_urls_concurrency = 3
     preferred_products_for_url_concurrency = 10
     prefer_async = True
+    # Only used if use_async is False, runs the scraping methods on a local
+    # thread pool instead of serially
+    prefer_threads = False
+    # Start retrieving the products of each URL as soon as it is discovered
+    # instead of waiting for the discovery of every category
+    prefer_pipelined = False
+    # Tune products_for_url_concurrency on the fly (see
+    # storescraper.concurrency.AdaptiveConcurrency) up to the given maximum
+    prefer_adaptive_concurrency = False
+    max_products_for_url_concurrency = 50
+    # Seconds during which the result of preflight is reused by other
+    # scrapings (and processes) of the store with the same extra_args, None
+    # to run preflight every time
+    preflight_cache_ttl = None
 
     ##########################################################################
     # API methods
@@ -29,53 +64,96 @@ class Store:
     @classmethod
     def products(cls, categories=None, extra_args=None,
                  discover_urls_concurrency=None,
-                 products_for_url_concurrency=None, use_async=None):
+                 products_for_url_concurrency=None, use_async=None,
+                 use_threads=None, executor=None, pipelined=None,
+                 adaptive_concurrency=None):
+        return cls._collect_products(cls.iter_products(
+            categories=categories,
+            extra_args=extra_args,
+            discover_urls_concurrency=discover_urls_concurrency,
+            products_for_url_concurrency=products_for_url_concurrency,
+            use_async=use_async,
+            use_threads=use_threads,
+            executor=executor,
+            pipelined=pipelined,
+            adaptive_concurrency=adaptive_concurrency
+        ))
+
+    @classmethod
+    def iter_products(cls, categories=None, extra_args=None,
+                      discover_urls_concurrency=None,
+                      products_for_url_concurrency=None, use_async=None,
+                      use_threads=None, executor=None, pipelined=None,
+                      adaptive_concurrency=None):
+        # Generator version of "products". Yields (discovery_url, product)
+        # pairs as soon as each URL is retrieved, with product = None for
+        # the discovery URLs that didn't return any products
+
         sanitized_parameters = cls.sanitize_parameters(
             categories=categories,
             discover_urls_concurrency=discover_urls_concurrency,
             products_for_url_concurrency=products_for_url_concurrency,
-            use_async=use_async)
+            use_async=use_async,
+            use_threads=use_threads,
+            executor=executor,
+            pipelined=pipelined,
+            adaptive_concurrency=adaptive_concurrency)
 
         categories = sanitized_parameters['categories']
         discover_urls_concurrency = \
             sanitized_parameters['discover_urls_concurrency']
         products_for_url_concurrency = \
             sanitized_parameters['products_for_url_concurrency']
-        use_async = sanitized_parameters['use_async']
+        executor = sanitized_parameters['executor']
+        pipelined = sanitized_parameters['pipelined']
 
         logger.info('Obtaining products from: {}'.format(cls.__name__))
         logger.info('Categories: {}'.format(', '.join(categories)))
 
-        extra_args = cls._extra_args_with_preflight(extra_args)
+        extra_args = cls._extra_args_with_http_pool(
+            cls._extra_args_with_preflight(extra_args),
+            discover_urls_concurrency, products_for_url_concurrency)
+
+        if pipelined:
+            yield from cls._iter_products_pipelined(
+                categories, extra_args, discover_urls_concurrency,
+                products_for_url_concurrency, executor)
+            return
 
         discovered_entries = cls.discover_entries_for_categories(
             categories=categories,
             extra_args=extra_args,
             discover_urls_concurrency=discover_urls_concurrency,
-            use_async=use_async
+            executor=executor
         )
 
-        return cls.products_for_urls(
+        yield from cls.iter_products_for_urls(
             discovered_entries,
             extra_args=extra_args,
             products_for_url_concurrency=products_for_url_concurrency,
-            use_async=use_async
+            executor=executor
         )
 
     @classmethod
     def products_for_keyword(cls, keyword, threshold, extra_args=None,
                              products_for_url_concurrency=None,
-                             use_async=None):
+                             use_async=None, use_threads=None,
+                             executor=None, adaptive_concurrency=None):
 
         sanitized_parameters = cls.sanitize_parameters(
             products_for_url_concurrency=products_for_url_concurrency,
-            use_async=use_async)
+            use_async=use_async,
+            use_threads=use_threads,
+            executor=executor,
+            adaptive_concurrency=adaptive_concurrency)
 
         products_for_url_concurrency = \
             sanitized_parameters['products_for_url_concurrency']
-        use_async = sanitized_parameters['use_async']
+        executor = sanitized_parameters['executor']
 
-        extra_args = cls._extra_args_with_preflight(extra_args)
+        extra_args = cls._extra_args_with_http_pool(
+            cls._extra_args_with_preflight(extra_args),
+            products_for_url_concurrency)
 
         product_urls = cls.discover_urls_for_keyword(
             keyword,
@@ -94,125 +172,87 @@ class Store:
             product_entries,
             extra_args=extra_args,
             products_for_url_concurrency=products_for_url_concurrency,
-            use_async=use_async
+            executor=executor
         )
 
     @classmethod
     def discover_entries_for_categories(cls, categories=None,
                                         extra_args=None,
                                         discover_urls_concurrency=None,
-                                        use_async=True):
+                                        use_async=True, use_threads=None,
+                                        executor=None):
         sanitized_parameters = cls.sanitize_parameters(
             categories=categories,
             discover_urls_concurrency=discover_urls_concurrency,
-            use_async=use_async)
+            use_async=use_async,
+            use_threads=use_threads,
+            executor=executor)
 
         categories = sanitized_parameters['categories']
         discover_urls_concurrency = \
             sanitized_parameters['discover_urls_concurrency']
-        use_async = sanitized_parameters['use_async']
+        executor = sanitized_parameters['executor']
 
         logger.info('Discovering URLs for: {}'.format(cls.__name__))
 
-        entry_positions = defaultdict(lambda: {})
-        url_category_weights = defaultdict(lambda: defaultdict(lambda: 0))
-        extra_args = cls._extra_args_with_preflight(extra_args)
-
-        if use_async:
-            category_chunks = chunks(categories, discover_urls_concurrency)
-
-            for category_chunk in category_chunks:
-                chunk_tasks = []
+        extra_args = cls._extra_args_with_http_pool(
+            cls._extra_args_with_preflight(extra_args),
+            discover_urls_concurrency)
 
-                logger.info('Discovering URLs for: {}'.format(
-                    category_chunk))
+        executor = cls._executor(executor)
+        logger.info('Using {} executor'.format(executor.name))
+        logger.info('Discovering URLs for: {}'.format(categories))
 
-                for category in category_chunk:
-                    task = cls.discover_entries_for_category_task.s(
-                        cls.__name__, category, extra_args)
-                    task.set(
-                        queue='storescraper'
-                    )
-                    chunk_tasks.append(task)
-                tasks_group = cls.create_celery_group(chunk_tasks)
+        task_results = [None] * len(categories)
+        for idx, task_result in cls._map(
+                executor, 'discover_entries_for_category',
+                [(category, extra_args) for category in categories],
+                discover_urls_concurrency, extra_args):
+            logger.info('Discovered URLs for {}:'.format(categories[idx]))
+            for url, positions in task_result.items():
+                logger.info(url)
+                logger.info(positions)
+            task_results[idx] = task_result
 
-                # Prevents Celery error for running a task inside another
-                with allow_join_result():
-                    task_results = tasks_group.get()
-
-                for idx, task_result in enumerate(task_results):
-                    category = category_chunk[idx]
-                    logger.info('Discovered URLs for {}:'.format(category))
-                    for url, positions in task_result.items():
-                        logger.info(url)
-                        logger.info(positions)
-
-                        if positions:
-                            for pos in positions:
-                                if pos['section_name'] not in \
-                                        entry_positions[url]:
-                                    entry_positions[url][pos['section_name']]\
-                                        = pos['value']
-                                url_category_weights[url][category] += \
-                                    pos['category_weight']
-                        else:
-                            # Legacy for implementations without position data
-                            url_category_weights[url][category] = 1
-                            entry_positions[url] = {}
-        else:
-            logger.info('Using sync method')
-            for category in categories:
-                for url, positions in cls.discover_entries_for_category(
-                        category, extra_args).items():
-                    logger.info('Discovered URL: {} ({})'.format(
-                        url, category))
-
-                    if positions:
-                        for pos in positions:
-                            if pos['section_name'] not in \
-                                    entry_positions[url]:
-                                entry_positions[url][
-                                    pos['section_name']] = pos['value']
-
-                            url_category_weights[url][category] += \
-                                pos['category_weight']
-                    else:
-                        # Legacy for implementations without position data
-                        url_category_weights[url][category] = 1
-                        entry_positions[url] = {}
-
-        discovered_entries = {}
-        for url, positions in entry_positions.items():
-            category, max_weight = max(url_category_weights[url].items(),
-                                       key=lambda x: x[1],)
-
-            # Only include the url in the discovery set if it appears in a
-            # weighted section, for example generic "Electrodomésticos"
-            # section have 0 weight, but specific sections
-            # (e.g. "Refrigeradores") have positive values. This allows us to
-            # map generic sections positioning without considering their
-            # products if they don't appear in a specifically mapped
-            # relevant section
-            if max_weight:
-                discovered_entries[url] = {
-                    'positions': positions,
-                    'category': category,
-                    'category_weight': max_weight
-                }
+        discovered_entries = cls._merge_discovery_results(
+            categories, task_results)
 
         return discovered_entries
 
     @classmethod
     def products_for_urls(cls, discovered_entries, extra_args=None,
                           products_for_url_concurrency=None,
-                          use_async=True):
+                          use_async=True, use_threads=None,
+                          executor=None, adaptive_concurrency=None):
+        return cls._collect_products(cls.iter_products_for_urls(
+            discovered_entries,
+            extra_args=extra_args,
+            products_for_url_concurrency=products_for_url_concurrency,
+            use_async=use_async,
+            use_threads=use_threads,
+            executor=executor,
+            adaptive_concurrency=adaptive_concurrency
+        ))
+
+    @classmethod
+    def iter_products_for_urls(cls, discovered_entries, extra_args=None,
+                               products_for_url_concurrency=None,
+                               use_async=True, use_threads=None,
+                               executor=None, adaptive_concurrency=None):
+        # Generator version of "products_for_urls". Yields
+        # (discovery_url, product) pairs in completion order, with
+        # product = None for the discovery URLs without products
+
         sanitized_parameters = cls.sanitize_parameters(
             products_for_url_concurrency=products_for_url_concurrency,
-            use_async=use_async)
+            use_async=use_async,
+            use_threads=use_threads,
+            executor=executor,
+            adaptive_concurrency=adaptive_concurrency)
 
         products_for_url_concurrency = \
             sanitized_parameters['products_for_url_concurrency']
-        use_async = sanitized_parameters['use_async']
+        executor = sanitized_parameters['executor']
 
         logger.info('Retrieving products for: {}'.format(cls.__name__))
         logger.info(discovered_entries)
@@ -220,89 +260,62 @@ class Store:
         for url, entry_metadata in discovered_entries.items():
             logger.info('{} ({})'.format(url, entry_metadata['category']))
 
-        products = []
-        discovery_urls_without_products = []
-        extra_args = cls._extra_args_with_preflight(extra_args)
-
-        if use_async:
-            discovery_entries_chunks = chunks(
-                list(discovered_entries.items()), products_for_url_concurrency)
-
-            task_counter = 1
-            for discovery_entries_chunk in discovery_entries_chunks:
-                chunk_tasks = []
-
-                for entry_url, entry_metadata in discovery_entries_chunk:
-                    logger.info('Retrieving URL ({} / {}): {}'.format(
-                        task_counter, len(discovered_entries),
-                        entry_url))
-                    task = cls.products_for_url_task.s(
-                        cls.__name__, entry_url,
-                        entry_metadata['category'], extra_args)
-                    task.set(
-                        queue='storescraper'
-                    )
-                    chunk_tasks.append(task)
-                    task_counter += 1
-
-                tasks_group = cls.create_celery_group(chunk_tasks)
-
-                # Prevents Celery error for running a task inside another
-                with allow_join_result():
-                    task_results = tasks_group.get()
-
-                for idx, task_result in enumerate(task_results):
-                    for serialized_product in task_result:
-                        product = Product.deserialize(serialized_product)
-                        if not product.positions:
-                            product.positions = \
-                                discovery_entries_chunk[idx][1]['positions']
-
-                        logger.info('{}\n'.format(product))
-                        products.append(product)
-
-                    if not task_result:
-                        discovery_urls_without_products.append(
-                            discovery_entries_chunk[idx][0])
-        else:
-            logger.info('Using sync method')
-            for entry_url, entry_metadata in discovered_entries.items():
-                retrieved_products = cls.products_for_url(
-                    entry_url,
-                    entry_metadata['category'],
-                    extra_args)
-
-                for product in retrieved_products:
-                    if not product.positions:
-                        product.positions = entry_metadata['positions']
-                    logger.info('{}\n'.format(product))
-                    products.append(product)
-
-                if not retrieved_products:
-                    discovery_urls_without_products.append(entry_url)
+        extra_args = cls._extra_args_with_http_pool(
+            cls._extra_args_with_preflight(extra_args),
+            products_for_url_concurrency)
 
-        return {
-            'products': products,
-            'discovery_urls_without_products': discovery_urls_without_products
-        }
+        executor = cls._executor(executor)
+        logger.info('Using {} executor'.format(executor.name))
+
+        discovery_entries = list(discovered_entries.items())
+
+        def executor_args():
+            for task_counter, (entry_url, entry_metadata) in enumerate(
+                    discovery_entries, 1):
+                logger.info('Retrieving URL ({} / {}): {}'.format(
+                    task_counter, len(discovery_entries), entry_url))
+                yield entry_url, entry_metadata['category'], extra_args
+
+        for idx, retrieved_products in cls._map(
+                executor, 'products_for_url', executor_args(),
+                products_for_url_concurrency, extra_args):
+            entry_url, entry_metadata = discovery_entries[idx]
+            yield from cls._entry_products(entry_url, entry_metadata,
+                                           retrieved_products)
 
     ##########################################################################
     # Celery tasks wrappers
     ##########################################################################
 
     @staticmethod
-    @shared_task(autoretry_for=(StoreScrapError,),
+    @shared_task(bind=True,
+                 autoretry_for=(StoreScrapError,),
                  max_retries=5,
                  default_retry_delay=5)
-    def discover_entries_for_category_task(store_class_name, category,
-                                           extra_args=None):
+    def discover_entries_for_category_task(self, store_class_name, category,
+                                           extra_args=None,
+                                           report_throttling=False):
+        # report_throttling: return the result with the number of 429 / 5xx
+        # responses received (see throttling_report), used by the Celery
+        # executor to adapt the concurrency of the store
         store = get_store_class_by_name(store_class_name)
         logger.info('Discovering URLs')
         logger.info('Store: ' + store.__name__)
         logger.info('Category: ' + category)
         try:
-            discovered_entries = store.discover_entries_for_category(
-                category, extra_args)
+            with throttling_counter.counting(store_class_name,
+                                             local=False) as call:
+                discovered_entries = store.discover_entries_for_category(
+                    category, extra_args)
+        except InvalidSessionCookieException as e:
+            # Retried with a new preflight, the rejected session is part of
+            # extra_args
+            raise self.retry(
+                exc=e, args=(store_class_name, category),
+                kwargs={
+                    'extra_args': store._refreshed_preflight_args(
+                        extra_args),
+                    'report_throttling': report_throttling})
         except Exception:
             error_message = 'Error discovering URLs from {}: {} - {}'.format(
                 store_class_name,
@@ -314,14 +327,18 @@ class Store:
         for url in discovered_entries.keys():
             logger.info(url)
 
+        if report_throttling:
+            return throttling_report(discovered_entries, call['count'])
+
         return discovered_entries
 
     @staticmethod
-    @shared_task(autoretry_for=(StoreScrapError,),
+    @shared_task(bind=True,
+                 autoretry_for=(StoreScrapError,),
                  max_retries=5,
                  default_retry_delay=5)
-    def products_for_url_task(store_class_name, url, category=None,
-                              extra_args=None):
+    def products_for_url_task(self, store_class_name, url, category=None,
+                              extra_args=None, report_throttling=False):
         store = get_store_class_by_name(store_class_name)
         logger.info('Obtaining products for URL')
         logger.info('Store: ' + store.__name__)
@@ -329,8 +346,17 @@ class Store:
         logger.info('URL: ' + url)
 
         try:
-            raw_products = store.products_for_url(
-                url, category, extra_args)
+            with throttling_counter.counting(store_class_name,
+                                             local=False) as call:
+                raw_products = store.products_for_url(
+                    url, category, extra_args)
+        except InvalidSessionCookieException as e:
+            raise self.retry(
+                exc=e, args=(store_class_name, url, category),
+                kwargs={
+                    'extra_args': store._refreshed_preflight_args(
+                        extra_args),
+                    'report_throttling': report_throttling})
         except Exception:
             error_message = 'Error retrieving products from {}: {} - {}' \
                             ''.format(store_class_name, url,
@@ -343,18 +369,31 @@ class Store:
         for idx, product in enumerate(serialized_products):
             logger.info('{} - {}'.format(idx, product))
 
+        if report_throttling:
+            return throttling_report(serialized_products, call['count'])
+
         return serialized_products
 
     @staticmethod
-    @shared_task(autoretry_for=(StoreScrapError,),
+    @shared_task(bind=True,
+                 autoretry_for=(StoreScrapError,),
                  max_retries=5,
                  default_retry_delay=5)
-    def products_for_urls_task(store_class_name,
+    def products_for_urls_task(self, store_class_name,
                                discovery_entries,
                                extra_args=None,
                                products_for_url_concurrency=None,
                                use_async=True):
         store = get_store_class_by_name(store_class_name)
+
+        if use_async and products_for_url_concurrency is None and \
+                store._celery_chords_allowed(self.app):
+            # The workers take care of the concurrency of the chord
+            extra_args = store._extra_args_with_preflight(extra_args)
+            return store._replace_task(
+                self, *store._products_for_urls_chord(discovery_entries,
+                                                      extra_args))
+
         result = store.products_for_urls(
             discovery_entries, extra_args=extra_args,
             products_for_url_concurrency=products_for_url_concurrency,
@@ -368,6 +407,80 @@ class Store:
 
         return serialized_result
 
+    # The tasks below retrieve every product of a store without any worker
+    # waiting on the results of other tasks: the discovery of the categories
+    # is a chord whose callback replaces itself with a chord of
+    # products_for_url_task calls, whose callback collects their
+    # products. A chord sends all of its tasks at once, bounded only by the
+    # number of workers, so the stores that set their own concurrency (e.g.
+    # to be polite with their site, see _sets_concurrency_limits) keep
+    # blocking on a window of subtasks like the Celery executor does. So do
+    # all the stores without a result backend with chord support (e.g.
+    # Redis). The default "rpc://" one has none, so this path is off unless
+    # the backend is changed (see bin/celeryconfig/defaults.py)
+
+    @staticmethod
+    @shared_task(bind=True)
+    def products_task(self, store_class_name, categories=None,
+                      extra_args=None):
+        # Same result as products_for_urls_task, for the given categories
+        store = get_store_class_by_name(store_class_name)
+        categories = store.sanitize_parameters(
+            categories=categories)['categories']
+        extra_args = store._extra_args_with_preflight(extra_args)
+
+        if not store._celery_chords_allowed(self.app):
+            # Also honors the concurrency of the store
+            result = store.products(categories=categories,
+                                    extra_args=extra_args, use_async=True)
+            return {
+                'products': [p.serialize() for p in result['products']],
+                'discovery_urls_without_products':
+                    result['discovery_urls_without_products']
+            }
+
+        logger.info('Discovering URLs for: {}'.format(categories))
+
+        header = [store._celery_signature(
+            store.discover_entries_for_category_task, category, extra_args)
+            for category in categories]
+        body = store._celery_signature(store.discovered_entries_task,
+                                       categories, extra_args)
+
+        return store._replace_task(self, header, body)
+
+    @staticmethod
+    @shared_task(bind=True)
+    def discovered_entries_task(self, task_results, store_class_name,
+                                categories, extra_args):
+        # Callback of the discovery chord of products_task
+        store = get_store_class_by_name(store_class_name)
+        discovered_entries = store._merge_discovery_results(
+            categories, task_results)
+
+        return store._replace_task(
+            self, *store._products_for_urls_chord(discovered_entries,
+                                                  extra_args))
+
+    @staticmethod
+    @shared_task
+    def products_for_url_results_task(products_results, store_class_name,
+                                      discovered_entries):
+        # Callback of the chord of _products_for_urls_chord, collects the
+        # products of each of the discovered entries
+        store = get_store_class_by_name(store_class_name)
+        result = {
+            'products': [],
+            'discovery_urls_without_products': []
+        }
+
+        for (entry_url, entry_metadata), serialized_products in zip(
+                discovered_entries.items(), products_results):
+            store._add_serialized_entry_products(
+                result, entry_url, entry_metadata, serialized_products)
+
+        return result
+
     ##########################################################################
     # Implementation dependant methods
     ##########################################################################
@@ -399,6 +512,27 @@ class Store:
         urls = cls.discover_urls_for_category(category, extra_args)
         return {url: [] for url in urls}
 
+    @classmethod
+    async def discover_entries_for_category_async(cls, category,
+                                                  extra_args=None):
+        # Used by the "asyncio" executor. Stores can override it with a
+        # native asyncio implementation, otherwise the blocking method runs
+        # on the default thread pool of the event loop (in the context of
+        # the task, see ThrottlingCounter)
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None, contextvars.copy_context().run,
+            cls.discover_entries_for_category, category, extra_args)
+
+    @classmethod
+    async def products_for_url_async(cls, url, category=None,
+                                     extra_args=None):
+        # Same as above, for products_for_url
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None, contextvars.copy_context().run, cls.products_for_url, url,
+            category, extra_args)
+
     @classmethod
     def preflight(cls, extra_args=None):
         # Executes any logic that needs to be done only once per scraping
@@ -424,7 +558,9 @@ class Store:
     @classmethod
     def sanitize_parameters(cls, categories=None,
                             discover_urls_concurrency=None,
-                            products_for_url_concurrency=None, use_async=None):
+                            products_for_url_concurrency=None, use_async=None,
+                            use_threads=None, executor=None, pipelined=None,
+                            adaptive_concurrency=None):
         if categories is None:
             categories = cls.categories()
         else:
@@ -438,14 +574,44 @@ class Store:
             products_for_url_concurrency = \
                 cls.preferred_products_for_url_concurrency
 
+        if adaptive_concurrency is None:
+            adaptive_concurrency = cls.prefer_adaptive_concurrency
+
+        # Starts from the limit learned on previous runs of the store, or
+        # the given / preferred concurrency if there is none
+        if adaptive_concurrency and not isinstance(
+                products_for_url_concurrency, AdaptiveConcurrency):
+            products_for_url_concurrency = AdaptiveConcurrency(
+                cls.__name__, products_for_url_concurrency,
+                maximum=cls.max_products_for_url_concurrency)
+
         if use_async is None:
             use_async = cls.prefer_async
 
+        if use_threads is None:
+            use_threads = cls.prefer_threads
+
+        if pipelined is None:
+            pipelined = cls.prefer_pipelined
+
+        # The executor (see storescraper.executors) can be given by name,
+        # otherwise it is chosen based on use_async / use_threads
+        if executor is None:
+            if use_async:
+                executor = 'celery'
+            elif use_threads:
+                executor = 'thread'
+            else:
+                executor = 'serial'
+
         return {
             'categories': categories,
             'discover_urls_concurrency': discover_urls_concurrency,
             'products_for_url_concurrency': products_for_url_concurrency,
             'use_async': use_async,
+            'use_threads': use_threads,
+            'executor': executor,
+            'pipelined': pipelined,
         }
 
     ######################################################################
@@ -464,8 +630,366 @@ class Store:
         preflight_args = {
             'preflight_done': True
         }
-        preflight_args.update(cls.preflight(extra_args))
+
+        if cls.preflight_cache_ttl:
+            cache_key = preflight_cache_key(cls.__name__, extra_args)
+            cached_preflight_args = get_cached_preflight(cache_key)
+
+            if cached_preflight_args is None:
+                logger.info('Running preflight for {}'.format(cls.__name__))
+                cached_preflight_args = cls.preflight(extra_args)
+                cache_preflight(cache_key, cached_preflight_args,
+                                cls.preflight_cache_ttl)
+            else:
+                logger.info('Using cached preflight for {}'.format(
+                    cls.__name__))
+
+            preflight_args['preflight_cache_key'] = cache_key
+            preflight_args.update(cached_preflight_args)
+        else:
+            preflight_args.update(cls.preflight(extra_args))
+
         if extra_args is not None:
             preflight_args.update(extra_args)
 
+        # Kept to run the preflight again if its result is rejected (see
+        # _refreshed_preflight_args)
+        preflight_args['preflight_extra_args'] = extra_args
+
         return preflight_args
+
+    @classmethod
+    def _extra_args_with_http_pool(cls, extra_args, *concurrencies):
+        # The sessions of the store get connection pools of their own (see
+        # utils.pooled_adapter), with room for a connection for each of the
+        # calls that may run at once. Keeps the pool of the caller (e.g.
+        # iter_products, sized for both of its stages) if there is one
+        if 'http_pool_maxsize' in extra_args:
+            return extra_args
+
+        return dict(extra_args, http_pool_store=cls.__name__,
+                    http_pool_maxsize=max(max_concurrency(concurrency)
+                                          for concurrency in concurrencies))
+
+    @classmethod
+    def _refreshed_preflight_args(cls, extra_args):
+        # The extra_args of a call whose session was rejected by the store
+        # (InvalidSessionCookieException), with the result of a new
+        # preflight instead of the cached one
+        cls.invalidate_preflight_cache(extra_args)
+
+        if extra_args is None or 'preflight_done' not in extra_args:
+            return extra_args
+
+        # Other arguments added to extra_args (e.g. the HTTP pool) are kept
+        return dict(extra_args, **cls._extra_args_with_preflight(
+            extra_args.get('preflight_extra_args')))
+
+    @classmethod
+    def invalidate_preflight_cache(cls, extra_args=None):
+        # Discards the cached preflight args used to build "extra_args" (as
+        # returned by _extra_args_with_preflight), e.g. because the session
+        # cookie obtained by preflight expired
+        if extra_args is None or 'preflight_cache_key' not in extra_args:
+            return
+
+        logger.info('Invalidating cached preflight for {}'.format(
+            cls.__name__))
+        invalidate_preflight(extra_args['preflight_cache_key'])
+
+    @classmethod
+    def _map(cls, executor, method_name, args_iterable, concurrency,
+             extra_args):
+        # executor.map, invalidating the cached preflight if any of the
+        # calls finds out that its session is no longer valid
+        try:
+            yield from executor.map(method_name, args_iterable, concurrency)
+        except InvalidSessionCookieException:
+            cls.invalidate_preflight_cache(extra_args)
+            raise
+
+    @classmethod
+    def _entry_products(cls, entry_url, entry_metadata, retrieved_products):
+        # The (discovery_url, product) pairs yielded by
+        # iter_products_for_urls for the products of a discovered entry
+        for product in retrieved_products:
+            if not product.positions:
+                product.positions = entry_metadata['positions']
+            logger.info('{}\n'.format(product))
+            yield entry_url, product
+
+        if not retrieved_products:
+            yield entry_url, None
+
+    @classmethod
+    def _celery_chords_allowed(cls, app):
+        # Chords need a result backend that can join the results of their
+        # header, which the "rpc://" backend can't. They also ignore the
+        # concurrency of the store
+        if cls._sets_concurrency_limits():
+            return False
+
+        try:
+            app.backend.ensure_chords_allowed()
+        except NotImplementedError:
+            return False
+        return True
+
+    @classmethod
+    def _sets_concurrency_limits(cls):
+        # Whether the store (or one of its parents other than Store) sets
+        # its own concurrency, e.g. preferred_products_for_url_concurrency
+        # = 3 so as not to be blocked by its site
+        store_classes = cls.__mro__[:cls.__mro__.index(Store)]
+
+        return any(attribute in vars(store_class)
+                   for store_class in store_classes
+                   for attribute in CONCURRENCY_LIMIT_ATTRIBUTES)
+
+    @classmethod
+    def _celery_signature(cls, task, *args):
+        # Same queue as the tasks sent by the Celery executor
+        signature = task.s(cls.__name__, *args)
+        signature.set(queue='storescraper')
+        return signature
+
+    @classmethod
+    def _replace_task(cls, task, header, body):
+        # Replaces the running task with the chord of the given header and
+        # body, whose result becomes the result of the task. Without a
+        # header there is nothing to wait for, so the task is replaced by
+        # the body with an empty list of results
+        if not header:
+            return task.replace(body.clone(args=([],)))
+        return task.replace(chord(header, body))
+
+    @classmethod
+    def _products_for_urls_chord(cls, discovered_entries, extra_args):
+        # Header and body of the chord that retrieves the products of the
+        # discovered entries, one products_for_url_task for each of them
+        header = [cls._celery_signature(
+            cls.products_for_url_task, entry_url, entry_metadata['category'],
+            extra_args)
+            for entry_url, entry_metadata in discovered_entries.items()]
+        body = cls._celery_signature(cls.products_for_url_results_task,
+                                     discovered_entries)
+
+        return header, body
+
+    @classmethod
+    def _add_serialized_entry_products(cls, result, entry_url,
+                                       entry_metadata, serialized_products):
+        # Same as _entry_products, for the results of the tasks
+        for serialized_product in serialized_products:
+            if not serialized_product['positions']:
+                serialized_product['positions'] = entry_metadata['positions']
+            result['products'].append(serialized_product)
+
+        if not serialized_products:
+            result['discovery_urls_without_products'].append(entry_url)
+
+    @classmethod
+    def _executor(cls, executor):
+        # "executor" is the name of one of storescraper.executors or a
+        # callable that returns an Executor for the given store (e.g. a
+        # partial of an executor class with a shared budget)
+        if isinstance(executor, str):
+            executor = get_executor_class_by_name(executor)
+        return executor(cls)
+
+    @classmethod
+    def _collect_products(cls, products_iterator):
+        # Consumes the (discovery_url, product) pairs of the "iter_" methods
+        # into the dictionary returned by the non-generator API
+        products = []
+        discovery_urls_without_products = []
+
+        for entry_url, product in products_iterator:
+            if product is None:
+                discovery_urls_without_products.append(entry_url)
+            else:
+                products.append(product)
+
+        return {
+            'products': products,
+            'discovery_urls_without_products': discovery_urls_without_products
+        }
+
+    @classmethod
+    def _merge_discovery_results(cls, categories, task_results):
+        # Merges the results of discover_entries_for_category for each of
+        # the given categories into the discovered entries dictionary.
+        # Merges in category order, so that the positions kept for each URL
+        # don't depend on the order in which the tasks finished
+        entry_positions = defaultdict(lambda: {})
+        url_category_weights = defaultdict(lambda: defaultdict(lambda: 0))
+
+        for category, task_result in zip(categories, task_results):
+            for url, positions in task_result.items():
+                if positions:
+                    for pos in positions:
+                        if pos['section_name'] not in entry_positions[url]:
+                            entry_positions[url][pos['section_name']] = \
+                                pos['value']
+                        url_category_weights[url][category] += \
+                            pos['category_weight']
+                else:
+                    # Legacy for implementations without position data
+                    url_category_weights[url][category] = 1
+                    entry_positions[url] = {}
+
+        discovered_entries = {}
+        for url, positions in entry_positions.items():
+            category, max_weight = max(url_category_weights[url].items(),
+                                       key=lambda x: x[1],)
+
+            # Only include the url in the discovery set if it appears in a
+            # weighted section, for example generic "Electrodomésticos"
+            # section have 0 weight, but specific sections
+            # (e.g. "Refrigeradores") have positive values. This allows us to
+            # map generic sections positioning without considering their
+            # products if they don't appear in a specifically mapped
+            # relevant section
+            if max_weight:
+                discovered_entries[url] = {
+                    'positions': positions,
+                    'category': category,
+                    'category_weight': max_weight
+                }
+
+        return discovered_entries
+
+    @classmethod
+    def _iter_products_pipelined(cls, categories, extra_args,
+                                 discover_urls_concurrency,
+                                 products_for_url_concurrency, executor):
+        # Same output as iter_products, but each URL is submitted to
+        # products_for_url as soon as a category with a positive weight
+        # discovers it, so product retrieval overlaps with the discovery of
+        # the remaining categories. The category and positions of an URL are
+        # only final once every category has been discovered, so products
+        # retrieved before that are held back and patched afterwards
+        # ("late merge"), dropping the URLs that ended up without weight
+        discovery_executor = cls._executor(executor)
+        products_executor = cls._executor(executor)
+        # The products map holds budget slots while it waits for discovered
+        # URLs, so the discovery can't wait for them. Its own concurrency
+        # is bounded by discover_urls_concurrency anyway
+        discovery_executor.budget = None
+        logger.info('Using pipelined {} executor'.format(
+            products_executor.name))
+
+        task_results = [None] * len(categories)
+        submitted_urls = []
+        submitted_categories = {}
+        discovery_state = {'discovered_entries': None}
+        # The discovery runs on its own thread, which sends the URLs to
+        # retrieve through this queue followed by None (or the exception
+        # that stopped it). Driving it from the products map instead would
+        # only discover the next category once every URL of the current one
+        # has been submitted
+        discovered_urls = queue.Queue()
+        discovery_stopped = threading.Event()
+
+        def discover():
+            queued_urls = set()
+
+            try:
+                for idx, task_result in cls._map(
+                        discovery_executor, 'discover_entries_for_category',
+                        [(category, extra_args) for category in categories],
+                        discover_urls_concurrency, extra_args):
+                    category = categories[idx]
+                    logger.info('Discovered URLs for {}:'.format(category))
+                    task_results[idx] = task_result
+
+                    for url, positions in task_result.items():
+                        logger.info(url)
+                        logger.info(positions)
+
+                        if url in queued_urls:
+                            continue
+
+                        if positions and not any(pos['category_weight']
+                                                 for pos in positions):
+                            continue
+
+                        queued_urls.add(url)
+                        discovered_urls.put((url, category))
+
+                    if discovery_stopped.is_set():
+                        return
+
+                discovery_state['discovered_entries'] = \
+                    cls._merge_discovery_results(categories, task_results)
+            except Exception as e:
+                discovered_urls.put(e)
+                return
+
+            discovered_urls.put(None)
+
+        def products_executor_args():
+            while True:
+                discovered_url = discovered_urls.get()
+
+                if discovered_url is None:
+                    return
+                if isinstance(discovered_url, Exception):
+                    raise discovered_url
+
+                url, category = discovered_url
+                submitted_urls.append(url)
+                submitted_categories[url] = category
+                logger.info('Retrieving URL ({}): {}'.format(
+                    len(submitted_urls), url))
+                yield url, category, extra_args
+
+        def merged_products(entry_url, retrieved_products):
+            entry_metadata = \
+                discovery_state['discovered_entries'].get(entry_url)
+
+            if entry_metadata is None:
+                logger.info('Discarding URL without weight: {}'.format(
+                    entry_url))
+                return
+
+            for product in retrieved_products:
+                if product.category == submitted_categories[entry_url]:
+                    product.category = entry_metadata['category']
+                if not product.positions:
+                    product.positions = entry_metadata['positions']
+                logger.info('{}\n'.format(product))
+                yield entry_url, product
+
+            if not retrieved_products:
+                yield entry_url, None
+
+        held_back_results = []
+        discovery_thread = threading.Thread(target=discover, daemon=True)
+        discovery_thread.start()
+
+        try:
+            for idx, retrieved_products in cls._map(
+                    products_executor, 'products_for_url',
+                    products_executor_args(), products_for_url_concurrency,
+                    extra_args):
+                entry_url = submitted_urls[idx]
+
+                if discovery_state['discovered_entries'] is None:
+                    held_back_results.append((entry_url, retrieved_products))
+                    continue
+
+                for held_back_result in held_back_results:
+                    yield from merged_products(*held_back_result)
+                held_back_results = []
+
+                yield from merged_products(entry_url, retrieved_products)
+        finally:
+            # Only relevant if the consumer stopped early or a call failed
+            discovery_stopped.set()
+            discovery_thread.join()
+
+        # The executor consumes all of its arguments (and so the whole
+        # discovery) before finishing
+        for held_back_result in held_back_results:
+            yield from merged_products(*held_back_result)
@@ -1,273 +1,360 @@
-from .abcdin import AbcDin
-from .acer_store import AcerStore
-from .agencias_way_online import AgenciasWayOnline
-from .aire_center import AireCenter
-from .al_kosto import AlKosto
-from .alfaomega import Alfaomega
-from .all_gamers_chile import AllGamersChile
-from .alltec import AllTec
-from .almacenes_japon import AlmacenesJapon
-from .almacenes_la_ganga import AlmacenesLaGanga
-from .ama_hogar import AmaHogar
-from .amazon_print import AmazonPrint
-from .americanas import Americanas
-from .artefacta import Artefacta
-from .belight import Belight
-from .best_buy_mexico import BestBuyMexico
-from .bip import Bip
-from .bristol import Bristol
-from .bulldog_pc import BulldogPc
-from .byp import Byp
-from .c_network import CNetwork
-from .carrefour import Carrefour
-from .carrefour_brasil import CarrefourBrasil
-from .casa_confort import CasaConfort
-from .casa_del_audio import CasaDelAudio
-from .casa_musa import CasaMusa
-from .casa_royal import CasaRoyal
-from .casas_bahia import CasasBahia
-from .cc_link import CCLink
-from .cetrogar import Cetrogar
-from .centrale import Centrale
-from .cintegral import Cintegral
-from .claro import Claro
-from .claro_up import ClaroUp
-from .clie import Clie
-from .clima_seguro import ClimaSeguro
-from .comandato import Comandato
-from .compumundo import Compumundo
-from .conelectric import Conelectric
-from .coppel import Coppel
-from .corona import Corona
-from .costco_mexico import CostcoMexico
-from .creditos_economicos import CreditosEconomicos
-from .creditos_mundiales import CreditosMundiales
-from .cyber_puerta import CyberPuerta
-from .daewoo import Daewoo
-from .danaus import Danaus
-from .david_and_joseph import DavidAndJoseph
-from .dd_tech import DdTech
-from .dell import Dell
-from .deltron import Deltron
-from .demasled import Demasled
-from .dgital import Dgital
-from .digiplot import Digiplot
-from .digitalife import Digitalife
-from .dimercom import Dimercom
-from .diunsa import Diunsa
-from .do_it_center import DoItCenter
-from .e_vision import EVision
-from .easy import Easy
-from .easy_argentina import EasyArgentina
-from .efe import Efe
-from .eglo import Eglo
-from .eight_bits import EightBits
-from .electroban import Electroban
-from .electronica_panamericana import ElectronicaPanamericana
-from .electro_ventas import ElectroVentas
-from .el_gallo_mas_gallo import ElGalloMasGallo
-from .elite_center import EliteCenter
-from .enel import Enel
-from .entel import Entel
-from .eurogen import Eurogen
-from .exito import Exito
-from .extra_brasil import ExtraBrasil
-from .falabella import Falabella
-from .falabella_fast import FalabellaFast
-from .falabella_cf import FalabellaCf
-from .falabella_argentina import FalabellaArgentina
-from .falabella_peru import FalabellaPeru
-from .fiesta_lan import FiestaLan
-from .fnac import Fnac
-from .fravega import Fravega
-from .garbarino import Garbarino
-from .games_legends import GamesLegends
-from .game_masters import GameMasters
-from .gearbest import GearBest
-from .generacion_gamers import GeneracionGamers
-from .globalmac import GlobalMac
-from .gobantes import Gobantes
-from .gollo_tienda import GolloTienda
-from .gonzalez_gimenez import GonzalezGimenez
-from .good_computer import GoodComputer
-from .grupo_cva import GrupoCva
-from .grupo_decme import GrupoDecme
-from .gtd import Gtd
-from .g_w_store import GWStore
-from .hard_gaming import HardGaming
-from .hbt import Hbt
-from .hiraoka import Hiraoka
-from .hites import Hites
-from .hp_online import HpOnline
-from .huawei_shop import HuaweiShop
-from .ibyte import Ibyte
-from .ilumina_led import IluminaLed
-from .imp_dali import ImpDali
-from .infographics_solutions import InfographicsSolutions
-from .infor_ingen import InforIngen
-from .ingram_micro import IngramMicro
-from .intcomex import Intcomex
-from .inverfin import Inverfin
-from .iprotech import Iprotech
-from .isi_book import IsiBook
-from .jetstereo import Jetstereo
-from .johnson import Johnson
-from .jumbo import Jumbo
-from .jumbo_argentina import JumboArgentina
-from .jumbo_colombia import JumboColombia
-from .jumbo_store import JumboStore
-from .kabum import Kabum
-from .kalunga import Kalunga
-from .kill_store import KillStore
-from .kuhn import Kuhn
-from .la_curacao_online_nicaragua import LaCuracaoOnlineNicaragua
-from .la_curacao_online_el_salvador import LaCuracaoOnlineElSalvador
-from .la_curacao_online_guatemala import LaCuracaoOnlineGuatemala
-from .la_curacao_online_honduras import LaCuracaoOnlineHonduras
-from .la_polar import LaPolar
-from .lady_lee import LadyLee
-from .led_light_chile import LedLightChile
-from .led_shop import LedShop
-from .led_studio import LedStudio
-from .lenovo_chile import LenovoChile
-from .lenovo_mexico import LenovoMexico
-from .lg_chile import LgChile
-from .lg_cac import LgCac
-from .lg_ec import LgEc
-from .lider import Lider
-from .linio_chile import LinioChile
-from .linio_mexico import LinioMexico
-from .litnor_hogar import LitnorHogar
-from .liverpool import Liverpool
-from .livrarias_curitiba import LivrariasCuritiba
-from .llevatelo import Llevatelo
-from .loi_chile import LoiChile
-from .lucila import Lucila
-from .mac_online import MacOnline
-from .magazine_luiza import MagazineLuiza
-from .marcimex import Marcimex
-from .manco_store import MancoStore
-from .max import Max
-from .mega_bytes import MegaBytes
-from .mega_mamute import MegaMatute
-from .mega_store import MegaStore
-from .megatone import Megatone
-from .mercado_tech import MercadoTech
-from .mercadolibre_argentina import MercadoLibreArgentina
-from .mercadolibre_argentina_adata import MercadoLibreArgentinaAdata
-from .mercadolibre_argentina_sandisk import MercadoLibreArgentinaSandisk
-from .mercadolibre_argentina_seagate import MercadoLibreArgentinaSeagate
-from .mercadolibre_argentina_western_digital import \
-    MercadoLibreArgentinaWesternDigital
-from .mercado_libre_chile import MercadoLibreChile
-from .mercado_libre_samsung import MercadoLibreSamsung
-from .meroli import Meroli
-from .mhw_store import MHWStore
-from .mi_pc import MiPc
-from .microplay import Microplay
-from .mis_beneficios import MisBeneficios
-from .mobile_hut import MobileHut
-from .movistar import Movistar
-from .movistar_one import MovistarOne
-from .multimax import Multimax
-from .musimundo import Musimundo
-from .my_box import MyBox
-from .new_game import NewGame
-from .nice_one import NiceOne
-from .notebook_store import NotebookStore
-from .olier import Olier
-from .omnisport import Omnisport
-from .orbital_store import OrbitalStore
-from .office_depot import OfficeDepot
-from .office_max_mexico import OfficeMaxMexico
-from .ortiz_y_ortega import OrtizYOrtega
-from .panafoto import Panafoto
-from .panamericana import Panamericana
-from .paris import Paris
-from .paris_fast import ParisFast
-from .pc_com import PcCom
-from .pc_digital import PcDigital
-from .pc_express import PcExpress
-from .pc_factory import PcFactory
-from .pc_gamer import PcGamer
-from .pc_ofertas import PcOfertas
-from .pcel import Pcel
-from .pch_mayoreo import PchMayoreo
-from .pcmig import Pcmig
-from .pc_nitro import PcNitro
-from .pcx import Pcx
-from .peta import Peta
-from .pichau import Pichau
-from .plaza_lama import PlazaLama
-from .pontofrio import Pontofrio
-from .portatil_chile import PortatilChile
-from .pro_movil import ProMovil
-from .proglobal import Proglobal
-from .raenco import Raenco
-from .reif_store import ReifStore
-from .rhona import Rhona
-from .ribeiro import Ribeiro
-from .ripley import Ripley
-from .ripley_peru import RipleyPeru
-from .rodo import Rodo
-from .sams import Sams
-from .samsung_chile import SamsungChile
-from .samsung_shop import SamsungShop
-from .sanborns import Sanborns
-from .saraiva import Saraiva
-from .sc_global import ScGlobal
-from .sears_mexico import SearsMexico
-from .setup_space import SetupSpace
-from .siman_el_salvador import SimanElSalvador
-from .siman_nicaragua import SimanNicaragua
-from .sindelen import Sindelen
-from .sipo_online import SipoOnline
-from .sistemax import Sistemax
-from .sodimac import Sodimac
-from .sodimac_argentina import SodimacArgentina
-from .solar_led import SolarLed
-from .sony_store import SonyStore
-from .spaceman import Spaceman
-from .sp_digital import SpDigital
-from .spider import Spider
-from .stylus import Stylus
-from .sukasa import Sukasa
-from .supermex_digital import SupermexDigital
-from .syd import Syd
-from .tecnofacil import Tecnofacil
-from .tecnoglobal import Tecnoglobal
-from .tekstore import Tekstore
-from .terabyte import Terabyte
-from .tienda_claro import TiendaClaro
-from .tienda_entel import TiendaEntel
-from .tienda_movistar import TiendaMovistar
-from .tienda_monge import TiendaMonge
-from .tienda_smart import TiendaSmart
-from .tienda_toyotomi import TiendaToyotomi
-from .travel_tienda import TravelTienda
-from .travim import Travim
-from .todo_juegos import TodoJuegos
-from .todoclick import Todoclick
-from .tomalo import Tomalo
-from .top_pc import TopPc
-from .tottus import Tottus
-from .ttchile import TtChile
-from .tupi import Tupi
-from .ultimate_gamer_store import UltimateGamerStore
-from .val_suministros import ValSuministros
-from .vitel import Vitel
-from .vivelo import Vivelo
-from .vtr import Vtr
-from .walmart_argentina import WalmartArgentina
-from .walmart_brazil import WalmartBrazil
-from .walmart_mexico import WalmartMexico
-from .wei import Wei
-from .weplay import Weplay
-from .winpy import Winpy
-from .woow import Woow
-from .wom import Wom
-from .xl_store import XlStore
-from .xtreme_tec_pc import XtremeTecPc
-from .yoytec import Yoytec
-from .zegucom import Zegucom
-from .zmart import Zmart
+import ast
+import importlib
+import os
+
+from storescraper import categories as categories_module
+
+# Name of the module of each store. The store modules (and their heavy
+# dependencies) are only imported when the store is first accessed, e.g.
+# storescraper.stores.Ripley or get_store_class_by_name('Ripley')
+STORE_MODULES = {
+    'AbcDin': 'abcdin',
+    'AcerStore': 'acer_store',
+    'AgenciasWayOnline': 'agencias_way_online',
+    'AireCenter': 'aire_center',
+    'AlKosto': 'al_kosto',
+    'Alfaomega': 'alfaomega',
+    'AllGamersChile': 'all_gamers_chile',
+    'AllTec': 'alltec',
+    'AlmacenesJapon': 'almacenes_japon',
+    'AlmacenesLaGanga': 'almacenes_la_ganga',
+    'AmaHogar': 'ama_hogar',
+    'AmazonPrint': 'amazon_print',
+    'Americanas': 'americanas',
+    'Artefacta': 'artefacta',
+    'Belight': 'belight',
+    'BestBuyMexico': 'best_buy_mexico',
+    'Bip': 'bip',
+    'Bristol': 'bristol',
+    'BulldogPc': 'bulldog_pc',
+    'Byp': 'byp',
+    'CNetwork': 'c_network',
+    'Carrefour': 'carrefour',
+    'CarrefourBrasil': 'carrefour_brasil',
+    'CasaConfort': 'casa_confort',
+    'CasaDelAudio': 'casa_del_audio',
+    'CasaMusa': 'casa_musa',
+    'CasaRoyal': 'casa_royal',
+    'CasasBahia': 'casas_bahia',
+    'CCLink': 'cc_link',
+    'Cetrogar': 'cetrogar',
+    'Centrale': 'centrale',
+    'Cintegral': 'cintegral',
+    'Claro': 'claro',
+    'ClaroUp': 'claro_up',
+    'Clie': 'clie',
+    'ClimaSeguro': 'clima_seguro',
+    'Comandato': 'comandato',
+    'Compumundo': 'compumundo',
+    'Conelectric': 'conelectric',
+    'Coppel': 'coppel',
+    'Corona': 'corona',
+    'CostcoMexico': 'costco_mexico',
+    'CreditosEconomicos': 'creditos_economicos',
+    'CreditosMundiales': 'creditos_mundiales',
+    'CyberPuerta': 'cyber_puerta',
+    'Daewoo': 'daewoo',
+    'Danaus': 'danaus',
+    'DavidAndJoseph': 'david_and_joseph',
+    'DdTech': 'dd_tech',
+    'Dell': 'dell',
+    'Deltron': 'deltron',
+    'Demasled': 'demasled',
+    'Dgital': 'dgital',
+    'Digiplot': 'digiplot',
+    'Digitalife': 'digitalife',
+    'Dimercom': 'dimercom',
+    'Diunsa': 'diunsa',
+    'DoItCenter': 'do_it_center',
+    'EVision': 'e_vision',
+    'Easy': 'easy',
+    'EasyArgentina': 'easy_argentina',
+    'Efe': 'efe',
+    'Eglo': 'eglo',
+    'EightBits': 'eight_bits',
+    'Electroban': 'electroban',
+    'ElectronicaPanamericana': 'electronica_panamericana',
+    'ElectroVentas': 'electro_ventas',
+    'ElGalloMasGallo': 'el_gallo_mas_gallo',
+    'EliteCenter': 'elite_center',
+    'Enel': 'enel',
+    'Entel': 'entel',
+    'Eurogen': 'eurogen',
+    'Exito': 'exito',
+    'ExtraBrasil': 'extra_brasil',
+    'Falabella': 'falabella',
+    'FalabellaFast': 'falabella_fast',
+    'FalabellaCf': 'falabella_cf',
+    'FalabellaArgentina': 'falabella_argentina',
+    'FalabellaPeru': 'falabella_peru',
+    'FiestaLan': 'fiesta_lan',
+    'Fnac': 'fnac',
+    'Fravega': 'fravega',
+    'Garbarino': 'garbarino',
+    'GamesLegends': 'games_legends',
+    'GameMasters': 'game_masters',
+    'GearBest': 'gearbest',
+    'GeneracionGamers': 'generacion_gamers',
+    'GlobalMac': 'globalmac',
+    'Gobantes': 'gobantes',
+    'GolloTienda': 'gollo_tienda',
+    'GonzalezGimenez': 'gonzalez_gimenez',
+    'GoodComputer': 'good_computer',
+    'GrupoCva': 'grupo_cva',
+    'GrupoDecme': 'grupo_decme',
+    'Gtd': 'gtd',
+    'GWStore': 'g_w_store',
+    'HardGaming': 'hard_gaming',
+    'Hbt': 'hbt',
+    'Hiraoka': 'hiraoka',
+    'Hites': 'hites',
+    'HpOnline': 'hp_online',
+    'HuaweiShop': 'huawei_shop',
+    'Ibyte': 'ibyte',
+    'IluminaLed': 'ilumina_led',
+    'ImpDali': 'imp_dali',
+    'InfographicsSolutions': 'infographics_solutions',
+    'InforIngen': 'infor_ingen',
+    'IngramMicro': 'ingram_micro',
+    'Intcomex': 'intcomex',
+    'Inverfin': 'inverfin',
+    'Iprotech': 'iprotech',
+    'IsiBook': 'isi_book',
+    'Jetstereo': 'jetstereo',
+    'Johnson': 'johnson',
+    'Jumbo': 'jumbo',
+    'JumboArgentina': 'jumbo_argentina',
+    'JumboColombia': 'jumbo_colombia',
+    'JumboStore': 'jumbo_store',
+    'Kabum': 'kabum',
+    'Kalunga': 'kalunga',
+    'KillStore': 'kill_store',
+    'Kuhn': 'kuhn',
+    'LaCuracaoOnlineNicaragua': 'la_curacao_online_nicaragua',
+    'LaCuracaoOnlineElSalvador': 'la_curacao_online_el_salvador',
+    'LaCuracaoOnlineGuatemala': 'la_curacao_online_guatemala',
+    'LaCuracaoOnlineHonduras': 'la_curacao_online_honduras',
+    'LaPolar': 'la_polar',
+    'LadyLee': 'lady_lee',
+    'LedLightChile': 'led_light_chile',
+    'LedShop': 'led_shop',
+    'LedStudio': 'led_studio',
+    'LenovoChile': 'lenovo_chile',
+    'LenovoMexico': 'lenovo_mexico',
+    'LgChile': 'lg_chile',
+    'LgCac': 'lg_cac',
+    'LgEc': 'lg_ec',
+    'Lider': 'lider',
+    'LinioChile': 'linio_chile',
+    'LinioMexico': 'linio_mexico',
+    'LitnorHogar': 'litnor_hogar',
+    'Liverpool': 'liverpool',
+    'LivrariasCuritiba': 'livrarias_curitiba',
+    'Llevatelo': 'llevatelo',
+    'LoiChile': 'loi_chile',
+    'Lucila': 'lucila',
+    'MacOnline': 'mac_online',
+    'MagazineLuiza': 'magazine_luiza',
+    'Marcimex': 'marcimex',
+    'MancoStore': 'manco_store',
+    'Max': 'max',
+    'MegaBytes': 'mega_bytes',
+    'MegaMatute': 'mega_mamute',
+    'MegaStore': 'mega_store',
+    'Megatone': 'megatone',
+    'MercadoTech': 'mercado_tech',
+    'MercadoLibreArgentina': 'mercadolibre_argentina',
+    'MercadoLibreArgentinaAdata': 'mercadolibre_argentina_adata',
+    'MercadoLibreArgentinaSandisk': 'mercadolibre_argentina_sandisk',
+    'MercadoLibreArgentinaSeagate': 'mercadolibre_argentina_seagate',
+    'MercadoLibreArgentinaWesternDigital':
+        'mercadolibre_argentina_western_digital',
+    'MercadoLibreChile': 'mercado_libre_chile',
+    'MercadoLibreSamsung': 'mercado_libre_samsung',
+    'Meroli': 'meroli',
+    'MHWStore': 'mhw_store',
+    'MiPc': 'mi_pc',
+    'Microplay': 'microplay',
+    'MisBeneficios': 'mis_beneficios',
+    'MobileHut': 'mobile_hut',
+    'Movistar': 'movistar',
+    'MovistarOne': 'movistar_one',
+    'Multimax': 'multimax',
+    'Musimundo': 'musimundo',
+    'MyBox': 'my_box',
+    'NewGame': 'new_game',
+    'NiceOne': 'nice_one',
+    'NotebookStore': 'notebook_store',
+    'Olier': 'olier',
+    'Omnisport': 'omnisport',
+    'OrbitalStore': 'orbital_store',
+    'OfficeDepot': 'office_depot',
+    'OfficeMaxMexico': 'office_max_mexico',
+    'OrtizYOrtega': 'ortiz_y_ortega',
+    'Panafoto': 'panafoto',
+    'Panamericana': 'panamericana',
+    'Paris': 'paris',
+    'ParisFast': 'paris_fast',
+    'PcCom': 'pc_com',
+    'PcDigital': 'pc_digital',
+    'PcExpress': 'pc_express',
+    'PcFactory': 'pc_factory',
+    'PcGamer': 'pc_gamer',
+    'PcOfertas': 'pc_ofertas',
+    'Pcel': 'pcel',
+    'PchMayoreo': 'pch_mayoreo',
+    'Pcmig': 'pcmig',
+    'PcNitro': 'pc_nitro',
+    'Pcx': 'pcx',
+    'Peta': 'peta',
+    'Pichau': 'pichau',
+    'PlazaLama': 'plaza_lama',
+    'Pontofrio': 'pontofrio',
+    'PortatilChile': 'portatil_chile',
+    'ProMovil': 'pro_movil',
+    'Proglobal': 'proglobal',
+    'Raenco': 'raenco',
+    'ReifStore': 'reif_store',
+    'Rhona': 'rhona',
+    'Ribeiro': 'ribeiro',
+    'Ripley': 'ripley',
+    'RipleyPeru': 'ripley_peru',
+    'Rodo': 'rodo',
+    'Sams': 'sams',
+    'SamsungChile': 'samsung_chile',
+    'SamsungShop': 'samsung_shop',
+    'Sanborns': 'sanborns',
+    'Saraiva': 'saraiva',
+    'ScGlobal': 'sc_global',
+    'SearsMexico': 'sears_mexico',
+    'SetupSpace': 'setup_space',
+    'SimanElSalvador': 'siman_el_salvador',
+    'SimanNicaragua': 'siman_nicaragua',
+    'Sindelen': 'sindelen',
+    'SipoOnline': 'sipo_online',
+    'Sistemax': 'sistemax',
+    'Sodimac': 'sodimac',
+    'SodimacArgentina': 'sodimac_argentina',
+    'SolarLed': 'solar_led',
+    'SonyStore': 'sony_store',
+    'Spaceman': 'spaceman',
+    'SpDigital': 'sp_digital',
+    'Spider': 'spider',
+    'Stylus': 'stylus',
+    'Sukasa': 'sukasa',
+    'SupermexDigital': 'supermex_digital',
+    'Syd': 'syd',
+    'Tecnofacil': 'tecnofacil',
+    'Tecnoglobal': 'tecnoglobal',
+    'Tekstore': 'tekstore',
+    'Terabyte': 'terabyte',
+    'TiendaClaro': 'tienda_claro',
+    'TiendaEntel': 'tienda_entel',
+    'TiendaMovistar': 'tienda_movistar',
+    'TiendaMonge': 'tienda_monge',
+    'TiendaSmart': 'tienda_smart',
+    'TiendaToyotomi': 'tienda_toyotomi',
+    'TravelTienda': 'travel_tienda',
+    'Travim': 'travim',
+    'TodoJuegos': 'todo_juegos',
+    'Todoclick': 'todoclick',
+    'Tomalo': 'tomalo',
+    'TopPc': 'top_pc',
+    'Tottus': 'tottus',
+    'TtChile': 'ttchile',
+    'Tupi': 'tupi',
+    'UltimateGamerStore': 'ultimate_gamer_store',
+    'ValSuministros': 'val_suministros',
+    'Vitel': 'vitel',
+    'Vivelo': 'vivelo',
+    'Vtr': 'vtr',
+    'WalmartArgentina': 'walmart_argentina',
+    'WalmartBrazil': 'walmart_brazil',
+    'WalmartMexico': 'walmart_mexico',
+    'Wei': 'wei',
+    'Weplay': 'weplay',
+    'Winpy': 'winpy',
+    'Woow': 'woow',
+    'Wom': 'wom',
+    'XlStore': 'xl_store',
+    'XtremeTecPc': 'xtreme_tec_pc',
+    'Yoytec': 'yoytec',
+    'Zegucom': 'zegucom',
+    'Zmart': 'zmart',
+}
+
+__all__ = list(STORE_MODULES.keys())
+
+
+def __getattr__(name):
+    if name not in STORE_MODULES:
+        raise AttributeError('module {} has no attribute {}'.format(
+            __name__, name))
+
+    store_module = importlib.import_module(
+        '.' + STORE_MODULES[name], __name__)
+    store_class = getattr(store_module, name)
+    # Later accesses don't go through __getattr__
+    globals()[name] = store_class
+    return store_class
+
+
+def __dir__():
+    return sorted(list(globals().keys()) + __all__)
+
+
+def store_names():
+    return list(STORE_MODULES.keys())
+
+
+def store_categories(store_class_name):
+    # The categories of the store, read from the source of its module when
+    # its categories() just returns a list of constants, so listing them
+    # doesn't import the store. Otherwise the store is imported and its
+    # categories() called
+    store_categories_list = _categories_from_source(store_class_name)
+
+    if store_categories_list is None:
+        store_categories_list = __getattr__(store_class_name).categories()
+
+    return store_categories_list
+
+
+def _categories_from_source(store_class_name):
+    module_path = os.path.join(
+        os.path.dirname(__file__),
+        '{}.py'.format(STORE_MODULES[store_class_name]))
+
+    with open(module_path, encoding='utf-8') as f:
+        module_ast = ast.parse(f.read())
+
+    for node in module_ast.body:
+        if not isinstance(node, ast.ClassDef) or \
+                node.name != store_class_name:
+            continue
+
+        for class_node in node.body:
+            if isinstance(class_node, ast.FunctionDef) and \
+                    class_node.name == 'categories' and \
+                    len(class_node.body) == 1 and \
+                    isinstance(class_node.body[0], ast.Return):
+                try:
+                    return _literal_value(class_node.body[0].value)
+                except ValueError:
+                    return None
+
+    # categories() is inherited or the class is defined elsewhere
+    return None
+
+
+def _literal_value(node):
+    # Like ast.literal_eval, but also resolves the constants of
+    # storescraper.categories (e.g. NOTEBOOK)
+    if isinstance(node, (ast.List, ast.Tuple)):
+        return [_literal_value(element) for element in node.elts]
+
+    if isinstance(node, ast.Name) and \
+            isinstance(getattr(categories_module, node.id, None), str):
+        return getattr(categories_module, node.id)
+
+    return ast.literal_eval(node)
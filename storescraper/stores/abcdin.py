@@ -7,15 +7,15 @@ from collections import defaultdict
 import time
 
 from bs4 import BeautifulSoup
-from decimal import Decimal
 from urllib.parse import urlparse, parse_qs, urlencode
 from selenium.common.exceptions import NoSuchElementException
 
+from storescraper.currency import Currency
 from storescraper.flixmedia import flixmedia_video_urls
 from storescraper.product import Product
 from storescraper.store import Store
 from storescraper.utils import remove_words, html_to_markdown, \
-    session_with_proxy, HeadlessChrome
+    session_with_proxy, HeadlessChrome, listing_soup
 from storescraper import banner_sections as bs
 
 
@@ -296,7 +296,7 @@ class AbcDin(Store):
                   '&pageSize=1000'.format(category_id)
             print(url)
 
-            soup = BeautifulSoup(session.get(url).text, 'html.parser')
+            soup = listing_soup(session.get(url).text, 'ul', 'grid_mode')
             products_grid = soup.find('ul', 'grid_mode')
 
             if not products_grid:
@@ -417,10 +417,10 @@ class AbcDin(Store):
         if not remove_words(normal_price).strip():
             return []
 
-        normal_price = Decimal(remove_words(normal_price))
+        normal_price = Currency.parse(normal_price, 'CLP')
 
         if len(prices_containers) >= 3:
-            offer_price = Decimal(remove_words(prices_containers[2].text))
+            offer_price = Currency.parse(prices_containers[2].text, 'CLP')
         else:
             offer_price = normal_price
 
@@ -2,12 +2,11 @@ import json
 import re
 
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class AcerStore(Store):
@@ -91,7 +90,7 @@ class AcerStore(Store):
             stock = 0
 
         price = soup.find('div', 'producto-precio').text.split('(')[0]
-        price = Decimal(remove_words(price))
+        price = Currency.parse(price, 'CLP')
 
         description = html_to_markdown(
             str(soup.find('table', 'producto-ficha-tabla')))
@@ -1,11 +1,10 @@
 import re
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words,\
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class AireCenter(Store):
@@ -74,7 +73,7 @@ class AireCenter(Store):
 
         price = soup.find('div', 'product-price')
         price = price.find('div', 'PricesalesPrice').span.text
-        price = Decimal(remove_words(price))
+        price = Currency.parse(price, 'CLP')
 
         description_a = html_to_markdown(str(soup.find('div', 's_desc').text))
         description_b = html_to_markdown(str(soup.find('div', 'desc')))
@@ -1,10 +1,11 @@
 from bs4 import BeautifulSoup
 from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import remove_words, html_to_markdown, \
-    session_with_proxy, check_ean13
+from storescraper.utils import html_to_markdown, session_with_proxy, \
+    check_ean13
 
 
 class AlKosto(Store):
@@ -102,7 +103,7 @@ class AlKosto(Store):
             normal_price = Decimal(price_container['content'])
         else:
             price_container = product_box.findAll('span', 'price')[1]
-            normal_price = Decimal(remove_words(price_container.string))
+            normal_price = Currency.parse(price_container.string, 'COP')
 
         offer_price = normal_price
 
@@ -1,10 +1,9 @@
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 from storescraper.categories import PROCESSOR, MOTHERBOARD, VIDEO_CARD, \
     POWER_SUPPLY, SOLID_STATE_DRIVE, MOUSE
 
@@ -90,10 +89,10 @@ class Alfaomega(Store):
         if not price_container.text.strip():
             return []
 
-        offer_price = Decimal(
-            remove_words(price_container.find('ins').find('span').text))
-        normal_price = Decimal(
-            remove_words(price_container.find('del').find('span').text))
+        offer_price = Currency.parse(
+            price_container.find('ins').find('span').text, 'CLP')
+        normal_price = Currency.parse(
+            price_container.find('del').find('span').text, 'CLP')
 
         picture_containers = soup.findAll('div', 'img-thumbnail')
         picture_urls = []
@@ -5,12 +5,13 @@ from decimal import Decimal
 
 from bs4 import BeautifulSoup
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
 from storescraper.categories import HEADPHONES, MOUSE, KEYBOARD, \
     KEYBOARD_MOUSE_COMBO, STEREO_SYSTEM, NOTEBOOK, TELEVISION, MONITOR, \
     VIDEO_GAME_CONSOLE
-from storescraper.utils import session_with_proxy, remove_words
+from storescraper.utils import session_with_proxy, listing_soup
 
 
 class AllGamersChile(Store):
@@ -55,7 +56,7 @@ class AllGamersChile(Store):
                 url_webpage = 'https://allgamerschile.com/categoria-producto' \
                               '/{}/page/{}/ '.format(url_extension, page)
                 data = session.get(url_webpage).text
-                soup = BeautifulSoup(data, 'html.parser')
+                soup = listing_soup(data, 'li', 'ast-col-sm-12')
                 product_containers = soup.findAll('li', 'ast-col-sm-12')
                 if not product_containers:
                     if page == 1:
@@ -109,9 +110,9 @@ class AllGamersChile(Store):
             sku = soup.find('button', 'single_add_to_cart_button')['value']
             price_container = soup.find('p', 'price')
             if price_container.find('ins'):
-                price = Decimal(remove_words(price_container.find('ins').text))
+                price = Currency.parse(price_container.find('ins').text, 'CLP')
             else:
-                price = Decimal(remove_words(price_container.text))
+                price = Currency.parse(price_container.text, 'CLP')
             picture_urls = [tag['src'] for tag in
                             soup.find('div',
                                       'woocommerce-product-gallery').findAll(
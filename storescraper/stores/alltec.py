@@ -2,12 +2,11 @@ import logging
 
 import demjson
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import remove_words, html_to_markdown, \
-    session_with_proxy
+from storescraper.utils import html_to_markdown, session_with_proxy
 
 
 class AllTec(Store):
@@ -154,13 +153,13 @@ class AllTec(Store):
 
         offer_price_string = soup.find(
             'span', {'id': 'our_price_display'}).text
-        offer_price = Decimal(remove_words(offer_price_string))
+        offer_price = Currency.parse(offer_price_string, 'CLP')
 
         normal_price_string = soup.find(
             'span', {'id': 'unit_price_display'})
 
         if normal_price_string:
-            normal_price = Decimal(remove_words(normal_price_string.text))
+            normal_price = Currency.parse(normal_price_string.text, 'CLP')
         else:
             normal_price = offer_price
 
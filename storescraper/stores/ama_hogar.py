@@ -1,10 +1,9 @@
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import remove_words, html_to_markdown, \
-    session_with_proxy
+from storescraper.utils import html_to_markdown, session_with_proxy
 
 
 class AmaHogar(Store):
@@ -74,7 +73,7 @@ class AmaHogar(Store):
         description = html_to_markdown(str(soup.find('div', 'tab-content ')))
 
         price_string = soup.find('span', {'itemprop': 'price'})['content']
-        normal_price = Decimal(remove_words(price_string))
+        normal_price = Currency.parse(price_string, 'ARS')
         offer_price = normal_price
 
         picture_urls = [tag['href'] for tag in soup.findAll('a', 'replace-2x')]
@@ -1,7 +1,6 @@
 import html
 import json
 
-import re
 from decimal import Decimal
 
 from bs4 import BeautifulSoup
@@ -9,7 +8,7 @@ from bs4 import BeautifulSoup
 from storescraper.product import Product
 from storescraper.store import Store
 from storescraper.utils import html_to_markdown, check_ean13, \
-    session_with_proxy
+    session_with_proxy, extract_json
 
 
 class Americanas(Store):
@@ -111,13 +110,11 @@ class Americanas(Store):
         if soup.find('svg', 'not-found-image'):
             return []
 
-        main_page_json = re.search(r'window.__PRELOADED_STATE__ = (.+);',
-                                   page_source)
+        main_page_json = extract_json(page_source,
+                                      'window.__PRELOADED_STATE__')
         if not main_page_json:
             return []
 
-        main_page_json = json.loads(main_page_json.groups()[0])
-
         product_json = \
             main_page_json['entities']['products']['entities']['products']
         eans_json = main_page_json['entities']['skus']['entities']['skus']
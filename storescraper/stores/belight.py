@@ -1,10 +1,9 @@
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import remove_words, html_to_markdown, \
-    session_with_proxy
+from storescraper.utils import html_to_markdown, session_with_proxy
 
 
 class Belight(Store):
@@ -66,7 +65,7 @@ class Belight(Store):
         if 'proyecto' in price_container.lower():
             return []
 
-        normal_price = Decimal(remove_words(price_container.replace('.-', '')))
+        normal_price = Currency.parse(price_container.replace('.-', ''), 'CLP')
         offer_price = normal_price
 
         picture_tags = soup.find('div', 'slider-for').findAll('img')
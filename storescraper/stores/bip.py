@@ -1,10 +1,9 @@
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import remove_words, html_to_markdown, \
-    session_with_proxy
+from storescraper.utils import html_to_markdown, session_with_proxy
 
 
 class Bip(Store):
@@ -157,8 +156,8 @@ class Bip(Store):
 
         price_containers = soup.findAll('p', 'precio')
 
-        offer_price = Decimal(remove_words(price_containers[0].text.strip()))
-        normal_price = Decimal(remove_words(price_containers[1].text.strip()))
+        offer_price = Currency.parse(price_containers[0].text.strip(), 'CLP')
+        normal_price = Currency.parse(price_containers[1].text.strip(), 'CLP')
 
         if normal_price < offer_price:
             normal_price = offer_price
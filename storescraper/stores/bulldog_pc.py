@@ -1,14 +1,14 @@
 import logging
 import re
-from decimal import Decimal
 
 from bs4 import BeautifulSoup
 
 from storescraper.categories import MOTHERBOARD, RAM, POWER_SUPPLY, \
     VIDEO_CARD, SOLID_STATE_DRIVE, CPU_COOLER, PROCESSOR
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words
+from storescraper.utils import session_with_proxy
 
 
 class BulldogPc(Store):
@@ -77,8 +77,8 @@ class BulldogPc(Store):
         else:
             stock = int(soup.find('div', {'id': 'stock'}).
                         find('span', 'product-form-stock').text)
-        price = Decimal(
-            remove_words(soup.find("span", "product-form-price").text))
+        price = Currency.parse(
+            soup.find("span", "product-form-price").text, 'CLP')
         picture_containers = soup.find("div", "col-12 product-page-thumbs "
                                               "space no-padding")
         if picture_containers:
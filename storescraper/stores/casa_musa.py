@@ -2,10 +2,10 @@ from _decimal import Decimal
 
 from bs4 import BeautifulSoup
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import remove_words, html_to_markdown, \
-    session_with_proxy
+from storescraper.utils import html_to_markdown, session_with_proxy
 
 
 class CasaMusa(Store):
@@ -58,9 +58,9 @@ class CasaMusa(Store):
 
         sku = pricing_container.find('p').text.split(':')[1].strip()
 
-        price = Decimal(remove_words(
+        price = Currency.parse(
             pricing_container.find(
-                'p', 'special-price').find('span', 'price').contents[0]))
+                'p', 'special-price').find('span', 'price').contents[0], 'CLP')
 
         price *= Decimal('1.19')
         normal_price = price.quantize(0)
@@ -1,6 +1,5 @@
 import logging
 import urllib
-from decimal import Decimal
 
 from bs4 import BeautifulSoup
 
@@ -8,9 +7,10 @@ from storescraper.categories import NOTEBOOK, STORAGE_DRIVE, \
     EXTERNAL_STORAGE_DRIVE, SOLID_STATE_DRIVE, POWER_SUPPLY, COMPUTER_CASE, \
     MOTHERBOARD, PROCESSOR, VIDEO_CARD, MOUSE, KEYBOARD, TELEVISION, MONITOR, \
     MEMORY_CARD, RAM, HEADPHONES
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words
+from storescraper.utils import session_with_proxy
 
 
 class CCLink(Store):
@@ -100,9 +100,9 @@ class CCLink(Store):
         name = soup.find('h1', 'product_title').text
         sku = soup.find('button', 'single_add_to_cart_button')['value']
         stock = -1
-        price = Decimal(remove_words(
+        price = Currency.parse(
             soup.find('div', 'product-actions-wrapper').findAll('bdi')[
-                0].text))
+                0].text, 'CLP')
         picture_urls = [urllib.parse.quote(tag['src'], safe='/:') for tag in
                         soup.find('div', 'product-images-wrapper').findAll(
                             'img')]
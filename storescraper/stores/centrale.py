@@ -1,5 +1,4 @@
 import logging
-from decimal import Decimal
 
 from bs4 import BeautifulSoup
 
@@ -7,9 +6,10 @@ from storescraper.categories import SOLID_STATE_DRIVE, \
     EXTERNAL_STORAGE_DRIVE, MEMORY_CARD, USB_FLASH_DRIVE, POWER_SUPPLY, RAM, \
     MOTHERBOARD, PROCESSOR, VIDEO_CARD, NOTEBOOK, TABLET, TELEVISION, \
     MONITOR, PRINTER, UPS, MOUSE
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words
+from storescraper.utils import session_with_proxy
 
 
 class Centrale(Store):
@@ -97,12 +97,12 @@ class Centrale(Store):
         stock = int(
             soup.find('div', 'add-to-cart-container').find('p').text.split()[
                 0])
-        offer_price = Decimal(remove_words(
+        offer_price = Currency.parse(
             soup.find('div', {'style': 'margin-bottom: -12px;'}).text.split()[
-                0]))
-        normal_price = Decimal(remove_words(soup.find('div', {
+                0], 'CLP')
+        normal_price = Currency.parse(soup.find('div', {
             'style': 'margin-bottom: -10px; margin-top:-20px'}).text.split()[
-                                                0]))
+                                                0], 'CLP')
         picture_urls = []
         picture_container = soup.find('div', 'product-thumbnails')
         if picture_container:
@@ -5,9 +5,10 @@ from decimal import Decimal
 
 from bs4 import BeautifulSoup
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words
+from storescraper.utils import session_with_proxy
 
 
 class Claro(Store):
@@ -208,8 +209,8 @@ class Claro(Store):
                     ]
 
                     for prepago_field in prepago_fields:
-                        prepago_price = Decimal(remove_words(
-                            product_json[prepago_field]))
+                        prepago_price = Currency.parse(
+                            product_json[prepago_field], 'CLP')
                         if prepago_price:
                             break
 
@@ -247,8 +248,8 @@ class Claro(Store):
                         plan_name = base_plan_name + plan_suffix
 
                         if plan_data[price_field]:
-                            price = Decimal(remove_words(
-                                plan_data[price_field]))
+                            price = Currency.parse(
+                                plan_data[price_field], 'CLP')
                         else:
                             # Equipo de la otra modalidad (ClaroUp si estamos
                             # scrapeando Claro, Claro si estamos scrapeando
@@ -263,8 +264,8 @@ class Claro(Store):
                             cell_monthly_payment_text = plan_data[
                                 cell_monthly_payment_field]
                             if cell_monthly_payment_text:
-                                cell_monthly_payment = Decimal(remove_words(
-                                    cell_monthly_payment_text))
+                                cell_monthly_payment = Currency.parse(
+                                    cell_monthly_payment_text, 'CLP')
                             else:
                                 # Equipo no tiene la modalidad de pago en
                                 # cuotas
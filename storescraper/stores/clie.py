@@ -1,11 +1,11 @@
 import time
 
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words
+from storescraper.utils import session_with_proxy
 
 
 class Clie(Store):
@@ -127,11 +127,11 @@ class Clie(Store):
 
         offer_price = container.contents[0].split('$')[1]
         offer_price = offer_price.split('IVA')[0]
-        offer_price = Decimal(remove_words(offer_price))
+        offer_price = Currency.parse(offer_price, 'CLP')
 
         normal_price = container.parent.parent.find(
             'td', 'price-normal').contents[0].split('$')[1].split('IVA')[0]
-        normal_price = Decimal(remove_words(normal_price))
+        normal_price = Currency.parse(normal_price, 'CLP')
 
         picture_links = soup.findAll('a', {'rel': 'lightbox[roadtrip]'})
 
@@ -1,10 +1,9 @@
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy,\
-    remove_words, html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class ClimaSeguro(Store):
@@ -55,8 +54,8 @@ class ClimaSeguro(Store):
         else:
             stock = -1
 
-        price = Decimal(remove_words(soup.find(
-            'span', {'id': 'precio_venta_tienda'}).text))
+        price = Currency.parse(soup.find(
+            'span', {'id': 'precio_venta_tienda'}).text, 'CLP')
 
         description = html_to_markdown(str(soup.find('div', {'id': 'home'})))
 
@@ -3,10 +3,10 @@ import urllib
 from bs4 import BeautifulSoup
 from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class Conelectric(Store):
@@ -83,7 +83,7 @@ class Conelectric(Store):
             price = Decimal(0)
         else:
             stock = -1
-            price = Decimal(remove_words(price))
+            price = Currency.parse(price, 'CLP')
 
         description = html_to_markdown(str(soup.find('ul', 'listAtributos')))
 
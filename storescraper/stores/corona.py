@@ -1,4 +1,3 @@
-import json
 import urllib
 
 import re
@@ -7,11 +6,12 @@ from collections import defaultdict
 from bs4 import BeautifulSoup
 from decimal import Decimal, InvalidOperation
 
+from storescraper.currency import Currency
 from storescraper.flixmedia import flixmedia_video_urls
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import remove_words, html_to_markdown, \
-    session_with_proxy
+from storescraper.utils import html_to_markdown, session_with_proxy, \
+    extract_json
 
 
 class Corona(Store):
@@ -156,7 +156,7 @@ class Corona(Store):
                 '$')[-1].split('Con')[0]
 
             try:
-                offer_price = Decimal(remove_words(offer_price_text))
+                offer_price = Currency.parse(offer_price_text, 'CLP')
             except InvalidOperation:
                 pass
 
@@ -173,10 +173,7 @@ class Corona(Store):
 
         # SKUS pricing
 
-        skus_data = re.search(r'var skuJson_0 = ([\S\s]+?);',
-                              page_source).groups()[0]
-
-        skus_data = json.loads(skus_data)
+        skus_data = extract_json(page_source, 'var skuJson_0')
         products = []
 
         for sku_data in skus_data['skus']:
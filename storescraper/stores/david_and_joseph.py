@@ -1,11 +1,10 @@
 from bs4 import BeautifulSoup
-from decimal import Decimal
 from collections import defaultdict
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class DavidAndJoseph(Store):
@@ -73,7 +72,7 @@ class DavidAndJoseph(Store):
 
         if not price_cell:
             price_cell = soup.find('li', 'product-price')
-        price = Decimal(remove_words(price_cell.string.split('$')[1]))
+        price = Currency.parse(price_cell.string.split('$')[1], 'CLP')
 
         description = html_to_markdown(
             str(soup.find('div', {'id': 'tab-description'})))
@@ -3,10 +3,10 @@ import urllib
 from bs4 import BeautifulSoup
 from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class Dell(Store):
@@ -68,7 +68,7 @@ class Dell(Store):
         ]
 
         if price:
-            price = Decimal(remove_words(price.string.split('$')[1]))
+            price = Currency.parse(price.string.split('$')[1], 'CLP')
         else:
             configure_link_image = soup.find(
                 'img', {'alt': 'Configurar y cotizar'})
@@ -81,7 +81,7 @@ class Dell(Store):
                 stock = 0
                 price = Decimal(0)
             else:
-                price = Decimal(remove_words(price.string.split('$')[1]))
+                price = Currency.parse(price.string.split('$')[1], 'CLP')
 
         p = Product(
             name,
@@ -1,10 +1,10 @@
 from bs4 import BeautifulSoup
 from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class Demasled(Store):
@@ -67,8 +67,8 @@ class Demasled(Store):
         else:
             stock = 0
 
-        price = Decimal(remove_words(soup.find(
-            'div', 'precio').find('label').string))
+        price = Currency.parse(soup.find(
+            'div', 'precio').find('label').string, 'CLP')
 
         price *= Decimal('1.19')
         price = price.quantize(0)
@@ -1,7 +1,5 @@
-import json
 import logging
 import urllib
-import re
 
 from decimal import Decimal
 
@@ -9,7 +7,8 @@ from bs4 import BeautifulSoup
 
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import html_to_markdown, session_with_proxy
+from storescraper.utils import html_to_markdown, session_with_proxy, \
+    extract_json
 
 
 class Diunsa(Store):
@@ -61,17 +60,11 @@ class Diunsa(Store):
         response = session.get(url)
         soup = BeautifulSoup(response.text, 'html.parser')
 
-        scripts = soup.findAll('script')
-        product_data = [s for s in scripts if 'var skuJson' in s.text]
+        product_json = extract_json(response.text, 'var skuJson_0')
 
-        if product_data:
-            product_data = product_data[0].text
-        else:
+        if not product_json:
             raise Exception('No Data')
 
-        product_json = json.loads(re.search(
-            r'var skuJson_0 = ([\S\s]+?);', product_data).groups()[0])
-
         name = product_json['name']
         sku = str(product_json['skus'][0]['sku'])
         stock = 0
@@ -1,10 +1,10 @@
 from bs4 import BeautifulSoup
 from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class Eglo(Store):
@@ -67,10 +67,10 @@ class Eglo(Store):
         old_price_container = price_container.find('s')
 
         if old_price_container:
-            old_price = Decimal(remove_words(old_price_container.text))
+            old_price = Currency.parse(old_price_container.text, 'CLP')
             price = (old_price * Decimal('0.9')).quantize(0)
         else:
-            price = Decimal(remove_words(price_container.text))
+            price = Currency.parse(price_container.text, 'CLP')
 
         description = html_to_markdown(str(soup.find('div', 'tab-content')),
                                        'http://www.eglo.cl')
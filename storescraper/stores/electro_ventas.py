@@ -1,5 +1,4 @@
 import logging
-from decimal import Decimal
 
 from bs4 import BeautifulSoup
 
@@ -7,9 +6,10 @@ from storescraper.categories import MOUSE, KEYBOARD, MONITOR, HEADPHONES, \
     MEMORY_CARD, CELL, SOLID_STATE_DRIVE, POWER_SUPPLY, COMPUTER_CASE, \
     VIDEO_CARD, MOTHERBOARD, RAM, PROCESSOR, USB_FLASH_DRIVE, STEREO_SYSTEM, \
     TELEVISION, PRINTER
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words
+from storescraper.utils import session_with_proxy
 
 
 class ElectroVentas(Store):
@@ -103,11 +103,11 @@ class ElectroVentas(Store):
         sku = sku_container.text.split()[1]
         stock = int(
             product_container.find('table', 'table').findAll('td')[3].text)
-        price = Decimal(remove_words(product_container.find('div',
-                                                            'price-n gray '
-                                                            'precio-web-dest '
-                                                            'center-content')
-                                     .find('span').text.strip()))
+        price = Currency.parse(product_container.find('div',
+                                                      'price-n gray '
+                                                      'precio-web-dest '
+                                                      'center-content')
+                               .find('span').text.strip(), 'CLP')
         picture_containers = soup.find('div', 'col col-5 img ')
         if picture_containers:
             picture_urls = [tag['src'] for tag in
@@ -1,18 +1,17 @@
 import logging
 import re
-from decimal import Decimal
 
 import validators
 from bs4 import BeautifulSoup
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
 from storescraper.categories import HEADPHONES, SOLID_STATE_DRIVE, \
     MOUSE, KEYBOARD, CPU_COOLER, COMPUTER_CASE, \
     POWER_SUPPLY, RAM, MONITOR, MOTHERBOARD, \
     PROCESSOR, VIDEO_CARD, STEREO_SYSTEM, STORAGE_DRIVE
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class EliteCenter(Store):
@@ -104,9 +103,8 @@ class EliteCenter(Store):
         else:
             stock = -1
 
-        normal_price = Decimal(
-            remove_words(
-                soup.find('div', 'product-main').findAll('bdi')[-1].text))
+        normal_price = Currency.parse(
+            soup.find('div', 'product-main').findAll('bdi')[-1].text, 'CLP')
         offer_price = normal_price
         picture_urls = [tag['src'].split('?')[0] for tag in
                         soup.find('div', 'product-gallery').findAll('img')
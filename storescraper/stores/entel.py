@@ -6,9 +6,10 @@ from collections import defaultdict
 from bs4 import BeautifulSoup
 from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words
+from storescraper.utils import session_with_proxy
 
 
 class Entel(Store):
@@ -107,7 +108,7 @@ class Entel(Store):
                     'p', 'txt-price').text.replace('/mes', '')
                 # Plan SD costs "24.74324743"
                 price_text = re.search(r'(\d+\.\d{3})', price_text).groups()[0]
-                price = Decimal(remove_words(price_text))
+                price = Currency.parse(price_text, 'CLP')
 
                 products.append(Product(
                     name,
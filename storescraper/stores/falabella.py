@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import re
@@ -5,18 +6,17 @@ import time
 import base64
 
 from collections import defaultdict
-from decimal import Decimal
 from bs4 import BeautifulSoup
-from PIL import Image
 from io import BytesIO
 from html import unescape
 
 from selenium.common.exceptions import NoSuchElementException
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import remove_words, html_to_markdown, \
-    session_with_proxy, CF_REQUEST_HEADERS
+from storescraper.utils import html_to_markdown, session_with_proxy, \
+    shared_async_session_with_proxy, CF_REQUEST_HEADERS, extract_script_json
 from storescraper import banner_sections as bs
 from storescraper.utils import HeadlessChrome
 
@@ -256,10 +256,7 @@ class Falabella(Store):
             if res.status_code == 500:
                 break
 
-            soup = BeautifulSoup(res.text, 'html.parser')
-
-            script = soup.find('script', {'id': '__NEXT_DATA__'})
-            json_data = json.loads(script.text)
+            json_data = extract_script_json(res.text, '__NEXT_DATA__')
 
             for product_data in json_data['props']['pageProps']['results']:
                 product_url = product_data['url']
@@ -299,6 +296,41 @@ class Falabella(Store):
             else:
                 raise Exception('Invalid product type')
 
+    @classmethod
+    async def products_for_url_async(cls, url, category=None,
+                                     extra_args=None):
+        # Same as products_for_url, but the scene7 and bazaarvoice requests
+        # of every SKU are made concurrently. The session is shared by
+        # every URL of the executor
+        session = shared_async_session_with_proxy(extra_args)
+        headers = {'User-Agent': CF_REQUEST_HEADERS['User-Agent']}
+
+        async with session.get(url, timeout=30, headers=headers) as response:
+            if response.status in [404, 500]:
+                return []
+
+            content = (await response.text()).replace('&#10;', '')
+
+        if 'fbra_browseMainProductConfig' in content:
+            skus = [model['skuId'] for model in
+                    cls._new_product_data(content)['skus']]
+            products_for_content = cls._new_products_for_url
+        elif 'NEXT_DATA' in content:
+            product_data = cls._old_product_data(content)
+            skus = [model['id'] for model in
+                    product_data.get('variants', [])]
+            products_for_content = cls._old_products_for_url
+        else:
+            raise Exception('Invalid product type')
+
+        sku_resources = await asyncio.gather(
+            *[cls._get_sku_resources_async(session, sku, headers)
+              for sku in skus])
+
+        return products_for_content(
+            url, content, None, category=category, extra_args=extra_args,
+            sku_resources=dict(zip(skus, sku_resources)))
+
     @classmethod
     def _get_product_urls(cls, session, category_id, extra_query_params):
         discovered_urls = []
@@ -336,10 +368,11 @@ class Falabella(Store):
 
     @classmethod
     def _new_products_for_url(
-            cls, url, content, session, category=None, extra_args=None):
-        product_data = json.loads(re.search(
-            r'var fbra_browseMainProductConfig = ([\S\s]+?);\r\n',
-            content).groups()[0])['state']['product']
+            cls, url, content, session, category=None, extra_args=None,
+            sku_resources=None):
+        # sku_resources: optional dict of the already fetched
+        # (picture_urls, review_count, review_avg_score) of each SKU
+        product_data = cls._new_product_data(content)
 
         publication_id = product_data['id']
         brand = product_data['brand'] or 'Genérico'
@@ -369,15 +402,15 @@ class Falabella(Store):
             for key in normal_price_keys:
                 if key not in prices:
                     continue
-                normal_price = Decimal(
-                    remove_words(prices[key]['originalPrice']))
+                normal_price = Currency.parse(
+                    prices[key]['originalPrice'], 'CLP')
                 break
 
             for key in offer_price_keys:
                 if key not in prices:
                     continue
-                offer_price = Decimal(
-                    remove_words(prices[key]['originalPrice']))
+                offer_price = Currency.parse(
+                    prices[key]['originalPrice'], 'CLP')
 
             if not offer_price:
                 offer_price = normal_price
@@ -386,31 +419,16 @@ class Falabella(Store):
                 normal_price = offer_price
 
             stock = model['stockAvailable']
-            picture_urls = cls._get_picture_urls(session, model['skuId'])
-
-            # TODO: Video Urls
-
-            # REVIEWS
-            reviews_url = 'https://api.bazaarvoice.com/data/reviews.json?' \
-                          'apiversion=5.4&passkey=mk9fosfh4vxv20y8u5pcbwipl&' \
-                          'Filter=ProductId:{}&Include=Products&Stats=Reviews'\
-                .format(sku)
-
-            review_data = json.loads(session.get(reviews_url).text)
-            review_count = review_data['TotalResults']
 
-            review_stats = review_data['Includes']
-
-            if 'Products' in review_stats:
-                if str(sku) not in review_stats['Products'].keys():
-                    key = list(review_stats['Products'].keys())[0]
-                    review_avg_score = review_stats['Products'][key][
-                        'ReviewStatistics']['AverageOverallRating']
-                else:
-                    review_avg_score = review_stats['Products'][str(sku)][
-                        'ReviewStatistics']['AverageOverallRating']
+            if sku_resources:
+                picture_urls, review_count, review_avg_score = \
+                    sku_resources[sku]
             else:
-                review_avg_score = None
+                picture_urls = cls._get_picture_urls(session, sku)
+                review_count, review_avg_score = cls._get_review_stats(
+                    session, sku)
+
+            # TODO: Video Urls
 
             # CONDITION
             if 'reacondicionado' in base_name.lower():
@@ -443,12 +461,11 @@ class Falabella(Store):
 
     @classmethod
     def _old_products_for_url(
-            cls, url, content, session,  category=None, extra_args=None):
+            cls, url, content, session,  category=None, extra_args=None,
+            sku_resources=None):
+        # See _new_products_for_url for sku_resources
         soup = BeautifulSoup(content, 'html.parser')
-
-        product_data = json.loads(
-            soup.find('script', {'id': '__NEXT_DATA__'}).text)[
-            'props']['pageProps']['productData']
+        product_data = cls._old_product_data(content)
 
         description = ''
 
@@ -511,7 +528,7 @@ class Falabella(Store):
             for key in normal_price_keys:
                 if key not in prices:
                     continue
-                normal_price = Decimal(remove_words(prices[key]['price'][0]))
+                normal_price = Currency.parse(prices[key]['price'][0], 'CLP')
                 if normal_price.is_finite():
                     break
                 else:
@@ -520,7 +537,7 @@ class Falabella(Store):
             for key in offer_price_keys:
                 if key not in prices:
                     continue
-                offer_price = Decimal(remove_words(prices[key]['price'][0]))
+                offer_price = Currency.parse(prices[key]['price'][0], 'CLP')
                 if offer_price.is_finite():
                     break
                 else:
@@ -543,26 +560,13 @@ class Falabella(Store):
                 if availability['shippingOptionType'] == 'All':
                     stock = availability['quantity']
 
-            reviews_url = 'https://api.bazaarvoice.com/data/reviews.json?' \
-                          'apiversion=5.4&passkey=mk9fosfh4vxv20y8u5pcbwipl&' \
-                          'Filter=ProductId:{}&Include=Products&Stats=Reviews'\
-                .format(sku)
-
-            review_data = json.loads(session.get(reviews_url).text)
-            review_count = review_data['TotalResults']
-
-            review_stats = review_data['Includes']
-
-            if 'Products' in review_stats:
-                if str(sku) not in review_stats['Products'].keys():
-                    key = list(review_stats['Products'].keys())[0]
-                    review_avg_score = review_stats['Products'][key][
-                        'ReviewStatistics']['AverageOverallRating']
-                else:
-                    review_avg_score = review_stats['Products'][str(sku)][
-                        'ReviewStatistics']['AverageOverallRating']
+            if sku_resources:
+                picture_urls, review_count, review_avg_score = \
+                    sku_resources[sku]
             else:
-                review_avg_score = None
+                picture_urls = cls._get_picture_urls(session, sku)
+                review_count, review_avg_score = cls._get_review_stats(
+                    session, sku)
 
             if 'reacondicionado' in base_name.lower():
                 condition = 'https://schema.org/RefurbishedCondition'
@@ -574,8 +578,6 @@ class Falabella(Store):
                     model['offerings'][0]['sellerId'] != 'FALABELLA':
                 seller = model['offerings'][0]['sellerId']
 
-            picture_urls = cls._get_picture_urls(session, model['id'])
-
             p = Product(
                 '{} ({})'.format(base_name, model['name'])[0: 256],
                 cls.__name__,
@@ -603,6 +605,9 @@ class Falabella(Store):
 
     @classmethod
     def banners(cls, extra_args=None):
+        # Only needed for the screenshots of the banners
+        from PIL import Image
+
         base_url = 'https://www.falabella.com/falabella-cl/{}'
 
         sections_data = [
@@ -699,9 +704,8 @@ class Falabella(Store):
                 session = session_with_proxy(extra_args)
                 session.headers['User-Agent'] = CF_REQUEST_HEADERS[
                     'User-Agent']
-                soup = BeautifulSoup(session.get(url).text, 'html.parser')
-                next_data = json.loads(soup.find(
-                    'script', {'id': '__NEXT_DATA__'}).text)
+                next_data = extract_script_json(session.get(url).text,
+                                                '__NEXT_DATA__')
 
                 for container in \
                         next_data['props']['pageProps']['page']['containers']:
@@ -827,9 +831,12 @@ class Falabella(Store):
 
     @classmethod
     def _get_picture_urls(cls, session, product_id):
-        pictures_resource_url = 'https://falabella.scene7.com/is/image/' \
-                                'Falabella/{}?req=set,json'.format(product_id)
+        pictures_resource_url = cls._pictures_resource_url(product_id)
         pictures_response = session.get(pictures_resource_url, timeout=30).text
+        return cls._parse_picture_urls(pictures_response)
+
+    @classmethod
+    def _parse_picture_urls(cls, pictures_response):
         pictures_json = json.loads(
             re.search(r's7jsonResponse\((.+),""\);',
                       pictures_response).groups()[0])
@@ -847,3 +854,66 @@ class Falabella(Store):
             picture_urls.append(picture_url)
 
         return picture_urls
+
+    @classmethod
+    def _pictures_resource_url(cls, product_id):
+        return 'https://falabella.scene7.com/is/image/Falabella/{}?' \
+               'req=set,json'.format(product_id)
+
+    @classmethod
+    def _reviews_url(cls, sku):
+        return 'https://api.bazaarvoice.com/data/reviews.json?' \
+               'apiversion=5.4&passkey=mk9fosfh4vxv20y8u5pcbwipl&' \
+               'Filter=ProductId:{}&Include=Products&Stats=Reviews'.format(sku)
+
+    @classmethod
+    def _get_review_stats(cls, session, sku):
+        review_data = json.loads(session.get(cls._reviews_url(sku)).text)
+        return cls._parse_review_stats(review_data, sku)
+
+    @classmethod
+    def _parse_review_stats(cls, review_data, sku):
+        review_count = review_data['TotalResults']
+
+        review_stats = review_data['Includes']
+
+        if 'Products' in review_stats:
+            if str(sku) not in review_stats['Products'].keys():
+                key = list(review_stats['Products'].keys())[0]
+                review_avg_score = review_stats['Products'][key][
+                    'ReviewStatistics']['AverageOverallRating']
+            else:
+                review_avg_score = review_stats['Products'][str(sku)][
+                    'ReviewStatistics']['AverageOverallRating']
+        else:
+            review_avg_score = None
+
+        return review_count, review_avg_score
+
+    @classmethod
+    async def _get_sku_resources_async(cls, session, sku, headers):
+        async def fetch(resource_url, **kwargs):
+            async with session.get(resource_url, headers=headers,
+                                   **kwargs) as response:
+                return await response.text()
+
+        pictures_response, reviews_response = await asyncio.gather(
+            fetch(cls._pictures_resource_url(sku), timeout=30),
+            fetch(cls._reviews_url(sku)))
+
+        review_count, review_avg_score = cls._parse_review_stats(
+            json.loads(reviews_response), sku)
+
+        return cls._parse_picture_urls(pictures_response), review_count, \
+            review_avg_score
+
+    @classmethod
+    def _new_product_data(cls, content):
+        return json.loads(re.search(
+            r'var fbra_browseMainProductConfig = ([\S\s]+?);\r\n',
+            content).groups()[0])['state']['product']
+
+    @classmethod
+    def _old_product_data(cls, content):
+        return extract_script_json(content, '__NEXT_DATA__')[
+            'props']['pageProps']['productData']
@@ -1,16 +1,15 @@
 import json
 import urllib
 from collections import OrderedDict
-from decimal import Decimal
 
 import re
 
 from bs4 import BeautifulSoup
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import remove_words, html_to_markdown, \
-    session_with_proxy
+from storescraper.utils import html_to_markdown, session_with_proxy
 
 
 class FalabellaArgentina(Store):
@@ -154,14 +153,14 @@ class FalabellaArgentina(Store):
             if lookup_field not in prices[3]:
                 lookup_field = 'formattedLowestPrice'
 
-            normal_price = Decimal(remove_words(prices[3][lookup_field]))
+            normal_price = Currency.parse(prices[3][lookup_field], 'ARS')
 
             if 1 in prices:
                 lookup_field = 'originalPrice'
                 if lookup_field not in prices[1]:
                     lookup_field = 'formattedLowestPrice'
-                offer_price = Decimal(
-                    remove_words(prices[1][lookup_field]))
+                offer_price = Currency.parse(
+                    prices[1][lookup_field], 'ARS')
             else:
                 offer_price = normal_price
 
@@ -4,14 +4,13 @@ import base64
 
 from decimal import Decimal
 from bs4 import BeautifulSoup
-from PIL import Image
 from io import BytesIO
 
 from selenium.common.exceptions import NoSuchElementException
 
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy
+from storescraper.utils import session_with_proxy, extract_script_json
 from storescraper import banner_sections as bs
 from storescraper.utils import HeadlessChrome
 
@@ -400,10 +399,7 @@ class FalabellaCf(Store):
             if res.status_code == 500:
                 break
 
-            soup = BeautifulSoup(res.text, 'html.parser')
-
-            script = soup.find('script', {'id': '__NEXT_DATA__'})
-            json_data = json.loads(script.text)
+            json_data = extract_script_json(res.text, '__NEXT_DATA__')
 
             for product_data in json_data['props']['pageProps']['results']:
                 product_url = product_data['url']
@@ -418,6 +414,9 @@ class FalabellaCf(Store):
 
     @classmethod
     def banners(cls, extra_args=None):
+        # Only needed for the screenshots of the banners
+        from PIL import Image
+
         base_url = 'https://www.falabella.com/falabella-cl/{}'
 
         sections_data = [
@@ -1,12 +1,11 @@
 import json
 import logging
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.stores import Falabella
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import \
-    remove_words, session_with_proxy, CF_REQUEST_HEADERS
+from storescraper.utils import session_with_proxy, CF_REQUEST_HEADERS
 
 
 class FalabellaFast(Store):
@@ -138,15 +137,15 @@ class FalabellaFast(Store):
 
         for price in prices:
             if price['label'] == '(Oferta)':
-                normal_price = Decimal(remove_words(price['price'][0]))
+                normal_price = Currency.parse(price['price'][0], 'CLP')
                 break
             if price['icons'] == 'cmr-icon':
                 continue
-            normal_price = Decimal(remove_words(price['price'][0]))
+            normal_price = Currency.parse(price['price'][0], 'CLP')
 
         for price in prices:
             if price['icons'] == 'cmr-icon':
-                offer_price = Decimal(remove_words(price['price'][0]))
+                offer_price = Currency.parse(price['price'][0], 'CLP')
 
         if not normal_price:
             normal_price = offer_price
@@ -1,7 +1,6 @@
 import html
 import json
 import logging
-from decimal import Decimal
 
 from bs4 import BeautifulSoup
 
@@ -9,9 +8,10 @@ from storescraper.categories import PROCESSOR, MOTHERBOARD, RAM, \
     SOLID_STATE_DRIVE, NOTEBOOK, COMPUTER_CASE, CPU_COOLER, MONITOR, \
     VIDEO_CARD, STEREO_SYSTEM, MOUSE, KEYBOARD, HEADPHONES, \
     EXTERNAL_STORAGE_DRIVE, STORAGE_DRIVE, USB_FLASH_DRIVE
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words
+from storescraper.utils import session_with_proxy
 
 
 class FiestaLan(Store):
@@ -94,8 +94,8 @@ class FiestaLan(Store):
                 soup.find('script', {'type': 'application/ld+json'}).text))[
                           '@graph'][1]['sku'])
         stock = -1 if soup.find('p', 'stock').text == 'Hay existencias' else 0
-        price = Decimal(
-            remove_words(soup.find('p', 'price').findAll('bdi')[-1].text))
+        price = Currency.parse(
+            soup.find('p', 'price').findAll('bdi')[-1].text, 'CLP')
         picture_containers = soup.find('div', 'woocommerce-product-gallery') \
             .findAll('img')
         picture_urls = [tag['src'] for tag in picture_containers]
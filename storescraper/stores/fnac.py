@@ -1,12 +1,10 @@
-import json
-import re
 from bs4 import BeautifulSoup
 from decimal import Decimal
 
 from storescraper.product import Product
 from storescraper.store import Store
 from storescraper.utils import session_with_proxy, html_to_markdown, \
-    check_ean13
+    check_ean13, extract_json
 
 
 class Fnac(Store):
@@ -64,13 +62,9 @@ class Fnac(Store):
 
         page_source = response.text
 
-        pricing_data = re.search(r'vtex.events.addData\(([\S\s]+?)\);',
-                                 page_source).groups()[0]
-        pricing_data = json.loads(pricing_data)
+        pricing_data = extract_json(page_source, 'vtex.events.addData(')
 
-        skus_data = re.search(r'var skuJson_0 = ([\S\s]+?);',
-                              page_source).groups()[0]
-        skus_data = json.loads(skus_data)
+        skus_data = extract_json(page_source, 'var skuJson_0')
         name = '{} {}'.format(pricing_data['productBrandName'],
                               pricing_data['productName'])
         price = Decimal(pricing_data['productPriceTo'])
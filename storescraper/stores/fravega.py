@@ -1,14 +1,12 @@
-import json
 import urllib
 
-import re
 from bs4 import BeautifulSoup
 from decimal import Decimal
 
 from storescraper.product import Product
 from storescraper.store import Store
 from storescraper.utils import session_with_proxy, html_to_markdown, \
-    check_ean13
+    check_ean13, extract_json, listing_soup
 
 
 class Fravega(Store):
@@ -60,8 +58,7 @@ class Fravega(Store):
                                '39063&cc=3&sm=0&PageNumber={}'.\
                     format(urllib.parse.quote(category_path, safe=''), page)
 
-                soup = BeautifulSoup(session.get(category_url).text,
-                                     'html.parser')
+                soup = listing_soup(session.get(category_url).text, 'li')
                 containers = soup.findAll('li')[::2]
 
                 if not containers:
@@ -87,13 +84,9 @@ class Fravega(Store):
             return []
 
         page_source = response.text
-        pricing_data = re.search(r'vtex.events.addData\(([\S\s]+?)\);',
-                                 page_source).groups()[0]
-        pricing_data = json.loads(pricing_data)
+        pricing_data = extract_json(page_source, 'vtex.events.addData(')
 
-        skus_data = re.search(r'var skuJson_0 = ([\S\s]+?);',
-                              page_source).groups()[0]
-        skus_data = json.loads(skus_data)
+        skus_data = extract_json(page_source, 'var skuJson_0')
         name = '{} {}'.format(pricing_data['productBrandName'],
                               pricing_data['productName'])
         price = Decimal(pricing_data['productPriceTo'])
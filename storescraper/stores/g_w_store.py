@@ -1,14 +1,14 @@
 import json
 import logging
-from decimal import Decimal
 
 from bs4 import BeautifulSoup
 
 from storescraper.categories import SOLID_STATE_DRIVE, HEADPHONES, \
     COMPUTER_CASE, RAM, PROCESSOR, VIDEO_CARD, MOTHERBOARD
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words
+from storescraper.utils import session_with_proxy
 
 
 class GWStore(Store):
@@ -74,7 +74,7 @@ class GWStore(Store):
                 stock_container.text.split()[0])
         else:
             stock = -1
-        price = Decimal(remove_words(soup.findAll('bdi')[-1].text))
+        price = Currency.parse(soup.findAll('bdi')[-1].text, 'CLP')
         picture_urls = [tag['src'] for tag in
                         soup.find('div', 'woocommerce-tabs').findAll('img')]
         p = Product(
@@ -1,13 +1,13 @@
 import logging
-from decimal import Decimal
 
 from bs4 import BeautifulSoup
 
 from storescraper.categories import PROCESSOR, MOTHERBOARD, \
     SOLID_STATE_DRIVE, RAM, CPU_COOLER
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words
+from storescraper.utils import session_with_proxy
 
 
 class GameMasters(Store):
@@ -89,8 +89,8 @@ class GameMasters(Store):
                     0].strip()
                 sku = product['value']
                 variant_url = url + '?variant=' + sku
-                price = Decimal(
-                    remove_words(product.text.split('-')[1].strip()))
+                price = Currency.parse(
+                    product.text.split('-')[1].strip(), 'CLP')
                 p = Product(
                     variant_name,
                     cls.__name__,
@@ -111,10 +111,10 @@ class GameMasters(Store):
         else:
             sku = soup.find('span', 'stamped-product-reviews-badge '
                                     'stamped-main-badge')['data-id']
-            price = Decimal(remove_words(
+            price = Currency.parse(
                 soup.find('span',
                           {'id': 'productPrice-product-template'}).find(
-                    'span').text))
+                    'span').text, 'CLP')
 
             p = Product(
                 name,
@@ -1,15 +1,15 @@
 import logging
 import re
-from decimal import Decimal
 
 from bs4 import BeautifulSoup
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
 from storescraper.categories import RAM, PROCESSOR, MOUSE, SOLID_STATE_DRIVE, \
     MONITOR, KEYBOARD, HEADPHONES, MOTHERBOARD, POWER_SUPPLY, CELL, \
     VIDEO_CARD, COMPUTER_CASE
-from storescraper.utils import session_with_proxy, remove_words
+from storescraper.utils import session_with_proxy
 
 
 class GamesLegends(Store):
@@ -96,8 +96,8 @@ class GamesLegends(Store):
         else:
             stock = -1
 
-        price = Decimal(remove_words(
-            soup.find('span', 'product-form-price form-price').text))
+        price = Currency.parse(
+            soup.find('span', 'product-form-price form-price').text, 'CLP')
         picture_containers = soup.find('div', 'owl-thumbs')
         if picture_containers:
             picture_urls = [tag['src'].split('?')[0] for tag in
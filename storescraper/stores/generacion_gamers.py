@@ -1,4 +1,3 @@
-import json
 import logging
 from decimal import Decimal
 
@@ -8,7 +7,7 @@ from storescraper.categories import MOUSE, COMPUTER_CASE, HEADPHONES, \
     MONITOR, KEYBOARD
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy
+from storescraper.utils import session_with_proxy, extract_ld_json
 
 
 class GeneracionGamers(Store):
@@ -60,12 +59,8 @@ class GeneracionGamers(Store):
         print(url)
         session = session_with_proxy(extra_args)
         response = session.get(url)
-        soup = BeautifulSoup(response.text, 'html.parser')
-        product_container = soup.find('script',
-                                      {'type': 'application/ld+json'})
-        if product_container:
-            product_container = json.loads(product_container.text)
-        else:
+        product_container = extract_ld_json(response.text)
+        if not product_container:
             return []
         name = product_container['name']
         sku = str(product_container['sku'])
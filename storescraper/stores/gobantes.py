@@ -1,10 +1,9 @@
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class Gobantes(Store):
@@ -74,8 +73,8 @@ class Gobantes(Store):
         picture_urls = [tag['href'].replace(' ', '%20') for tag in
                         soup.findAll('a', 'colorbox')]
 
-        price = Decimal(remove_words(soup.find(
-            'div', 'price').text.split(':')[1]))
+        price = Currency.parse(soup.find(
+            'div', 'price').text.split(':')[1], 'CLP')
 
         price = price.quantize(0)
 
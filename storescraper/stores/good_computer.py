@@ -1,14 +1,14 @@
 import logging
-from decimal import Decimal
 
 from bs4 import BeautifulSoup
 
 from storescraper.categories import VIDEO_CARD, PROCESSOR, MOTHERBOARD, RAM, \
     STORAGE_DRIVE, SOLID_STATE_DRIVE, COMPUTER_CASE, POWER_SUPPLY, \
     CPU_COOLER, MONITOR, KEYBOARD, MOUSE, KEYBOARD_MOUSE_COMBO, HEADPHONES
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words
+from storescraper.utils import session_with_proxy
 
 
 class GoodComputer(Store):
@@ -90,9 +90,9 @@ class GoodComputer(Store):
         if not price_container.text.strip():
             return []
         if not price_container.find('ins'):
-            price = Decimal(remove_words(price_container.text))
+            price = Currency.parse(price_container.text, 'CLP')
         else:
-            price = Decimal(remove_words(price_container.find('ins').text))
+            price = Currency.parse(price_container.find('ins').text, 'CLP')
         picture_urls = [tag['src'].split('?')[0] for tag in
                         soup.find('div', 'product-images-inner').findAll(
                             'img')
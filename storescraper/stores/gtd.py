@@ -3,10 +3,10 @@ import re
 
 from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class Gtd(Store):
@@ -63,7 +63,7 @@ class Gtd(Store):
 
                 name = json_product['name']
                 sku = json_product['id']
-                price = Decimal(remove_words(json_product['leasing_price']))
+                price = Currency.parse(json_product['leasing_price'], 'CLP')
                 description = html_to_markdown(json_product['description'])
 
                 picture_urls = [
@@ -8,9 +8,10 @@ from bs4 import BeautifulSoup
 from storescraper.categories import HEADPHONES, COMPUTER_CASE, POWER_SUPPLY, \
     RAM, MONITOR, MOUSE, VIDEO_CARD, PROCESSOR, MOTHERBOARD, \
     KEYBOARD, CPU_COOLER, SOLID_STATE_DRIVE
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words
+from storescraper.utils import session_with_proxy
 
 
 class HardGaming(Store):
@@ -139,8 +140,8 @@ class HardGaming(Store):
             else:
                 stock = -1
 
-            price = Decimal(
-                remove_words(soup.find('span', 'product-form_price').text))
+            price = Currency.parse(
+                soup.find('span', 'product-form_price').text, 'CLP')
 
             return [Product(
                 base_name,
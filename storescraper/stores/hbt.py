@@ -1,10 +1,9 @@
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, html_to_markdown, \
-    remove_words
+from storescraper.utils import session_with_proxy, html_to_markdown
 from storescraper.categories import OVEN
 
 
@@ -71,8 +70,8 @@ class Hbt(Store):
         if not price_container:
             price_container = price_block.find('span', 'regular-price')
 
-        price = Decimal(remove_words(price_container.find(
-            'span', 'price').text))
+        price = Currency.parse(price_container.find(
+            'span', 'price').text, 'CLP')
         description = html_to_markdown(str(soup.find('div', 'p-text')))
 
         gallery = soup.find('div', {'id': 'amasty_gallery'})
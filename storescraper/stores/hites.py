@@ -11,7 +11,8 @@ from decimal import Decimal
 from storescraper.flixmedia import flixmedia_video_urls
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, HeadlessChrome
+from storescraper.utils import session_with_proxy, HeadlessChrome, \
+    listing_soup
 from storescraper import banner_sections as bs
 
 
@@ -218,7 +219,7 @@ class Hites(Store):
                 if response.status_code in [404, 500]:
                     break
 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = listing_soup(response.text, 'div', 'product-tile')
 
                 products = soup.findAll('div', 'product-tile')
 
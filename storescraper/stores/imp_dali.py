@@ -1,10 +1,10 @@
 from bs4 import BeautifulSoup
 from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class ImpDali(Store):
@@ -65,7 +65,7 @@ class ImpDali(Store):
         description = html_to_markdown(
             str(soup.find('div', 'product_description')))
         picture_urls = [tag['href'] for tag in soup.findAll('a', 'thickbox')]
-        price = Decimal(remove_words(soup.find('span', 'currentprice').text))
+        price = Currency.parse(soup.find('span', 'currentprice').text, 'CLP')
 
         price *= Decimal('1.19')
         price = price.quantize(0)
@@ -1,12 +1,11 @@
 import re
 
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import remove_words, html_to_markdown, \
-    session_with_proxy
+from storescraper.utils import html_to_markdown, session_with_proxy
 
 
 class InforIngen(Store):
@@ -112,8 +111,8 @@ class InforIngen(Store):
         price_containers = pricing_container.find(
             'img', {'align': 'absmiddle'}).parent.findAll('h2')
 
-        normal_price = Decimal(remove_words(price_containers[1].text))
-        offer_price = Decimal(remove_words(price_containers[2].text))
+        normal_price = Currency.parse(price_containers[1].text, 'CLP')
+        offer_price = Currency.parse(price_containers[2].text, 'CLP')
 
         if offer_price > normal_price:
             offer_price = normal_price
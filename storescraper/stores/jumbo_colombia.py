@@ -1,5 +1,3 @@
-import json
-import re
 import urllib
 
 from bs4 import BeautifulSoup
@@ -8,7 +6,7 @@ from decimal import Decimal
 from storescraper.product import Product
 from storescraper.store import Store
 from storescraper.utils import session_with_proxy, html_to_markdown, \
-    check_ean13
+    check_ean13, extract_json
 
 
 class JumboColombia(Store):
@@ -73,13 +71,9 @@ class JumboColombia(Store):
         session = session_with_proxy(extra_args)
         page_source = session.get(url).text
 
-        pricing_data = re.search(r'vtex.events.addData\(([\S\s]+?)\);',
-                                 page_source).groups()[0]
-        pricing_data = json.loads(pricing_data)
+        pricing_data = extract_json(page_source, 'vtex.events.addData(')
 
-        skus_data = re.search(r'var skuJson_0 = ([\S\s]+?);CATALOG',
-                              page_source).groups()[0]
-        skus_data = json.loads(skus_data)
+        skus_data = extract_json(page_source, 'var skuJson_0')
         name = '{} {}'.format(pricing_data['productBrandName'],
                               pricing_data['productName'])
         price = Decimal(pricing_data['productPriceTo'])
@@ -1,14 +1,14 @@
 import logging
-from decimal import Decimal
 
 from bs4 import BeautifulSoup
 
 from storescraper.categories import PRINTER, MOTHERBOARD, PROCESSOR, RAM, \
     SOLID_STATE_DRIVE, VIDEO_CARD, MONITOR, KEYBOARD_MOUSE_COMBO, \
     COMPUTER_CASE, EXTERNAL_STORAGE_DRIVE, POWER_SUPPLY
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words
+from storescraper.utils import session_with_proxy
 
 
 class KillStore(Store):
@@ -82,7 +82,7 @@ class KillStore(Store):
         soup = BeautifulSoup(response.text, 'html.parser')
         name = soup.find('meta', {'property': 'og:name_product'})['content']
         sku = soup.find('meta', {'property': 'og:id_product'})['content']
-        price_container = list(map(lambda x: Decimal(remove_words(x.text)),
+        price_container = list(map(lambda x: Currency.parse(x.text, 'CLP'),
                                    soup.find('div', 'current-price').findAll(
                                        'span', 'price')))
         normal_price = max(price_container)
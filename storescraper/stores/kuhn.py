@@ -1,10 +1,9 @@
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class Kuhn(Store):
@@ -78,11 +77,12 @@ class Kuhn(Store):
         else:
             stock = 0
 
-        normal_price = Decimal(remove_words(
-            soup.find('p', 'old-price').find('span', 'price').string))
+        normal_price = Currency.parse(
+            soup.find('p', 'old-price').find('span', 'price').string, 'CLP')
 
-        offer_price = Decimal(remove_words(
-            soup.find('p', 'special-price').find('span', 'price').string))
+        offer_price = Currency.parse(
+            soup.find('p', 'special-price').find('span', 'price').string,
+            'CLP')
 
         description = html_to_markdown(
             str(soup.find('div', 'short-description')))
@@ -1,10 +1,10 @@
 from bs4 import BeautifulSoup
-from decimal import Decimal, InvalidOperation
+from decimal import InvalidOperation
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class LedShop(Store):
@@ -85,11 +85,11 @@ class LedShop(Store):
             stock = 0
 
         try:
-            price = Decimal(remove_words(soup.find(
-                'div', 'wpsc_product_price').span.text))
+            price = Currency.parse(soup.find(
+                'div', 'wpsc_product_price').span.text, 'CLP')
         except InvalidOperation:
-            price = Decimal(remove_words(soup.find(
-                'div', 'wpsc_product_price').findAll('span')[1].text))
+            price = Currency.parse(soup.find(
+                'div', 'wpsc_product_price').findAll('span')[1].text, 'CLP')
 
         price = price.quantize(0)
 
@@ -1,10 +1,10 @@
 from bs4 import BeautifulSoup
 from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import remove_words, html_to_markdown, \
-    session_with_proxy
+from storescraper.utils import html_to_markdown, session_with_proxy
 
 
 class Lenovo(Store):
@@ -129,13 +129,13 @@ class Lenovo(Store):
                 price_tag = soup.find('meta', {'name': 'productprice'})
 
             if not price_tag:
-                price = Decimal(remove_words(
+                price = Currency.parse(
                     soup.find('dd',
                               'saleprice pricingSummary-details-final-price')
-                        .text.split(',')[0]))
+                        .text.split(',')[0], 'CLP')
             else:
-                price = Decimal(remove_words(price_tag['content']
-                                             .split(',')[0]))
+                price = Currency.parse(price_tag['content']
+                                       .split(',')[0], 'CLP')
 
             description = html_to_markdown(str(soup.find(
                 'div', 'configuratorItem-accordion-content')))
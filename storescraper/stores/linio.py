@@ -4,10 +4,11 @@ import re
 from bs4 import BeautifulSoup
 from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
 from storescraper.utils import session_with_proxy, html_to_markdown, \
-    check_ean13, remove_words
+    check_ean13
 
 
 class Linio(Store):
@@ -115,7 +116,8 @@ class Linio(Store):
                 'span', 'price-promotional')
 
             if offer_price_container:
-                offer_price = Decimal(remove_words(offer_price_container.text))
+                offer_price = Currency.parse(offer_price_container.text,
+                                             cls.currency)
                 if offer_price > normal_price:
                     offer_price = normal_price
             else:
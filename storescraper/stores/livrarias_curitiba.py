@@ -1,14 +1,12 @@
-import json
 import urllib
 
-import re
 from bs4 import BeautifulSoup
 from decimal import Decimal
 
 from storescraper.product import Product
 from storescraper.store import Store
 from storescraper.utils import session_with_proxy, html_to_markdown, \
-    check_ean13
+    check_ean13, extract_json
 
 
 class LivrariasCuritiba(Store):
@@ -71,13 +69,9 @@ class LivrariasCuritiba(Store):
         session = session_with_proxy(extra_args)
         page_source = session.get(url).text
 
-        pricing_data = re.search(r'vtex.events.addData\(([\S\s]+?)\);',
-                                 page_source).groups()[0]
-        pricing_data = json.loads(pricing_data)
+        pricing_data = extract_json(page_source, 'vtex.events.addData(')
 
-        skus_data = re.search(r'var skuJson_0 = ([\S\s]+?);',
-                              page_source).groups()[0]
-        skus_data = json.loads(skus_data)
+        skus_data = extract_json(page_source, 'var skuJson_0')
         name = '{} {}'.format(pricing_data['productBrandName'],
                               pricing_data['productName'])
         price = Decimal(pricing_data['productPriceTo'])
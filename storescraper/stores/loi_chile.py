@@ -1,13 +1,13 @@
 import logging
-from decimal import Decimal
 
 from bs4 import BeautifulSoup
 
 from storescraper.categories import MONITOR, HEADPHONES, STEREO_SYSTEM, \
     MOUSE, NOTEBOOK, TABLET
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words
+from storescraper.utils import session_with_proxy
 
 
 class LoiChile(Store):
@@ -64,7 +64,7 @@ class LoiChile(Store):
         name = soup.find('h1', 'nombre-producto-info').text.replace('\t', '') \
             .replace('\n', '')
         sku = soup.find('span', {'id': 'idProducto'}).text
-        price = Decimal(remove_words(soup.find('div', 'pv3-pv-loi').text))
+        price = Currency.parse(soup.find('div', 'pv3-pv-loi').text, 'CLP')
         picture_urls = [
             'https://d660b7b9o0mxk.cloudfront.net/_img_productos/' +
             tag['src'].split('_img_productos/')[1] for tag in
@@ -5,10 +5,10 @@ from collections import defaultdict
 from bs4 import BeautifulSoup
 from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class MacOnline(Store):
@@ -96,7 +96,7 @@ class MacOnline(Store):
                 stock = sum(json.loads(
                     json_product['stock_locations']).values())
 
-                price = Decimal(remove_words(json_product['price']))
+                price = Currency.parse(json_product['price'], 'CLP')
 
                 picture_tag = soup.find('li', 'tmb-' + sku)
                 if picture_tag:
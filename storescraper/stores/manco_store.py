@@ -1,15 +1,15 @@
 import json
 import logging
-from decimal import Decimal
 
 from bs4 import BeautifulSoup
 
 from storescraper.categories import COMPUTER_CASE, VIDEO_CARD, PROCESSOR, \
     MOTHERBOARD, RAM, SOLID_STATE_DRIVE, POWER_SUPPLY, CPU_COOLER, KEYBOARD, \
     MOUSE
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words
+from storescraper.utils import session_with_proxy
 
 
 class MancoStore(Store):
@@ -85,8 +85,8 @@ class MancoStore(Store):
         name = product_json['name']
         sku = str(product_json['id'])
         stock = product_json['quantity']
-        price = Decimal(
-            remove_words(product_json['price'].replace('\xa0', '')))
+        price = Currency.parse(
+            product_json['price'].replace('\xa0', ''), 'CLP')
         picture_urls = [tag['src'] for tag in soup.find('ul', 'product-images '
                                                               'js-qv-product'
                                                               '-images'
@@ -1,13 +1,13 @@
 import logging
-from decimal import Decimal
 
 from bs4 import BeautifulSoup
 
 from storescraper.categories import PROCESSOR, MOTHERBOARD, VIDEO_CARD, RAM, \
     SOLID_STATE_DRIVE, COMPUTER_CASE, MONITOR, KEYBOARD
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words
+from storescraper.utils import session_with_proxy
 
 
 class MegaBytes(Store):
@@ -85,16 +85,16 @@ class MegaBytes(Store):
         sku = soup.find('button', 'single_add_to_cart_button button alt')[
             'value']
         stock = -1
-        offer_price = Decimal(remove_words(soup.find('p', 'price').text))
+        offer_price = Currency.parse(soup.find('p', 'price').text, 'CLP')
         price_container = soup.find('div',
                                     'woocommerce-product-details__short'
                                     '-description')
         if price_container and price_container.find('strong'):
-            normal_price = Decimal(
-                remove_words(price_container.find('strong').text))
+            normal_price = Currency.parse(
+                price_container.find('strong').text, 'CLP')
         elif price_container and price_container.find('span'):
-            normal_price = Decimal(
-                remove_words(price_container.find('span').text))
+            normal_price = Currency.parse(
+                price_container.find('span').text, 'CLP')
         else:
             normal_price = offer_price
 
@@ -1,4 +1,3 @@
-import json
 import urllib
 
 import re
@@ -8,7 +7,7 @@ from decimal import Decimal
 from storescraper.product import Product
 from storescraper.store import Store
 from storescraper.utils import session_with_proxy, html_to_markdown, \
-    check_ean13
+    check_ean13, extract_json
 
 
 class MegaMatute(Store):
@@ -81,13 +80,9 @@ class MegaMatute(Store):
 
         page_source = response.text
 
-        pricing_data = re.search(r'vtex.events.addData\(([\S\s]+?)\);',
-                                 page_source).groups()[0]
-        pricing_data = json.loads(pricing_data)
+        pricing_data = extract_json(page_source, 'vtex.events.addData(')
 
-        skus_data = re.search(r'var skuJson_0 = ([\S\s]+?);',
-                              page_source).groups()[0]
-        skus_data = json.loads(skus_data)
+        skus_data = extract_json(page_source, 'var skuJson_0')
         name = '{} {}'.format(pricing_data['productBrandName'],
                               pricing_data['productName'])
         normal_price = Decimal(pricing_data['productPriceTo'])
@@ -11,7 +11,8 @@ from bs4 import BeautifulSoup
 
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import html_to_markdown, session_with_proxy
+from storescraper.utils import html_to_markdown, session_with_proxy, \
+    extract_json
 
 
 class MercadoLibreChile(Store):
@@ -76,11 +77,9 @@ class MercadoLibreChile(Store):
         soup = BeautifulSoup(page_source, 'html.parser')
         products = []
 
-        new_mode_data = re.search(
-            r'window.__PRELOADED_STATE__ = ([\S\s]+?);\n', page_source)
+        data = extract_json(page_source, 'window.__PRELOADED_STATE__')
 
-        if new_mode_data:
-            data = json.loads(new_mode_data.groups()[0])
+        if data:
             seller = data['initialState']['components']['track'][
                 'analytics_event']['custom_dimensions'][
                 'customDimensions']['officialStore']
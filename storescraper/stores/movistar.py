@@ -5,9 +5,10 @@ from collections import defaultdict
 from bs4 import BeautifulSoup
 from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words
+from storescraper.utils import session_with_proxy
 
 
 class Movistar(Store):
@@ -114,7 +115,7 @@ class Movistar(Store):
 
             price_text = plan_container.find('div', 'mb-parrilla_price').find(
                 'p', 'price').text
-            price = Decimal(remove_words(price_text.split()[0]))
+            price = Currency.parse(price_text.split()[0], 'CLP')
 
             portability_suffixes = ['', ' Portabilidad']
             cuotas_suffixes = [
@@ -246,8 +247,8 @@ class Movistar(Store):
                     if has_arriendo_option:
                         for container in plan_containers:
                             cell_plan_name = container['data-id']
-                            price = Decimal(remove_words(container.find(
-                                'strong', 'pie-price').text))
+                            price = Currency.parse(container.find(
+                                'strong', 'pie-price').text, 'CLP')
 
                             monthly_payment_text = container.find(
                                 'div', 'pie-detail').findAll('strong')[-1].text
@@ -1,9 +1,9 @@
 import json
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import remove_words, session_with_proxy
+from storescraper.utils import session_with_proxy
 
 
 class MovistarOne(Store):
@@ -40,9 +40,9 @@ class MovistarOne(Store):
             for plan_entry in entry['planes']:
                 cell_plan_name = plans_dict[plan_entry['tipoPlan']]
 
-                price = Decimal(remove_words(plan_entry['pieEquipo']))
-                cell_monthly_payment = Decimal(
-                    remove_words(plan_entry['cuotaMensualEquipo']))
+                price = Currency.parse(plan_entry['pieEquipo'], 'CLP')
+                cell_monthly_payment = Currency.parse(
+                    plan_entry['cuotaMensualEquipo'], 'CLP')
 
                 products.append(Product(
                     name,
@@ -2,12 +2,11 @@ import logging
 import re
 
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class NewGame(Store):
@@ -91,10 +90,10 @@ class NewGame(Store):
             stock = 0
 
         offer_price = soup.findAll('div', 'preciobig')[1].find('span')
-        offer_price = Decimal(remove_words(offer_price.text))
+        offer_price = Currency.parse(offer_price.text, 'CLP')
 
         normal_price = soup.findAll('div', 'preciobig')[0].find('span')
-        normal_price = Decimal(remove_words(normal_price.text))
+        normal_price = Currency.parse(normal_price.text, 'CLP')
 
         if offer_price > normal_price:
             offer_price = normal_price
@@ -1,12 +1,10 @@
-import json
-import re
 from bs4 import BeautifulSoup
 from decimal import Decimal
 
 from storescraper.product import Product
 from storescraper.store import Store
 from storescraper.utils import session_with_proxy, html_to_markdown, \
-    check_ean13
+    check_ean13, extract_json
 
 
 class OfficeMaxMexico(Store):
@@ -61,9 +59,7 @@ class OfficeMaxMexico(Store):
         session = session_with_proxy(extra_args)
         page_source = session.get(url).text
 
-        skus_data = re.search(r'var skuJson_0 = ([\S\s]+?);',
-                              page_source).groups()[0]
-        skus_data = json.loads(skus_data)
+        skus_data = extract_json(page_source, 'var skuJson_0')
         soup = BeautifulSoup(page_source, 'html.parser')
 
         part_number = soup.find('td', {'class': 'value-field Modelo'}).text
@@ -1,15 +1,15 @@
 import json
 import re
 from collections import defaultdict
-from decimal import Decimal
 
 from bs4 import BeautifulSoup
 
+from storescraper.currency import Currency
 from storescraper.flixmedia import flixmedia_video_urls
 from storescraper.product import Product
 from storescraper.store import Store
 from storescraper.utils import html_to_markdown, session_with_proxy, \
-    remove_words
+    listing_soup
 from storescraper import banner_sections as bs
 
 
@@ -272,7 +272,8 @@ class Paris(Store):
                     raise Exception('Mismatching URL: {} - {}'.format(
                         response.url, category_url))
 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = listing_soup(response.text, 'ul',
+                                    {'id': 'search-result-items'})
                 containers = soup\
                     .find('ul', {'id': 'search-result-items'})\
                     .findAll('li', recursive=False)
@@ -378,16 +379,17 @@ class Paris(Store):
             stock = -1
 
         if offer_price_container:
-            offer_price = Decimal(
-                remove_words(offer_price_container.contents[0]))
-            normal_price = Decimal(remove_words(soup.find(
-                'div', 'price-internet').text.split('$')[1].split('\n')[0]))
+            offer_price = Currency.parse(
+                offer_price_container.contents[0], 'CLP')
+            normal_price = Currency.parse(soup.find(
+                'div', 'price-internet').text.split('$')[1].split('\n')[0],
+                'CLP')
         else:
             price_text = soup.find('div', 'default-price').contents[0].strip()
             if price_text == 'N/A':
                 return []
 
-            normal_price = Decimal(remove_words(price_text))
+            normal_price = Currency.parse(price_text, 'CLP')
             offer_price = normal_price
 
         picture_urls = []
@@ -1,10 +1,9 @@
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 from storescraper.categories import PROCESSOR, RAM, VIDEO_CARD, \
     SOLID_STATE_DRIVE, EXTERNAL_STORAGE_DRIVE, POWER_SUPPLY, COMPUTER_CASE, \
     HEADPHONES, MONITOR, MOUSE, KEYBOARD, STORAGE_DRIVE, CPU_COOLER, \
@@ -117,7 +116,7 @@ class PcCom(Store):
         if price_container.find('ins'):
             price_container = price_container.find('ins')
 
-        price = Decimal(remove_words(price_container.text))
+        price = Currency.parse(price_container.text, 'CLP')
         picture_containers = soup.findAll(
             'div', 'woocommerce-product-gallery__image')
 
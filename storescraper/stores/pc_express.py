@@ -1,12 +1,11 @@
 import logging
 import re
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import remove_words, html_to_markdown, \
-    session_with_proxy
+from storescraper.utils import html_to_markdown, session_with_proxy
 
 
 class PcExpress(Store):
@@ -142,10 +141,10 @@ class PcExpress(Store):
             stock = int(stock_container.text.split(' ')[0])
 
         offer_price = soup.find('div', 'rm-product__price--cash').h3.text
-        offer_price = Decimal(remove_words(offer_price))
+        offer_price = Currency.parse(offer_price, 'CLP')
 
         normal_price = soup.find('div', 'rm-product__price--normal').h3.text
-        normal_price = Decimal(remove_words(normal_price))
+        normal_price = Currency.parse(normal_price, 'CLP')
 
         description = html_to_markdown(str(soup.find(
             'div', {'id': 'tab-description'})))
@@ -4,14 +4,13 @@ import re
 
 from collections import defaultdict
 from datetime import datetime
-from decimal import Decimal
 
 from bs4 import BeautifulSoup
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import html_to_markdown, remove_words, \
-    session_with_proxy
+from storescraper.utils import html_to_markdown, session_with_proxy
 
 
 class PcFactory(Store):
@@ -277,8 +276,8 @@ class PcFactory(Store):
             url,
             sku,
             stock,
-            Decimal(remove_words(product_data['precio_normal'])),
-            Decimal(remove_words(product_data['precio_cash'])),
+            Currency.parse(product_data['precio_normal'], 'CLP'),
+            Currency.parse(product_data['precio_cash'], 'CLP'),
             'CLP',
             sku=sku,
             part_number=product_data['partno'],
@@ -1,12 +1,11 @@
 import re
 
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import remove_words, html_to_markdown, \
-    session_with_proxy
+from storescraper.utils import html_to_markdown, session_with_proxy
 
 
 class PcGamer(Store):
@@ -131,10 +130,10 @@ class PcGamer(Store):
 
         price_containers = soup.find('ul', 'product-price-and-shipping')\
             .findAll('h3')
-        normal_price = Decimal(remove_words(price_containers[0].text))
+        normal_price = Currency.parse(price_containers[0].text, 'CLP')
 
         if len(price_containers) > 1:
-            offer_price = Decimal(remove_words(price_containers[1].text))
+            offer_price = Currency.parse(price_containers[1].text, 'CLP')
         else:
             offer_price = normal_price
 
@@ -3,12 +3,11 @@ import random
 
 import re
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class PcOfertas(Store):
@@ -145,7 +144,7 @@ class PcOfertas(Store):
 
         price_containers = soup.findAll('span', 'price')
 
-        price = Decimal(remove_words(price_containers[0].string))
+        price = Currency.parse(price_containers[0].string, 'CLP')
 
         description = html_to_markdown(
             str(soup.find('div', {'id': 'product.info.description'})))
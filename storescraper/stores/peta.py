@@ -2,12 +2,11 @@ import json
 import random
 
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class Peta(Store):
@@ -151,8 +150,8 @@ class Peta(Store):
 
         price_containers = soup.find('div', 'product-info-price').findAll(
             'span', 'price')
-        normal_price = Decimal(remove_words(price_containers[0].string))
-        offer_price = Decimal(remove_words(price_containers[-1].string))
+        normal_price = Currency.parse(price_containers[0].string, 'CLP')
+        offer_price = Currency.parse(price_containers[-1].string, 'CLP')
 
         description = ''
 
@@ -1,12 +1,11 @@
 import json
 
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class PortatilChile(Store):
@@ -85,7 +84,7 @@ class PortatilChile(Store):
         price_container = soup.find('span', {'id': 'our_price_display'})
 
         price = price_container.string.split('$')[1]
-        price = Decimal(remove_words(price))
+        price = Currency.parse(price, 'CLP')
 
         condition = soup.find('link', {'itemprop': 'itemCondition'})['href']
 
@@ -2,12 +2,11 @@ import json
 import re
 
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, html_to_markdown, \
-    remove_words
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class ProMovil(Store):
@@ -136,8 +135,8 @@ class ProMovil(Store):
         if name_ext:
             name += ' ({})'.format(name_ext)
 
-        price = Decimal(remove_words(
-            soup.find('div', 'current-price').find('span').text))
+        price = Currency.parse(
+            soup.find('div', 'current-price').find('span').text, 'CLP')
 
         stock_container = soup.find('span', {'id': 'product-availability'})
 
@@ -2,10 +2,10 @@ import re
 from bs4 import BeautifulSoup
 from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class Rhona(Store):
@@ -74,7 +74,7 @@ class Rhona(Store):
             price = Decimal(0)
         else:
             stock = -1
-            price = Decimal(remove_words(price.string))
+            price = Currency.parse(price.string, 'CLP')
 
         description = html_to_markdown(str(soup.find('ul', {'id': 'tab1'})))
 
@@ -11,7 +11,8 @@ from storescraper.store import Store
 from storescraper.product import Product
 from storescraper.flixmedia import flixmedia_video_urls
 from storescraper.utils import get_cf_session, HeadlessChrome, \
-    load_driver_cf_cookies, html_to_markdown, CF_REQUEST_HEADERS
+    load_driver_cf_cookies, html_to_markdown, CF_REQUEST_HEADERS, \
+    InvalidSessionCookieException, extract_json, listing_soup, extract_ld_json
 from storescraper import banner_sections as bs
 
 from selenium.common.exceptions import NoSuchElementException
@@ -19,6 +20,8 @@ from selenium.common.exceptions import NoSuchElementException
 
 class Ripley(Store):
     preferred_products_for_url_concurrency = 3
+    # Lifetime of the cf_clearance cookie obtained by preflight
+    preflight_cache_ttl = 1800
 
     @classmethod
     def categories(cls):
@@ -198,14 +201,19 @@ class Ripley(Store):
                 print(category_url)
                 response = session.get(category_url, allow_redirects=False)
 
+                if response.status_code in [403, 503] and \
+                        'cf_clearance' in extra_args:
+                    # Cloudflare no longer accepts the preflight cookie
+                    raise InvalidSessionCookieException
+
                 if response.status_code != 200 and page == 1:
                     raise Exception('Invalid section: ' + category_url)
 
-                soup = BeautifulSoup(response.text, 'html.parser')
-                products_data = soup.find('script',
-                                          {'type': 'application/ld+json'})
+                products_data = extract_ld_json(response.text)
 
-                products_soup = soup.find('div', 'catalog-container')
+                products_soup = listing_soup(
+                    response.text, 'div', 'catalog-container').find(
+                    'div', 'catalog-container')
 
                 if not products_data or not products_soup:
                     if page == 1:
@@ -219,8 +227,7 @@ class Ripley(Store):
                     products_elements = products_soup.findAll(
                         'a', 'catalog-product-item')
 
-                products_json = json.loads(products_data.text)[
-                    'itemListElement']
+                products_json = products_data['itemListElement']
 
                 assert (len(products_elements) == len(products_json))
 
@@ -290,16 +297,15 @@ class Ripley(Store):
         if soup.find('div', 'error-page'):
             return []
 
-        product_data = re.search(r'window.__PRELOADED_STATE__ = (.+);',
-                                 page_source)
-        if not product_data:
+        product_json = extract_json(page_source,
+                                    'window.__PRELOADED_STATE__')
+        if not product_json:
             if retries:
                 return cls._assemble_full_product(url, category, extra_args,
                                                   retries=retries-1)
             else:
                 return []
 
-        product_json = json.loads(product_data.groups()[0])
         specs_json = product_json['product']['product']
 
         sku = specs_json['partNumber']
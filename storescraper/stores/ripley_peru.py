@@ -1,11 +1,10 @@
-import json
-import re
 from bs4 import BeautifulSoup
 from decimal import Decimal
 
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import html_to_markdown, session_with_proxy
+from storescraper.utils import html_to_markdown, session_with_proxy, \
+    extract_json
 
 
 class RipleyPeru(Store):
@@ -77,9 +76,8 @@ class RipleyPeru(Store):
     def products_for_url(cls, url, category=None, extra_args=None):
         session = session_with_proxy(extra_args)
         page_source = session.get(url).text
-        product_data = re.search(r'window.__PRELOADED_STATE__ = (.+);',
-                                 page_source)
-        product_json = json.loads(product_data.groups()[0])
+        product_json = extract_json(page_source,
+                                    'window.__PRELOADED_STATE__')
         specs_json = product_json['product']['product']
 
         if 'name' not in specs_json:
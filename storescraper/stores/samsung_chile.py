@@ -1,8 +1,9 @@
 from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words
+from storescraper.utils import session_with_proxy
 
 import json
 
@@ -90,7 +91,7 @@ class SamsungChile(Store):
                             .format(picture))
 
                     if model['price1Display']:
-                        price = Decimal(remove_words(model['price1Display']))
+                        price = Currency.parse(model['price1Display'], 'CLP')
                     else:
                         price = Decimal(0)
 
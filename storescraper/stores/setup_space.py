@@ -1,14 +1,14 @@
 import logging
-from decimal import Decimal
 
 from bs4 import BeautifulSoup
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
 from storescraper.categories import RAM, HEADPHONES, COMPUTER_CASE, MONITOR, \
     MOUSE, STEREO_SYSTEM, MOTHERBOARD, PROCESSOR, PROJECTOR, \
     SOLID_STATE_DRIVE, VIDEO_CARD, KEYBOARD, PRINTER, STORAGE_DRIVE, NOTEBOOK
-from storescraper.utils import session_with_proxy, remove_words
+from storescraper.utils import session_with_proxy
 
 
 class SetupSpace(Store):
@@ -91,8 +91,9 @@ class SetupSpace(Store):
         soup = BeautifulSoup(response.text, 'html.parser')
         name = soup.find('h1', 'product_name').text
         sku = soup.find('input', {'name': 'id'})['value'].strip()
-        normal_price = Decimal(remove_words(
-            soup.find('span', 'current_price').find('span', 'money').text))
+        normal_price = Currency.parse(
+            soup.find('span', 'current_price').find('span', 'money').text,
+            'CLP')
         offer_price = normal_price
 
         stock_container = soup.find(
@@ -5,9 +5,10 @@ from decimal import Decimal
 import re
 from selenium import webdriver
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import remove_words, PhantomJS
+from storescraper.utils import PhantomJS
 
 
 class Sindelen(Store):
@@ -102,7 +103,7 @@ class Sindelen(Store):
                         product_price = Decimal(0)
                     else:
                         stock = -1
-                        product_price = Decimal(remove_words(price_container))
+                        product_price = Currency.parse(price_container, 'CLP')
                     sku = re.search(r"'(\d+)'", command).groups()[0]
 
                     p = Product(
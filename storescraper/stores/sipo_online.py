@@ -8,9 +8,10 @@ from bs4 import BeautifulSoup
 from storescraper.categories import STEREO_SYSTEM, MEMORY_CARD, \
     USB_FLASH_DRIVE, EXTERNAL_STORAGE_DRIVE, STORAGE_DRIVE, RAM, HEADPHONES, \
     KEYBOARD, MOUSE, KEYBOARD_MOUSE_COMBO, COMPUTER_CASE, MONITOR, WEARABLE
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words
+from storescraper.utils import session_with_proxy
 
 
 class SipoOnline(Store):
@@ -137,10 +138,10 @@ class SipoOnline(Store):
             sku = soup.find('button', 'single_add_to_cart_button')['value']
             price_container = soup.find('p', 'price')
             if price_container.find('ins'):
-                price = Decimal(
-                    remove_words(price_container.find('ins').find('bdi').text))
+                price = Currency.parse(
+                    price_container.find('ins').find('bdi').text, 'CLP')
             else:
-                price = Decimal(remove_words(price_container.find('bdi').text))
+                price = Currency.parse(price_container.find('bdi').text, 'CLP')
             picture_containers = soup.find('div',
                                            'woocommerce-product-gallery') \
                 .findAll('img')
@@ -3,10 +3,10 @@ import urllib
 from bs4 import BeautifulSoup
 from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class Sistemax(Store):
@@ -99,9 +99,9 @@ class Sistemax(Store):
             offer_price = Decimal(
                 pricing_cells[2].text.split('$')[-1].replace(',', ''))
         else:
-            normal_price = Decimal(
-                remove_words(soup.find(
-                    'div', {'id': 'product'}).parent.find('h2').text))
+            normal_price = Currency.parse(
+                soup.find(
+                    'div', {'id': 'product'}).parent.find('h2').text, 'CLP')
             offer_price = normal_price
 
         if offer_price > normal_price:
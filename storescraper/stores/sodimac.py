@@ -7,10 +7,10 @@ from collections import defaultdict
 from bs4 import BeautifulSoup
 from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class Sodimac(Store):
@@ -251,8 +251,8 @@ class Sodimac(Store):
             stock = int(stock_text)
         else:
             stock = 0
-            normal_price = Decimal(remove_words(
-                soup.find('p', 'price').text.split('\xa0')[0]))
+            normal_price = Currency.parse(
+                soup.find('p', 'price').text.split('\xa0')[0], 'CLP')
             offer_price = normal_price
 
             model = soup.find('h1', 'name').text
@@ -2,12 +2,11 @@ import json
 
 import re
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class SodimacArgentina(Store):
@@ -105,8 +104,8 @@ class SodimacArgentina(Store):
         if op_unica_cmr:
             # CMR Price
             price_container = soup.find('p', 'price')
-            offer_price = Decimal(remove_words(
-                price_container.text.split('\xa0')[0]))
+            offer_price = Currency.parse(
+                price_container.text.split('\xa0')[0], 'ARS')
 
             # Normal price
 
@@ -117,8 +116,8 @@ class SodimacArgentina(Store):
                 price_label = sale_price.getText()
                 if 'Precio' in price_label:
                     normal_price = price_label.split('\xa0')[1]
-                    normal_price = Decimal(
-                        remove_words(normal_price))
+                    normal_price = Currency.parse(
+                        normal_price, 'ARS')
                     break
 
             if not normal_price:
@@ -129,7 +128,7 @@ class SodimacArgentina(Store):
             price_container = soup.find('p', 'price')
             normal_price = price_container.text
             normal_price = normal_price.split('\xa0')[0]
-            normal_price = Decimal(remove_words(normal_price))
+            normal_price = Currency.parse(normal_price, 'ARS')
             offer_price = normal_price
 
         description = html_to_markdown(str(soup.find('section', 'prod-car')))
@@ -1,10 +1,9 @@
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class SolarLed(Store):
@@ -69,8 +68,8 @@ class SolarLed(Store):
         else:
             stock = -1
 
-        price = Decimal(remove_words(soup.find(
-            'span', {'id': 'our_price_display'}).text))
+        price = Currency.parse(soup.find(
+            'span', {'id': 'our_price_display'}).text, 'CLP')
 
         price = price.quantize(0)
 
@@ -4,13 +4,12 @@ import re
 
 from collections import defaultdict
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.flixmedia import flixmedia_video_urls
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import remove_words, html_to_markdown, \
-    session_with_proxy
+from storescraper.utils import html_to_markdown, session_with_proxy
 
 
 class SpDigital(Store):
@@ -237,8 +236,8 @@ class SpDigital(Store):
 
         containers = soup.findAll('span', 'product-view-cash-price-value')
 
-        offer_price = Decimal(remove_words(containers[0].text))
-        normal_price = Decimal(remove_words(containers[1].text))
+        offer_price = Currency.parse(containers[0].text, 'CLP')
+        normal_price = Currency.parse(containers[1].text, 'CLP')
 
         if normal_price < offer_price:
             offer_price = normal_price
@@ -1,12 +1,12 @@
 import logging
-from decimal import Decimal
 
 from bs4 import BeautifulSoup
 
 from storescraper.categories import MOUSE, KEYBOARD
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words
+from storescraper.utils import session_with_proxy
 
 
 class Spaceman(Store):
@@ -56,7 +56,7 @@ class Spaceman(Store):
         name = soup.find('h1', 'product_title').text
         sku = soup.find('button', {'name': 'add-to-cart'})['value']
         stock = int(soup.find('span', 'stock').text.split()[0])
-        price = Decimal(remove_words(soup.findAll('bdi')[-1].text))
+        price = Currency.parse(soup.findAll('bdi')[-1].text, 'CLP')
         picture_urls = []
         for tag in soup.find('div', 'woocommerce-product-gallery').findAll(
                 'img'):
@@ -4,10 +4,10 @@ import re
 from bs4 import BeautifulSoup
 from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import remove_words, html_to_markdown, \
-    session_with_proxy
+from storescraper.utils import html_to_markdown, session_with_proxy
 
 
 class Spider(Store):
@@ -101,8 +101,8 @@ class Spider(Store):
         price_containers = soup.findAll('span', {'id': 'our_price_display'})
 
         offer_price = Decimal(price_containers[0]['content']).quantize(0)
-        normal_price = Decimal(remove_words(price_containers[1].text)
-                               ).quantize(0)
+        normal_price = Currency.parse(price_containers[1].text, 'CLP') \
+            .quantize(0)
         part_number = soup.find('span', {'itemprop': 'sku'}).text.strip()
 
         description = html_to_markdown(str(soup.find(
@@ -2,12 +2,11 @@ import json
 
 import requests
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class TiendaClaro(Store):
@@ -92,7 +91,7 @@ class TiendaClaro(Store):
             if not res['catalogEntry']['offerPrice']:
                 return []
 
-            price = Decimal(remove_words(res['catalogEntry']['offerPrice']))
+            price = Currency.parse(res['catalogEntry']['offerPrice'], 'CLP')
 
             picture_urls = ['https://tienda.clarochile.cl{}'.format(
                 product_entry['ItemImage467']).replace(' ', '%20')]
@@ -4,12 +4,11 @@ import urllib
 
 from collections import defaultdict
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, html_to_markdown, \
-    remove_words
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class TiendaMovistar(Store):
@@ -114,7 +113,7 @@ class TiendaMovistar(Store):
         stock = stock_data['respuesta']['cantidad']
 
         price_container = soup.find('span', 'special-price').find('p')
-        price = Decimal(remove_words(price_container.text))
+        price = Currency.parse(price_container.text, 'CLP')
 
         description = html_to_markdown(str(
             soup.find('div', 'detailed-desktop')))
@@ -1,11 +1,9 @@
-import json
-
 from bs4 import BeautifulSoup
 from decimal import Decimal
 
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy
+from storescraper.utils import session_with_proxy, extract_ld_json
 
 
 class TiendaToyotomi(Store):
@@ -66,14 +64,10 @@ class TiendaToyotomi(Store):
     @classmethod
     def products_for_url(cls, url, category=None, extra_args=None):
         session = session_with_proxy(extra_args)
-        soup = BeautifulSoup(
-            session.get(url, verify=False).text, 'html.parser')
-
-        data = soup.findAll('script', {'type': 'application/ld+json'})[-1]
-
-        json_data = json.loads(data.text)
+        json_data = extract_ld_json(
+            session.get(url, verify=False).text, -1)
 
-        if '@graph' not in json_data.keys():
+        if not json_data or '@graph' not in json_data.keys():
             return []
 
         json_data = json_data['@graph'][1]
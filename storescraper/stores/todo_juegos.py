@@ -1,11 +1,10 @@
 import re
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class TodoJuegos(Store):
@@ -68,7 +67,7 @@ class TodoJuegos(Store):
             stock = 0
 
         price_string = soup.find('h2', 'precio_juego').string.split('$')[1]
-        price = Decimal(remove_words(price_string))
+        price = Currency.parse(price_string, 'CLP')
 
         description = ''
 
@@ -1,12 +1,11 @@
 import logging
 
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class TopPc(Store):
@@ -109,11 +108,11 @@ class TopPc(Store):
             return []
 
         offer_price = offer_price_tag.string
-        offer_price = Decimal(remove_words(offer_price))
+        offer_price = Currency.parse(offer_price, 'CLP')
 
         normal_price = soup.find(
             'p', {'id': 'old_price'}).find('span', 'price').string
-        normal_price = Decimal(remove_words(normal_price))
+        normal_price = Currency.parse(normal_price, 'CLP')
 
         description = html_to_markdown(str(soup.find('section',
                                                      'page-product-box')))
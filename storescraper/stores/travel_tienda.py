@@ -2,10 +2,10 @@ from decimal import Decimal
 
 from bs4 import BeautifulSoup
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, html_to_markdown, \
-    remove_words
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class TravelTienda(Store):
@@ -106,8 +106,8 @@ class TravelTienda(Store):
 
         if offer_price_container and offer_price_container.contents[0].strip():
             print(offer_price_container.contents[0])
-            offer_price = Decimal(remove_words(
-                offer_price_container.contents[0]))
+            offer_price = Currency.parse(
+                offer_price_container.contents[0], 'CLP')
         else:
             offer_price = normal_price
 
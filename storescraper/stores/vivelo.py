@@ -3,10 +3,10 @@ import re
 from bs4 import BeautifulSoup
 from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, html_to_markdown, \
-    remove_words
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class Vivelo(Store):
@@ -151,7 +151,7 @@ class Vivelo(Store):
             sku = soup.find('input', {'name': 'product'})['value'].strip()
 
             price_container = soup.find('span', {'id': 'product-price-' + sku})
-            price = Decimal(remove_words(price_container.text))
+            price = Currency.parse(price_container.text, 'CLP')
 
             if soup.find('div', 'product-shop').find('p', 'out-of-stock'):
                 stock = 0
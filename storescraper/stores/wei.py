@@ -1,12 +1,11 @@
 import logging
 import re
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import remove_words, html_to_markdown, \
-    session_with_proxy
+from storescraper.utils import html_to_markdown, session_with_proxy
 
 
 class Wei(Store):
@@ -156,13 +155,13 @@ class Wei(Store):
         if not pricing_container.find('div', 'txt18'):
             return []
 
-        offer_price = Decimal(remove_words(pricing_container.find(
-            'div', 'txt18').contents[0].split('$')[1]))
+        offer_price = Currency.parse(pricing_container.find(
+            'div', 'txt18').contents[0].split('$')[1], 'CLP')
 
         normal_price = pricing_container.find(
             'div', 'txt14').contents[0].split('$')[1]
 
-        normal_price = Decimal(remove_words(normal_price))
+        normal_price = Currency.parse(normal_price, 'CLP')
 
         if 'reacondicionado' in name.lower():
             condition = 'https://schema.org/RefurbishedCondition'
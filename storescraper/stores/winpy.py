@@ -4,13 +4,12 @@ import urllib
 
 import demjson
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.flixmedia import flixmedia_video_urls
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import remove_words, html_to_markdown, \
-    session_with_proxy
+from storescraper.utils import html_to_markdown, session_with_proxy
 
 
 class Winpy(Store):
@@ -147,19 +146,19 @@ class Winpy(Store):
 
         if soup.find('div', 'sinstock'):
             stock = 0
-            normal_price = Decimal(remove_words(
+            normal_price = Currency.parse(
                 soup.find('meta',
-                          {'property': 'product:price:amount'})['content']
-            ))
+                          {'property': 'product:price:amount'})['content'],
+                'CLP')
             offer_price = normal_price
         else:
             stock = int(soup.find('p', {'itemprop': 'offerCount'}).text)
 
-            offer_price = Decimal(remove_words(soup.find(
-                'h2', {'itemprop': 'lowPrice'}).string))
+            offer_price = Currency.parse(soup.find(
+                'h2', {'itemprop': 'lowPrice'}).string, 'CLP')
 
-            normal_price = Decimal(remove_words(soup.find(
-                'h3', {'itemprop': 'highPrice'}).string))
+            normal_price = Currency.parse(soup.find(
+                'h3', {'itemprop': 'highPrice'}).string, 'CLP')
 
         description = html_to_markdown(str(soup.find('div', 'info')))
 
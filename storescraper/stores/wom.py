@@ -7,10 +7,10 @@ from collections import OrderedDict
 from bs4 import BeautifulSoup
 from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class Wom(Store):
@@ -126,8 +126,8 @@ class Wom(Store):
 
         for container in plan_containers:
             plan_name = container.find('span', 'w-100').text.strip()
-            plan_price = Decimal(remove_words(container.find(
-                'span', 'font-40-px').text))
+            plan_price = Currency.parse(container.find(
+                'span', 'font-40-px').text, 'CLP')
 
             for variant in variants:
                 for suffix in ['', ' Portabilidad']:
@@ -174,8 +174,8 @@ class Wom(Store):
                 'div', 'bolsa_modal'):
             plan_name = plan_container.find(
                 'p', 'bolsa_modal-title').text.strip()
-            plan_price = Decimal(remove_words(plan_container.findAll(
-                'span', 'precio')[1].text))
+            plan_price = Currency.parse(plan_container.findAll(
+                'span', 'precio')[1].text, 'CLP')
             rent_prices[plan_name] = plan_price
 
         # Plan con número nuevo
@@ -210,7 +210,7 @@ class Wom(Store):
                 combinations = combinations[:1]
 
             for idx, combination in enumerate(combinations):
-                initial_price = Decimal(remove_words(initial_prices[idx].text))
+                initial_price = Currency.parse(initial_prices[idx].text, 'CLP')
 
                 for plan_name, monthly_payment in rent_prices.items():
                     if combination['use_monthly_payment']:
@@ -242,8 +242,8 @@ class Wom(Store):
                     ))
 
         prepago_container = soup.find('div', {'data-tab': 'equipoprepago'})
-        prepago_price = Decimal(remove_words(prepago_container.find(
-            'span', 'body_precio').text))
+        prepago_price = Currency.parse(prepago_container.find(
+            'span', 'body_precio').text, 'CLP')
 
         products.append(Product(
             name,
@@ -1,12 +1,11 @@
 import urllib
 
 from bs4 import BeautifulSoup
-from decimal import Decimal
 
+from storescraper.currency import Currency
 from storescraper.product import Product
 from storescraper.store import Store
-from storescraper.utils import session_with_proxy, remove_words, \
-    html_to_markdown
+from storescraper.utils import session_with_proxy, html_to_markdown
 
 
 class Zmart(Store):
@@ -116,7 +115,7 @@ class Zmart(Store):
 
         price_string = price_string.contents[2]
 
-        price = Decimal(remove_words(price_string))
+        price = Currency.parse(price_string, 'CLP')
 
         description = html_to_markdown(str(soup.find('div', 'tab')),
                                        'https://www.zmart.cl')
@@ -1,15 +1,22 @@
+import asyncio
 import importlib
+import json
 import logging
+import os
+import threading
+import weakref
 from decimal import Decimal
 
-import html2text
 import re
 
 import math
 
 import requests
-from seleniumwire import webdriver
-from selenium.webdriver import DesiredCapabilities
+from requests.adapters import HTTPAdapter
+
+from .concurrency import throttling_counter
+from .http_cache import get_caching_adapter, SKIPPED_HEADERS
+from .rate_limit import get_rate_limiter, RateLimitedAdapter
 
 CLP_BLACKLIST = ['CLP$', 'CLP', 'precio', 'internet', 'normal',
                  '$', '.', ',', '&nbsp;', '\r', '\n', '\t', '\xa0']
@@ -75,6 +82,8 @@ def format_currency(value, curr='', sep='.', dp=',',
 
 
 def html_to_markdown(html, baseurl=''):
+    import html2text
+
     h = html2text.HTML2Text(baseurl=baseurl)
     h.body_width = 0
     result = h.handle(html)
@@ -116,8 +125,203 @@ def check_ean13(ean):
     return True
 
 
-def session_with_proxy(extra_args):
-    session = requests.Session()
+def default_html_parser():
+    # Parser of make_soup (and listing_soup), html.parser like the
+    # BeautifulSoup calls of the stores. lxml is several times faster, but
+    # builds different trees for some invalid markup (e.g. a <div> inside a
+    # <p>), so a store only moves its soups to make_soup(..., 'lxml') once
+    # html_parser_equivalence.py shows the same results with both for its
+    # recorded fixtures. STORESCRAPER_HTML_PARSER overrides the default
+    # (e.g. to compare the products obtained with each parser)
+    return os.environ.get('STORESCRAPER_HTML_PARSER') or 'html.parser'
+
+
+def make_soup(markup, parser=None, parse_only=None):
+    # BeautifulSoup of the given markup using the default parser, unless a
+    # specific one is given for the pages where the parsers disagree (e.g.
+    # 'html5lib' for very broken markup)
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup(markup, parser or default_html_parser(),
+                         parse_only=parse_only)
+
+
+def listing_soup(markup, name, attrs=None, parser=None):
+    # Soup with only the elements matching name / attrs (as in
+    # soup.find) and their contents, e.g. the product containers of a
+    # listing page. The rest of the page is never turned into tags, which
+    # makes parsing long listings much cheaper. Not supported by html5lib
+    from bs4 import SoupStrainer
+
+    if isinstance(attrs, str):
+        attrs = {'class': attrs}
+
+    if attrs and isinstance(attrs.get('class'), str):
+        # While parsing, the strainer sees the whole class attribute (e.g.
+        # "product-tile col-6"), not each of its classes like find does
+        attrs = dict(attrs, **{'class': css_class_matcher(attrs['class'])})
+
+    return make_soup(markup, parser, parse_only=SoupStrainer(name, attrs))
+
+
+def css_class_matcher(css_class):
+    def matches(class_value):
+        if class_value is None:
+            return False
+        if isinstance(class_value, str):
+            class_value = class_value.split()
+        return css_class in class_value
+
+    return matches
+
+
+JSON_DECODER = json.JSONDecoder()
+
+LD_JSON_SCRIPT_REGEX = re.compile(
+    r'<script[^>]*\btype=["\']application/ld\+json["\'][^>]*>')
+
+
+def extract_json(page_source, marker, start=0):
+    # Decodes the JSON value that follows "marker" in the page source (e.g.
+    # "var skuJson_0", "window.__PRELOADED_STATE__" or
+    # "vtex.events.addData("), skipping any whitespace and "=" in between.
+    # Only the value itself is scanned (no DOM is built and no regex runs
+    # over the rest of the page). Returns None if the marker is not found
+    # or nothing follows it
+    marker_index = page_source.find(marker, start)
+
+    if marker_index == -1:
+        return None
+
+    return decode_json_at(page_source, marker_index + len(marker))
+
+
+def extract_script_json(page_source, element_id):
+    # Decodes the contents of the <script> tag with the given id, e.g.
+    # "__NEXT_DATA__". Returns None if there is no such tag
+    match = re.search(
+        r'<script[^>]*\bid=["\']{}["\'][^>]*>'.format(
+            re.escape(element_id)), page_source)
+
+    if not match:
+        return None
+
+    return decode_json_at(page_source, match.end())
+
+
+def extract_ld_json(page_source, position=0):
+    # Decodes the application/ld+json <script> tag at "position" among the
+    # ones of the page (e.g. 0 for the first one or -1 for the last one).
+    # Only the tags up to that one are decoded, and the ones that are not
+    # valid JSON are skipped (and not counted). Returns None if there is no
+    # such tag
+    matches = list(LD_JSON_SCRIPT_REGEX.finditer(page_source))
+
+    if position < 0:
+        matches.reverse()
+        position = -position - 1
+
+    for match in matches:
+        try:
+            value = decode_json_at(page_source, match.end())
+        except ValueError:
+            continue
+
+        if position == 0:
+            return value
+
+        position -= 1
+
+    return None
+
+
+def decode_json_at(page_source, index):
+    # Decodes the JSON value at "index" of the page source, skipping any
+    # whitespace and "=" before it. Returns None if there is nothing but
+    # those until the end of the page, raises ValueError (JSONDecodeError)
+    # if the value is not valid JSON
+    while index < len(page_source) and page_source[index] in ' \t\r\n=':
+        index += 1
+
+    if index == len(page_source):
+        return None
+
+    value, end = JSON_DECODER.raw_decode(page_source, index)
+    return value
+
+
+# Idle connections kept per host by the pooled adapters of the sessions
+# created outside of a scraping of a store, which sizes them to its
+# concurrency instead (see Store._extra_args_with_http_pool)
+DEFAULT_HTTP_POOL_MAXSIZE = 10
+
+# extra_args that change the adapter of the sessions (see pooled_adapter)
+ADAPTER_ARGS = ['rate_limits', 'rate_limit_backend', 'rate_limit_dir',
+                'http_cache_mode', 'http_cache_ttl', 'http_cache_path',
+                'http_pool_store', 'http_pool_maxsize']
+
+_pooled_adapters = {}
+_pooled_adapters_lock = threading.Lock()
+
+
+def adapter_args_key(extra_args):
+    # The adapter related extra_args of a session (and the environment
+    # variable that can enable the HTTP cache), as a dictionary key
+    return (
+        json.dumps({arg: extra_args.get(arg) for arg in ADAPTER_ARGS},
+                   sort_keys=True, default=str),
+        os.environ.get('STORESCRAPER_HTTP_CACHE')
+    )
+
+
+class PooledSession(requests.Session):
+    # Session whose adapters are shared with the other sessions of the
+    # process, so closing it must not close their connections
+    def close(self):
+        pass
+
+
+def pooled_adapter(extra_args, header_profile=None):
+    # Returns the adapter (and so the connection pools) shared by every
+    # session of the process with the same adapter related extra_args, so
+    # each call of the scraping methods reuses the keep-alive connections
+    # of the previous ones (e.g. between the tasks of a Celery worker)
+    # instead of paying a new TCP + TLS handshake. Stores (see
+    # "http_pool_store"), proxies and header profiles (e.g. the browser
+    # headers of get_cf_session) don't share their connections
+    extra_args = extra_args or {}
+    # The connections can't be shared with forked processes
+    adapter_key = (os.getpid(), extra_args.get('proxy'), header_profile) + \
+        adapter_args_key(extra_args)
+
+    with _pooled_adapters_lock:
+        if adapter_key in _pooled_adapters:
+            return _pooled_adapters[adapter_key]
+
+        pool_maxsize = extra_args.get('http_pool_maxsize',
+                                      DEFAULT_HTTP_POOL_MAXSIZE)
+        rate_limiter = get_rate_limiter(extra_args)
+
+        if rate_limiter:
+            adapter = RateLimitedAdapter(rate_limiter,
+                                         pool_maxsize=pool_maxsize)
+        else:
+            adapter = HTTPAdapter(pool_maxsize=pool_maxsize)
+
+        # Cached responses are not rate limited, so the cache goes first
+        caching_adapter = get_caching_adapter(extra_args, adapter)
+
+        if caching_adapter:
+            adapter = caching_adapter
+
+        _pooled_adapters[adapter_key] = adapter
+        return adapter
+
+
+def session_with_proxy(extra_args, header_profile=None):
+    # header_profile: name of the set of headers that the caller gives to
+    # the session, if any, see pooled_adapter
+    session = PooledSession()
 
     if extra_args and 'proxy' in extra_args:
         proxy = extra_args['proxy']
@@ -127,6 +331,12 @@ def session_with_proxy(extra_args):
             'https': proxy,
         }
 
+    session.hooks['response'].append(throttling_counter.record_response)
+
+    adapter = pooled_adapter(extra_args, header_profile)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
     return session
 
 
@@ -142,7 +352,7 @@ CF_REQUEST_HEADERS = {
 
 
 def get_cf_session(extra_args):
-    session = session_with_proxy(extra_args)
+    session = session_with_proxy(extra_args, header_profile='cloudflare')
 
     for header_name, header_value in CF_REQUEST_HEADERS.items():
         session.headers[header_name] = header_value
@@ -162,9 +372,221 @@ def get_cf_session(extra_args):
     return session
 
 
+class AsyncSession:
+    # asyncio counterpart of the requests sessions used by the stores, backed
+    # by aiohttp. Applies the proxy to every request (aiohttp only supports
+    # it per request) and accepts numeric timeouts like requests does. As
+    # the adapters of session_with_proxy, requests go through the rate
+    # limiter and HTTP cache of the extra_args and their 429 / 5xx
+    # responses are counted by throttling_counter
+    def __init__(self, proxy=None, connections_limit=100, rate_limiter=None,
+                 caching_adapter=None):
+        import aiohttp
+
+        self.proxy = proxy
+        self.rate_limiter = rate_limiter
+        self.caching_adapter = caching_adapter
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=connections_limit))
+
+    @property
+    def headers(self):
+        return self.session.headers
+
+    @property
+    def cookie_jar(self):
+        return self.session.cookie_jar
+
+    def request(self, method, url, timeout=None, **kwargs):
+        # Used like the aiohttp one, e.g.
+        # "async with session.get(url) as response"
+        if self.proxy:
+            kwargs.setdefault('proxy', self.proxy)
+
+        if isinstance(timeout, (int, float)):
+            import aiohttp
+
+            timeout = aiohttp.ClientTimeout(total=timeout)
+
+        if timeout is not None:
+            kwargs['timeout'] = timeout
+
+        return AsyncRequestContextManager(
+            self._request(method, url, **kwargs))
+
+    async def _request(self, method, url, **kwargs):
+        cache_request = None
+
+        if self.caching_adapter:
+            # The HTTP cache keys are computed from requests requests
+            cache_request = requests.Request(
+                method, url, params=kwargs.get('params'),
+                data=kwargs.get('data'), json=kwargs.get('json')).prepare()
+            cached_response = self.caching_adapter.cached_response(
+                cache_request)
+
+            if cached_response is not None:
+                from yarl import URL
+
+                self.session.cookie_jar.update_cookies(
+                    cached_response.cookies.get_dict(),
+                    URL(cached_response.url))
+                return CachedAsyncResponse(cached_response)
+
+        if self.rate_limiter:
+            await self.rate_limiter.acquire_async(url)
+
+        response = await self.session.request(method, url, **kwargs)
+        throttling_counter.record_status(response.status)
+
+        if cache_request is not None and \
+                self.caching_adapter.stores_response(cache_request,
+                                                     response.status):
+            # The body stays available to the caller after reading it
+            content = await response.read()
+            header_pairs = [(name, value) for name, value in
+                            response.headers.items()
+                            if name.lower() not in SKIPPED_HEADERS]
+            self.caching_adapter.http_cache.store_values(
+                cache_request, str(response.url), response.status,
+                response.reason, header_pairs, content)
+
+        return response
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    async def close(self):
+        await self.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+class AsyncRequestContextManager:
+    # Returned by AsyncSession.request, the response can be awaited or used
+    # as an asynchronous context manager that releases it
+    def __init__(self, coroutine):
+        self.coroutine = coroutine
+        self.response = None
+
+    def __await__(self):
+        return self.coroutine.__await__()
+
+    async def __aenter__(self):
+        self.response = await self.coroutine
+        return self.response
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.response.release()
+
+
+class CachedAsyncResponse:
+    # A response of the HTTP cache (a requests one) with the interface of
+    # the aiohttp responses used by the stores
+    from_http_cache = True
+
+    def __init__(self, response):
+        self.response = response
+        self.status = response.status_code
+        self.reason = response.reason
+        self.headers = response.headers
+        self.url = response.url
+
+    async def read(self):
+        return self.response.content
+
+    async def text(self, encoding=None):
+        return self.response.content.decode(
+            encoding or self.response.encoding or 'utf-8')
+
+    async def json(self, **kwargs):
+        return json.loads(await self.text())
+
+    def raise_for_status(self):
+        self.response.raise_for_status()
+
+    def release(self):
+        pass
+
+
+def async_session_with_proxy(extra_args):
+    # Must be called from a coroutine, as aiohttp binds the session to the
+    # running event loop
+    proxy = None
+
+    if extra_args and 'proxy' in extra_args:
+        proxy = extra_args['proxy']
+
+    return AsyncSession(proxy=proxy,
+                        rate_limiter=get_rate_limiter(extra_args),
+                        caching_adapter=get_caching_adapter(extra_args))
+
+
+# The sessions returned by shared_async_session_with_proxy, by event loop,
+# proxy and adapter related extra_args
+SHARED_ASYNC_SESSIONS = weakref.WeakKeyDictionary()
+
+
+def shared_async_session_with_proxy(extra_args):
+    # Same as async_session_with_proxy, but every coroutine of the running
+    # event loop (e.g. every call of an "asyncio" executor map) gets the
+    # same session, so their connections are reused. The session must not
+    # be closed or modified by its users (pass the headers of each request
+    # instead), close_shared_async_sessions closes it with the loop
+    proxy = None
+
+    if extra_args and 'proxy' in extra_args:
+        proxy = extra_args['proxy']
+
+    session_key = (proxy,) + adapter_args_key(extra_args or {})
+    loop_sessions = SHARED_ASYNC_SESSIONS.setdefault(
+        asyncio.get_running_loop(), {})
+
+    if session_key not in loop_sessions:
+        loop_sessions[session_key] = async_session_with_proxy(extra_args)
+
+    return loop_sessions[session_key]
+
+
+async def close_shared_async_sessions():
+    loop_sessions = SHARED_ASYNC_SESSIONS.pop(asyncio.get_running_loop(), {})
+
+    for session in loop_sessions.values():
+        await session.close()
+
+
+def get_async_cf_session(extra_args):
+    session = async_session_with_proxy(extra_args)
+
+    for header_name, header_value in CF_REQUEST_HEADERS.items():
+        session.headers[header_name] = header_value
+
+    cookie_names = ['cf_clearance', '__cfduid']
+
+    for cookie_name in cookie_names:
+        if cookie_name not in extra_args:
+            logging.warning(
+                'This scraper expects a CloudFlare cookie in production')
+            continue
+
+        session.cookie_jar.update_cookies(
+            {cookie_name: extra_args[cookie_name]})
+    return session
+
+
 class HeadlessChrome:
     def __init__(self, images_enabled=False, proxy=None, headless=True,
                  timeout=30):
+        # Imported here as only the few stores that need a browser use it
+        from seleniumwire import webdriver
+
         options = webdriver.ChromeOptions()
         if headless:
             options.add_argument('headless')
@@ -207,6 +629,9 @@ def load_driver_cf_cookies(driver, extra_args, domain):
 
 class PhantomJS:
     def __init__(self, service_args=['--load-images=no'], timeout=30):
+        from seleniumwire import webdriver
+        from selenium.webdriver import DesiredCapabilities
+
         dcap = dict(DesiredCapabilities.PHANTOMJS)
         dcap["phantomjs.page.settings.userAgent"] = (
             "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/53 "
@@ -0,0 +1,105 @@
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from yarl import URL
+
+from storescraper.concurrency import throttling_counter
+from storescraper.http_cache import CachingAdapter, HttpCache, \
+    HttpCacheMissError
+from storescraper.rate_limit import RateLimiter
+from storescraper.utils import AsyncSession
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    # Answers with the status code of the path, e.g. "/429"
+    def do_GET(self):
+        self.server.paths.append(self.path)
+        status = int(self.path.strip('/') or 200)
+        self.send_response(status)
+        self.send_header('Set-Cookie', 'session_id=abc; Path=/')
+        self.end_headers()
+        self.wfile.write('<html>{}</html>'.format(status).encode('utf-8'))
+
+    def log_message(self, *args):
+        pass
+
+
+class RecordingRateLimitBackend:
+    def __init__(self):
+        self.hosts = []
+
+    def reserve(self, host, rate, burst):
+        self.hosts.append(host)
+        return 0.01
+
+
+class AsyncSessionTestCase(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), RequestHandler)
+        self.server.paths = []
+        threading.Thread(target=self.server.serve_forever,
+                         daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = 'http://localhost:{}/'.format(self.server.server_port)
+
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        self.http_cache = HttpCache(
+            os.path.join(cache_dir.name, 'http_cache.sqlite3'))
+
+    def fetch(self, path, **session_kwargs):
+        async def fetch():
+            async with AsyncSession(**session_kwargs) as session:
+                async with session.get(self.url + path) as response:
+                    return response.status, await response.text(), \
+                        session.cookie_jar.filter_cookies(URL(self.url))
+
+        return asyncio.run(fetch())
+
+    def test_record_and_replay(self):
+        self.fetch('', caching_adapter=CachingAdapter(self.http_cache,
+                                                      'record'))
+
+        status, text, cookies = self.fetch(
+            '', caching_adapter=CachingAdapter(self.http_cache, 'replay'))
+
+        self.assertEqual(['/'], self.server.paths)
+        self.assertEqual((200, '<html>200</html>'), (status, text))
+        self.assertEqual('abc', cookies['session_id'].value)
+
+        with self.assertRaises(HttpCacheMissError):
+            self.fetch('404', caching_adapter=CachingAdapter(
+                self.http_cache, 'replay'))
+
+    def test_cache_mode_skips_error_responses(self):
+        caching_adapter = CachingAdapter(self.http_cache, 'cache')
+
+        for _ in range(2):
+            self.fetch('', caching_adapter=caching_adapter)
+            self.fetch('500', caching_adapter=caching_adapter)
+
+        self.assertEqual(['/', '/500', '/500'], self.server.paths)
+
+    def test_throttled_responses_are_counted(self):
+        with throttling_counter.counting('AsyncStore', local=False) as call:
+            for path in ['', '429', '503', '404']:
+                self.fetch(path)
+
+        self.assertEqual(2, call['count'])
+
+    def test_rate_limited(self):
+        backend = RecordingRateLimitBackend()
+        rate_limiter = RateLimiter({'localhost': 1}, backend)
+
+        self.fetch('', rate_limiter=rate_limiter)
+
+        self.assertEqual(['localhost'], backend.hosts)
+
+
+if __name__ == '__main__':
+    unittest.main()
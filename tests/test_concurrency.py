@@ -0,0 +1,193 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from storescraper.concurrency import AdaptiveConcurrency, \
+    LEARNED_CONCURRENCY_FILENAME, throttling_counter
+from storescraper.executors import CeleryExecutor, ThreadExecutor, \
+    call_store_method
+from storescraper.store import Store
+
+
+def throttled_response():
+    return mock.Mock(status_code=429)
+
+
+class ThrottledStore(Store):
+    @classmethod
+    def products_for_url(cls, url, category=None, extra_args=None):
+        throttling_counter.record_response(throttled_response())
+        return []
+
+
+class OtherThrottledStore(ThrottledStore):
+    pass
+
+
+class FakeAsyncResult:
+    # Finished Celery task with the given result (a throttling report) or
+    # error
+    def __init__(self, task_id, result=None, error=None):
+        self.id = task_id
+        self.result = result
+        self.error = error
+
+    def ready(self):
+        return True
+
+    def successful(self):
+        return self.error is None
+
+    def get(self, propagate=True):
+        if self.error is not None and propagate:
+            raise self.error
+        return self.error or self.result
+
+    def maybe_throw(self):
+        self.get()
+
+
+def celery_task(async_results):
+    # products_for_url_task whose calls finish with the given results
+    async_results = iter(async_results)
+    task = mock.Mock()
+    task.s.return_value.apply_async.side_effect = \
+        lambda: next(async_results)
+    return task
+
+
+class ThrottlingCounterTestCase(unittest.TestCase):
+    def test_counts_per_store(self):
+        count = throttling_counter.count('ThrottledStore')
+        other_count = throttling_counter.count('OtherThrottledStore')
+
+        list(ThreadExecutor(ThrottledStore).map(
+            'products_for_url', [('https://www.example.com/1',)], 1))
+
+        self.assertEqual(count + 1, throttling_counter.count('ThrottledStore'))
+        self.assertEqual(other_count,
+                         throttling_counter.count('OtherThrottledStore'))
+
+    def test_ignores_responses_outside_of_store_calls(self):
+        counts = dict(throttling_counter.counts)
+        throttling_counter.record_response(throttled_response())
+        self.assertEqual(counts, dict(throttling_counter.counts))
+
+    def test_ignores_successful_responses(self):
+        with throttling_counter.counting('ThrottledStore') as call:
+            throttling_counter.record_response(mock.Mock(status_code=200))
+            throttling_counter.record_response(mock.Mock(status_code=404))
+        self.assertEqual(0, call['count'])
+
+    def test_remote_calls_report_their_count(self):
+        count = throttling_counter.count('ThrottledStore')
+
+        with mock.patch('storescraper.executors.get_store_class_by_name',
+                        return_value=ThrottledStore):
+            report = call_store_method('ThrottledStore', 'products_for_url',
+                                       'https://www.example.com/1')
+
+        self.assertEqual({'result': [], 'throttled_responses': 1}, report)
+        # Added by the process that receives the report instead
+        self.assertEqual(count, throttling_counter.count('ThrottledStore'))
+
+
+class AdaptiveConcurrencyTestCase(unittest.TestCase):
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        patcher = mock.patch.dict(os.environ,
+                                  {'STORESCRAPER_CACHE_DIR': cache_dir.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.learned_concurrency_path = os.path.join(
+            cache_dir.name, LEARNED_CONCURRENCY_FILENAME)
+
+    def learned_concurrency(self):
+        with open(self.learned_concurrency_path) as f:
+            return json.load(f)
+
+    def test_only_throttling_of_the_store_decreases_limit(self):
+        concurrency = AdaptiveConcurrency('ThrottledStore', 10)
+        concurrency.record(1)
+
+        throttling_counter.add('OtherThrottledStore', 1)
+        concurrency.record(1)
+        self.assertEqual(10, concurrency.limit)
+
+        throttling_counter.add('ThrottledStore', 1)
+        concurrency.record(1)
+        self.assertEqual(5, concurrency.limit)
+
+    def test_saves_learned_limit_once(self):
+        concurrency = AdaptiveConcurrency('ThrottledStore', 1)
+
+        with mock.patch('storescraper.concurrency.save_learned_concurrency',
+                        wraps=lambda key, value: None) as save:
+            for _ in range(3):
+                concurrency.record(1)
+            concurrency.save()
+            concurrency.save()
+
+        save.assert_called_once_with('ThrottledStore', 3)
+
+    def test_saves_keep_the_limits_of_other_stores(self):
+        concurrency = AdaptiveConcurrency('ThrottledStore', 1)
+        other_concurrency = AdaptiveConcurrency('OtherThrottledStore', 1)
+        concurrency.record(1)
+        other_concurrency.record(1)
+
+        concurrency.save()
+        other_concurrency.save()
+
+        self.assertEqual({'ThrottledStore': 2, 'OtherThrottledStore': 2},
+                         self.learned_concurrency())
+        self.assertEqual(2, AdaptiveConcurrency('ThrottledStore', 1).limit)
+
+
+class CeleryExecutorTestCase(unittest.TestCase):
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        patcher = mock.patch.dict(os.environ,
+                                  {'STORESCRAPER_CACHE_DIR': cache_dir.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_throttled_responses_are_counted_for_their_task(self):
+        task = celery_task([
+            FakeAsyncResult('1', {'result': [], 'throttled_responses': 0}),
+            FakeAsyncResult('2', {'result': [], 'throttled_responses': 2})])
+        concurrency = AdaptiveConcurrency('ThrottledStore', 10)
+
+        with mock.patch.object(ThrottledStore, 'products_for_url_task',
+                               task, create=True):
+            results = list(CeleryExecutor(ThrottledStore).map(
+                'products_for_url', [('1',), ('2',)], concurrency))
+
+        self.assertEqual([(0, []), (1, [])], results)
+        # The second task was recorded as throttled
+        self.assertEqual(5, concurrency.limit)
+
+    def test_failed_tasks_raise_without_decreasing_the_limit(self):
+        task = celery_task([
+            FakeAsyncResult('1', {'result': [], 'throttled_responses': 0}),
+            FakeAsyncResult('2', error=ValueError('Invalid page'))])
+        concurrency = AdaptiveConcurrency('ThrottledStore', 10)
+        results = []
+
+        with mock.patch.object(ThrottledStore, 'products_for_url_task',
+                               task, create=True):
+            with self.assertRaises(ValueError):
+                for result in CeleryExecutor(ThrottledStore).map(
+                        'products_for_url', [('1',), ('2',)], concurrency):
+                    results.append(result)
+
+        self.assertEqual([(0, [])], results)
+        self.assertEqual(10, concurrency.limit)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+from decimal import Decimal, InvalidOperation
+
+from storescraper.currency import Currency
+
+# Price texts as found in the stores, with their currency and the price
+# they stand for
+PRICES = [
+    ('$12.990', 'CLP', Decimal('12990')),
+    ('Precio internet: $ 1.299.990\n', 'CLP', Decimal('1299990')),
+    ('\n\t\t$\xa0349.990&nbsp;\t', 'CLP', Decimal('349990')),
+    ('CLP$ 89.990', 'CLP', Decimal('89990')),
+    ('$ 12.990,00', 'CLP', Decimal('12990')),
+    ('$ 54.999', 'ARS', Decimal('54999')),
+    ('R$ 1.234,56', 'BRL', Decimal('1234.56')),
+    ('R$ 1.234', 'BRL', Decimal('1234')),
+    ('R$ 12,5', 'BRL', Decimal('12.5')),
+    ('$1,234.56', 'MXN', Decimal('1234.56')),
+    ('$ 1.234,56', 'MXN', Decimal('1234.56')),
+    ('US$ 999.99', 'USD', Decimal('999.99')),
+    ('S/ 2,499.00', 'PEN', Decimal('2499')),
+    ('1\u202f234\u202f567 ₲', 'PYG', Decimal('1234567')),
+    ('₡1,234,567', 'CRC', Decimal('1234567')),
+    ('12990', 'CLP', Decimal('12990')),
+]
+
+
+class CurrencyParseTestCase(unittest.TestCase):
+    def test_parse(self):
+        for text, code, price in PRICES:
+            with self.subTest(text=text, code=code):
+                self.assertEqual(price, Currency.parse(text, code))
+
+    def test_parse_many(self):
+        self.assertEqual(
+            [Decimal('12990'), Decimal('1299990')],
+            Currency.parse_many(['$12.990', 'Precio: $1.299.990'], 'CLP'))
+
+    def test_number_after_the_currency_symbol(self):
+        self.assertEqual(Decimal('12990'),
+                         Currency.parse('20% dcto $12.990', 'CLP'))
+        self.assertEqual(Decimal('9990'),
+                         Currency.parse('$9.990 (antes $12.990)', 'CLP'))
+        self.assertEqual([Decimal('12990'), Decimal('1234.56')],
+                         [Currency.parse('2x1 $ 12.990', 'CLP'),
+                          Currency.parse('3 cuotas de R$ 1.234,56', 'BRL')])
+
+    def test_several_numbers_without_currency_symbol(self):
+        for text in ['20% dcto 12.990', '3 x 4.990']:
+            with self.subTest(text=text):
+                with self.assertRaises(InvalidOperation):
+                    Currency.parse(text, 'CLP')
+
+        with self.assertRaises(InvalidOperation):
+            Currency.parse_many(['$1.990', '20% dcto 12.990'], 'CLP')
+
+    def test_text_without_price(self):
+        for text in ['', 'Agotado', '$']:
+            with self.subTest(text=text):
+                with self.assertRaises(InvalidOperation):
+                    Currency.parse(text, 'CLP')
+
+        with self.assertRaises(InvalidOperation):
+            Currency.parse_many(['$1.990', 'Agotado'], 'CLP')
+
+    def test_unknown_currency(self):
+        with self.assertRaises(KeyError):
+            Currency.parse('$1.990', 'XXX')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from decimal import Decimal
+from unittest import mock
+
+from storescraper.executors import windowed_map
+from storescraper.orchestrator import MultiStoreScraper
+from storescraper.product import Product
+from storescraper.store import Store
+
+
+class PipelinedStore(Store):
+    preferred_discover_urls_concurrency = 1
+    preferred_products_for_url_concurrency = 4
+
+    @classmethod
+    def categories(cls):
+        return ['Notebook', 'Television']
+
+    @classmethod
+    def discover_entries_for_category(cls, category, extra_args=None):
+        time.sleep(0.01)
+        return {'https://www.example.com/{}/{}'.format(category, i): [
+            {'section_name': category, 'value': i + 1, 'category_weight': 1}]
+            for i in range(3)}
+
+    @classmethod
+    def products_for_url(cls, url, category=None, extra_args=None):
+        return [Product(url, cls.__name__, category, url, url, url, 1,
+                        Decimal(1000), Decimal(900), 'CLP')]
+
+
+def thread_futures_map(args_iterable, concurrency, budget, call):
+    # windowed_map over a thread pool, yielding the results of "call"
+    pool = ThreadPoolExecutor(max_workers=concurrency)
+
+    def submit(args):
+        return pool.submit(call, *args)
+
+    def wait_finished(futures):
+        return wait(futures, return_when=FIRST_COMPLETED).done
+
+    with pool:
+        for idx, future in windowed_map(submit, wait_finished, args_iterable,
+                                        concurrency, budget=budget):
+            yield idx, future.result()
+
+
+class WindowedMapTestCase(unittest.TestCase):
+    def test_results_in_completion_order(self):
+        results = dict(thread_futures_map(
+            [(0.05, 'slow'), (0, 'fast')], 2, None,
+            lambda delay, value: time.sleep(delay) or value))
+
+        self.assertEqual({0: 'slow', 1: 'fast'}, results)
+
+    def test_budget_bounds_every_map(self):
+        budget = threading.BoundedSemaphore(2)
+        running = []
+        max_running = []
+        lock = threading.Lock()
+
+        def call(value):
+            with lock:
+                running.append(value)
+                max_running.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.remove(value)
+            return value
+
+        def consume():
+            list(thread_futures_map([(i,) for i in range(10)], 5, budget,
+                                    call))
+
+        threads = [threading.Thread(target=consume) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        self.assertLessEqual(max(max_running), 2)
+        # Every slot is given back
+        for _ in range(2):
+            self.assertTrue(budget.acquire(blocking=False))
+
+    def test_budget_not_held_while_waiting_for_args(self):
+        budget = threading.BoundedSemaphore(1)
+        free_budget = []
+
+        def args_iterable():
+            for i in range(3):
+                # Another map (e.g. a discovery) can get the slot here
+                free_budget.append(budget.acquire(blocking=False))
+                budget.release()
+                yield i,
+
+        list(thread_futures_map(args_iterable(), 1, budget, lambda i: i))
+
+        self.assertEqual([True, True, True], free_budget)
+
+
+class PipelinedBudgetTestCase(unittest.TestCase):
+    def scrape(self, concurrency):
+        results = []
+        scraper = MultiStoreScraper(
+            ['PipelinedStore', 'PipelinedStore'], concurrency=concurrency,
+            executor='thread', pipelined=True, extra_args={
+                'PipelinedStore': {}})
+
+        def run():
+            results.extend(scraper.iter_results())
+
+        with mock.patch('storescraper.orchestrator.get_store_class_by_name',
+                        return_value=PipelinedStore):
+            thread = threading.Thread(target=run, daemon=True)
+            thread.start()
+            thread.join(30)
+
+        self.assertFalse(thread.is_alive(), 'The scraping deadlocked')
+        return results
+
+    def test_pipelined_with_budget_of_one(self):
+        results = self.scrape(1)
+
+        self.assertEqual(2, len(results))
+        for store_name, products_data, error in results:
+            self.assertIsNone(error)
+            self.assertEqual(6, len(products_data['products']))
+
+    def test_pipelined_with_budget_shared_by_stores(self):
+        for store_name, products_data, error in self.scrape(3):
+            self.assertIsNone(error)
+            self.assertEqual(6, len(products_data['products']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+
+from storescraper.utils import decode_json_at, extract_json, \
+    extract_ld_json, extract_script_json
+
+PRODUCT_PAGE = '''<html><head>
+<script type="application/ld+json">{"@type": "BreadcrumbList"}</script>
+<script type='application/ld+json' class="yoast-schema-graph">
+  {"@graph": [{"@type": "WebPage"}, {"name": "Notebook", "sku": "123"}]}
+</script>
+<script id="__NEXT_DATA__" type="application/json">{"props": {"page": 1}}
+</script>
+<script>
+var skuJson_0 = {"skus": [{"sku": 1, "bestPrice": 129990}]};
+vtex.events.addData({"productId": "42"});
+window.__PRELOADED_STATE__={"product":{"name":"TV"}};
+</script>
+</head><body></body></html>'''
+
+
+class ExtractJsonTestCase(unittest.TestCase):
+    def test_values_after_markers(self):
+        self.assertEqual({'skus': [{'sku': 1, 'bestPrice': 129990}]},
+                         extract_json(PRODUCT_PAGE, 'var skuJson_0'))
+        self.assertEqual({'productId': '42'},
+                         extract_json(PRODUCT_PAGE, 'vtex.events.addData('))
+        self.assertEqual({'product': {'name': 'TV'}},
+                         extract_json(PRODUCT_PAGE,
+                                      'window.__PRELOADED_STATE__'))
+
+    def test_missing_marker(self):
+        self.assertIsNone(extract_json(PRODUCT_PAGE, 'var skuJson_1'))
+
+    def test_marker_at_the_end_of_the_page(self):
+        self.assertIsNone(extract_json('<script>var data =', 'var data'))
+        self.assertIsNone(decode_json_at('var data = \n', 8))
+
+    def test_invalid_value(self):
+        with self.assertRaises(ValueError):
+            extract_json('var data = {"a": ', 'var data')
+
+    def test_script_json(self):
+        self.assertEqual({'props': {'page': 1}},
+                         extract_script_json(PRODUCT_PAGE, '__NEXT_DATA__'))
+        self.assertIsNone(extract_script_json(PRODUCT_PAGE, '__NUXT__'))
+
+
+class ExtractLdJsonTestCase(unittest.TestCase):
+    def test_first_and_last_blocks(self):
+        self.assertEqual({'@type': 'BreadcrumbList'},
+                         extract_ld_json(PRODUCT_PAGE))
+        self.assertEqual('Notebook',
+                         extract_ld_json(PRODUCT_PAGE, -1)['@graph'][1][
+                             'name'])
+        self.assertEqual(extract_ld_json(PRODUCT_PAGE, 1),
+                         extract_ld_json(PRODUCT_PAGE, -1))
+
+    def test_skips_malformed_blocks(self):
+        page_source = '<script type="application/ld+json">{"name": }' \
+                      '</script>' + PRODUCT_PAGE + \
+                      '<script type="application/ld+json"></script>'
+
+        self.assertEqual({'@type': 'BreadcrumbList'},
+                         extract_ld_json(page_source))
+        self.assertIn('@graph', extract_ld_json(page_source, -1))
+
+    def test_page_without_blocks(self):
+        self.assertIsNone(extract_ld_json('<html></html>'))
+        self.assertIsNone(extract_ld_json(PRODUCT_PAGE, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import io
+import os
+import tempfile
+import unittest
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+from urllib3._collections import HTTPHeaderDict
+
+from storescraper.http_cache import CachingAdapter, HttpCache, \
+    HttpCacheMissError
+
+URL = 'https://www.example.com/product'
+
+
+class FakeAdapter(HTTPAdapter):
+    # Answers every request with the given status, headers and body
+    def __init__(self, status=200, headers=None, body=b'<html></html>'):
+        super(FakeAdapter, self).__init__()
+        self.status = status
+        self.headers = headers or []
+        self.body = body
+        self.sent_requests = []
+
+    def send(self, request, **kwargs):
+        self.sent_requests.append(request)
+        raw = HTTPResponse(body=io.BytesIO(self.body),
+                           headers=HTTPHeaderDict(self.headers),
+                           status=self.status, preload_content=False)
+        return self.build_response(request, raw)
+
+
+class CachingAdapterTestCase(unittest.TestCase):
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        self.http_cache = HttpCache(
+            os.path.join(cache_dir.name, 'http_cache.sqlite3'))
+
+    def session(self, mode, adapter=None, ttl=None):
+        session = requests.Session()
+        session.mount('https://', CachingAdapter(
+            self.http_cache, mode, ttl, adapter or FakeAdapter()))
+        return session
+
+    def test_cache_mode_reuses_successful_responses(self):
+        adapter = FakeAdapter()
+        session = self.session('cache', adapter)
+
+        first_response = session.get(URL)
+        second_response = session.get(URL)
+
+        self.assertEqual(1, len(adapter.sent_requests))
+        self.assertFalse(hasattr(first_response, 'from_http_cache'))
+        self.assertTrue(second_response.from_http_cache)
+        self.assertEqual(b'<html></html>', second_response.content)
+
+    def test_cache_mode_skips_error_responses(self):
+        for status in [429, 500, 404]:
+            adapter = FakeAdapter(status=status)
+            session = self.session('cache', adapter)
+
+            session.get(URL + str(status))
+            response = session.get(URL + str(status))
+
+            self.assertEqual(2, len(adapter.sent_requests))
+            self.assertEqual(status, response.status_code)
+            self.assertFalse(hasattr(response, 'from_http_cache'))
+
+    def test_cache_mode_skips_post_requests(self):
+        adapter = FakeAdapter()
+        session = self.session('cache', adapter)
+
+        session.post(URL, data={'page': 1})
+        response = session.post(URL, data={'page': 1})
+
+        self.assertEqual(2, len(adapter.sent_requests))
+        self.assertFalse(hasattr(response, 'from_http_cache'))
+
+    def test_record_and_replay_every_response(self):
+        self.session('record', FakeAdapter(status=500)).post(URL, data='a')
+
+        response = self.session('replay').post(URL, data='a')
+
+        self.assertEqual(500, response.status_code)
+        self.assertTrue(response.from_http_cache)
+
+        with self.assertRaises(HttpCacheMissError):
+            self.session('replay').get(URL)
+
+    def test_replay_sets_cookies(self):
+        self.session('record', FakeAdapter(headers=[
+            ('Set-Cookie', 'session_id=abc; Path=/'),
+            ('Set-Cookie', 'region=13; Path=/')])).get(URL)
+
+        session = self.session('replay')
+        response = session.get(URL)
+
+        self.assertEqual({'session_id': 'abc', 'region': '13'},
+                         response.cookies.get_dict())
+        self.assertEqual({'session_id': 'abc', 'region': '13'},
+                         session.cookies.get_dict())
+
+
+if __name__ == '__main__':
+    unittest.main()
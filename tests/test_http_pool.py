@@ -0,0 +1,80 @@
+import unittest
+
+from storescraper.concurrency import AdaptiveConcurrency
+from storescraper.store import Store
+from storescraper.utils import pooled_adapter, session_with_proxy, \
+    get_cf_session
+
+
+class PoolStore(Store):
+    preferred_discover_urls_concurrency = 4
+    preferred_products_for_url_concurrency = 20
+
+    @classmethod
+    def categories(cls):
+        return ['Notebook']
+
+
+class PooledAdapterTestCase(unittest.TestCase):
+    def test_sessions_share_the_adapter(self):
+        extra_args = {'http_pool_store': 'PoolStore', 'http_pool_maxsize': 7}
+
+        self.assertIs(session_with_proxy(extra_args).get_adapter(
+            'https://'), pooled_adapter(extra_args))
+        self.assertEqual(7, pooled_adapter(extra_args)._pool_maxsize)
+
+    def test_pools_by_store_proxy_and_header_profile(self):
+        extra_args = {'http_pool_store': 'PoolStore', 'http_pool_maxsize': 7}
+        adapters = [
+            pooled_adapter(extra_args),
+            pooled_adapter(dict(extra_args, http_pool_store='OtherStore')),
+            pooled_adapter(dict(extra_args, proxy='http://proxy:3128')),
+            pooled_adapter(extra_args, header_profile='cloudflare'),
+            get_cf_session({}).get_adapter('https://'),
+        ]
+
+        self.assertEqual(len(adapters), len(set(map(id, adapters))))
+
+
+class StoreHttpPoolTestCase(unittest.TestCase):
+    def test_sized_to_the_concurrency(self):
+        extra_args = PoolStore._extra_args_with_http_pool(
+            {'proxy': 'http://proxy:3128'}, 4, 20)
+
+        self.assertEqual({'proxy': 'http://proxy:3128',
+                          'http_pool_store': 'PoolStore',
+                          'http_pool_maxsize': 20}, extra_args)
+
+    def test_sized_to_the_adaptive_maximum(self):
+        concurrency = AdaptiveConcurrency('PoolStore', 5, maximum=30)
+
+        self.assertEqual(30, PoolStore._extra_args_with_http_pool(
+            {}, concurrency)['http_pool_maxsize'])
+
+    def test_keeps_the_pool_of_the_caller(self):
+        extra_args = {'http_pool_store': 'PoolStore', 'http_pool_maxsize': 24}
+
+        self.assertEqual(extra_args, PoolStore._extra_args_with_http_pool(
+            extra_args, 4))
+
+    def test_products_for_urls(self):
+        extra_args_seen = []
+
+        class RecordingStore(PoolStore):
+            @classmethod
+            def products_for_url(cls, url, category=None, extra_args=None):
+                extra_args_seen.append(extra_args)
+                return []
+
+        RecordingStore.products_for_urls(
+            {'https://store.com/1': {'category': 'Notebook',
+                                     'positions': {}}},
+            executor='serial')
+
+        self.assertEqual('RecordingStore',
+                         extra_args_seen[0]['http_pool_store'])
+        self.assertEqual(20, extra_args_seen[0]['http_pool_maxsize'])
+
+
+if __name__ == '__main__':
+    unittest.main()
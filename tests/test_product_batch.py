@@ -0,0 +1,100 @@
+import unittest
+from decimal import Decimal
+from unittest import mock
+
+from storescraper.orchestrator import MultiStoreScraper
+from storescraper.product import Product
+from storescraper.product_batch import ProductBatch
+from storescraper.store import Store
+
+
+def sample_product(i, normal_price, offer_price, **kwargs):
+    url = 'https://www.example.com/product/{}'.format(i)
+    return Product('Product {}'.format(i), 'SampleStore', 'Notebook', url,
+                   url, str(i), i, normal_price, offer_price, 'CLP',
+                   **kwargs)
+
+
+class SampleStore(Store):
+    @classmethod
+    def categories(cls):
+        return ['Notebook']
+
+    @classmethod
+    def discover_entries_for_category(cls, category, extra_args=None):
+        return {'https://www.example.com/product/{}'.format(i): []
+                for i in range(3)}
+
+    @classmethod
+    def products_for_url(cls, url, category=None, extra_args=None):
+        i = int(url.split('/')[-1])
+        return [sample_product(i, Decimal(1299099 / 100), Decimal(12990))]
+
+
+class ProductBatchTestCase(unittest.TestCase):
+    def assert_round_trip(self, products):
+        batch = ProductBatch(products)
+
+        self.assertEqual(len(products), len(batch))
+        self.assertEqual([product.serialize() for product in products],
+                         [product.serialize() for product in batch])
+        self.assertEqual([product.serialize() for product in products],
+                         batch.serialize())
+
+    def test_round_trip(self):
+        self.assert_round_trip([
+            sample_product(0, Decimal('129990'), Decimal('119990')),
+            sample_product(1, Decimal('129.90'), Decimal('99.5'),
+                           sku='1', positions={'Notebook': 1},
+                           condition='https://schema.org/UsedCondition'),
+            sample_product(2, Decimal('1E+3'), Decimal('0')),
+        ])
+
+    def test_round_trip_of_float_prices(self):
+        # Decimals built from floats have more digits than fit in int64
+        products = [
+            sample_product(0, Decimal(1299099 / 100), Decimal(12990)),
+            sample_product(1, Decimal(0.1), Decimal(0.1)),
+            sample_product(2, Decimal('1E+200'), Decimal('-0')),
+        ]
+        self.assert_round_trip(products)
+
+        batch = ProductBatch(products)
+        self.assertEqual([product.normal_price for product in products],
+                         batch.column('normal_price'))
+        self.assertEqual('-0', str(batch[2].offer_price))
+
+    def test_indexing(self):
+        batch = ProductBatch([
+            sample_product(i, Decimal(1000), Decimal(900))
+            for i in range(3)])
+
+        self.assertEqual('Product 2', batch[-1].name)
+        self.assertEqual(['Product 1', 'Product 2'],
+                         [product.name for product in batch[1:]])
+        with self.assertRaises(IndexError):
+            batch[3]
+
+    def test_products_of_stores(self):
+        # Store.products returns a list, ProductBatch is opt-in
+        products_data = SampleStore.products(executor='serial',
+                                             extra_args={})
+        self.assertIsInstance(products_data['products'], list)
+
+        with mock.patch('storescraper.orchestrator.get_store_class_by_name',
+                        return_value=SampleStore):
+            results = list(MultiStoreScraper(
+                ['SampleStore'], executor='serial', product_batches=True,
+                extra_args={'SampleStore': {}}).iter_results())
+
+        products = results[0][1]['products']
+        self.assertIsInstance(products, ProductBatch)
+        self.assertEqual(
+            [dict(product.serialize(), timestamp=None)
+             for product in products_data['products']],
+            [dict(product.serialize(), timestamp=None)
+             for product in products])
+
+
+if __name__ == '__main__':
+    unittest.main()
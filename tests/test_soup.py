@@ -0,0 +1,40 @@
+import os
+import unittest
+from unittest import mock
+
+from storescraper.utils import listing_soup, make_soup
+
+# html.parser keeps the <div> inside the <p>, lxml closes the <p> before it
+INVALID_NESTING = '<p class="price"><div>$12.990</div></p>'
+
+
+class MakeSoupTestCase(unittest.TestCase):
+    def test_default_parser_is_html_parser(self):
+        with mock.patch.dict(os.environ):
+            os.environ.pop('STORESCRAPER_HTML_PARSER', None)
+            soup = make_soup(INVALID_NESTING)
+
+        self.assertEqual('$12.990', soup.find('p', 'price').find('div').text)
+
+    def test_environment_overrides_default_parser(self):
+        with mock.patch.dict(os.environ,
+                             {'STORESCRAPER_HTML_PARSER': 'lxml'}):
+            soup = make_soup(INVALID_NESTING)
+
+        self.assertIsNone(soup.find('p', 'price').find('div'))
+
+    def test_listing_soup_keeps_matching_containers(self):
+        soup = listing_soup(
+            '<div class="header">Menu</div>'
+            '<div class="product-tile col-6"><a href="/1">1</a></div>'
+            '<div class="product-tile"><a href="/2">2</a></div>',
+            'div', 'product-tile')
+
+        self.assertEqual(['/1', '/2'], [
+            container.find('a')['href']
+            for container in soup.find_all('div', 'product-tile')])
+        self.assertIsNone(soup.find('div', 'header'))
+
+
+if __name__ == '__main__':
+    unittest.main()
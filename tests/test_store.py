@@ -0,0 +1,199 @@
+import tempfile
+import unittest
+from decimal import Decimal
+from unittest import mock
+
+from celery import Celery, current_app
+from celery.contrib.testing.worker import start_worker
+
+from storescraper.product import Product
+from storescraper.store import Store
+from storescraper.utils import InvalidSessionCookieException
+
+
+class DefaultStore(Store):
+    pass
+
+
+class PoliteStore(Store):
+    preferred_products_for_url_concurrency = 3
+
+
+class PoliteStoreSubclass(PoliteStore):
+    pass
+
+
+class CookieStore(Store):
+    # Each preflight obtains a new session cookie, and only the last one is
+    # accepted by the store
+    preflight_count = 0
+
+    @classmethod
+    def preflight(cls, extra_args=None):
+        cls.preflight_count += 1
+        return {'cookie': cls.preflight_count}
+
+    @classmethod
+    def products_for_url(cls, url, category=None, extra_args=None):
+        if extra_args['cookie'] != cls.preflight_count:
+            raise InvalidSessionCookieException
+        return []
+
+
+class CachedCookieStore(CookieStore):
+    preflight_cache_ttl = 1800
+
+
+class ChordStore(Store):
+    @classmethod
+    def categories(cls):
+        return ['Notebook', 'Television', 'Headphones']
+
+    @classmethod
+    def discover_entries_for_category(cls, category, extra_args=None):
+        if category == 'Headphones':
+            return {}
+
+        return {'https://store.com/{}/{}'.format(category, i): [
+            {'section_name': category, 'value': i + 1, 'category_weight': 1}]
+            for i in range(3)}
+
+    @classmethod
+    def products_for_url(cls, url, category=None, extra_args=None):
+        if url.endswith('/2'):
+            return []
+
+        return [Product(url, cls.__name__, category, url, url, url, 1,
+                        Decimal(1000), Decimal(900), 'CLP')]
+
+
+def celery_app(chords_allowed=True):
+    app = mock.Mock()
+    if not chords_allowed:
+        app.backend.ensure_chords_allowed.side_effect = NotImplementedError
+    return app
+
+
+class CeleryChordsTestCase(unittest.TestCase):
+    def test_stores_with_concurrency_limits(self):
+        self.assertFalse(DefaultStore._sets_concurrency_limits())
+        self.assertTrue(PoliteStore._sets_concurrency_limits())
+        self.assertTrue(PoliteStoreSubclass._sets_concurrency_limits())
+
+    def test_chords_only_for_stores_without_limits(self):
+        self.assertTrue(DefaultStore._celery_chords_allowed(celery_app()))
+        self.assertFalse(PoliteStore._celery_chords_allowed(celery_app()))
+
+    def test_chords_need_backend_support(self):
+        self.assertFalse(DefaultStore._celery_chords_allowed(
+            celery_app(chords_allowed=False)))
+
+
+class CeleryChordsPipelineTestCase(unittest.TestCase):
+    # products_task with a result backend that supports chords, as it runs
+    # in the workers when such a backend is configured
+    @classmethod
+    def setUpClass(cls):
+        cls.previous_app = current_app._get_current_object()
+        cls.app = Celery('tests', broker='memory://',
+                         backend='cache+memory://')
+        cls.app.conf.update(result_serializer='storescraper',
+                            accept_content=['json', 'storescraper'],
+                            result_accept_content=['json', 'storescraper'])
+        cls.app.set_current()
+
+        cls.store_patcher = mock.patch(
+            'storescraper.store.get_store_class_by_name',
+            return_value=ChordStore)
+        cls.store_patcher.start()
+
+        cls.worker = start_worker(
+            cls.app, perform_ping_check=False,
+            queues=['celery', 'storescraper'], concurrency=1)
+        cls.worker.__enter__()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.worker.__exit__(None, None, None)
+        cls.store_patcher.stop()
+        cls.previous_app.set_current()
+
+    def test_chords_allowed(self):
+        self.assertTrue(ChordStore._celery_chords_allowed(self.app))
+
+    def test_products_task(self):
+        result = Store.products_task.delay(
+            'ChordStore', ['Notebook', 'Television']).get(timeout=60)
+
+        self.assertEqual(
+            ['https://store.com/Notebook/0', 'https://store.com/Notebook/1',
+             'https://store.com/Television/0',
+             'https://store.com/Television/1'],
+            sorted(product['url'] for product in result['products']))
+        self.assertEqual(
+            ['https://store.com/Notebook/2', 'https://store.com/Television/2'],
+            sorted(result['discovery_urls_without_products']))
+        self.assertEqual(
+            {'Notebook': 2},
+            [product['positions'] for product in result['products']
+             if product['url'] == 'https://store.com/Notebook/1'][0])
+
+    def test_products_task_without_entries(self):
+        # The products chord has no header, so the task is replaced by its
+        # body alone
+        result = Store.products_task.delay(
+            'ChordStore', ['Headphones']).get(timeout=60)
+
+        self.assertEqual({'products': [],
+                          'discovery_urls_without_products': []}, result)
+
+
+class InvalidSessionCookieTestCase(unittest.TestCase):
+    def setUp(self):
+        CookieStore.preflight_count = 0
+        patcher = mock.patch('storescraper.store.get_store_class_by_name',
+                             return_value=CookieStore)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_refreshed_preflight_args(self):
+        extra_args = CookieStore._extra_args_with_preflight({'proxy': 'p'})
+        CookieStore.preflight()
+
+        refreshed_args = CookieStore._refreshed_preflight_args(extra_args)
+
+        self.assertEqual(3, refreshed_args['cookie'])
+        self.assertEqual('p', refreshed_args['proxy'])
+        self.assertIsNone(CookieStore._refreshed_preflight_args(None))
+
+    def test_task_is_retried_with_a_new_preflight(self):
+        extra_args = CookieStore._extra_args_with_preflight({})
+        # The cookie of extra_args expires
+        CookieStore.preflight()
+
+        result = Store.products_for_url_task.apply(
+            args=('CookieStore', 'url'), kwargs={'extra_args': extra_args})
+
+        self.assertEqual([], result.get())
+        self.assertEqual(3, CookieStore.preflight_count)
+
+    def test_cached_preflight_is_replaced(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+
+        with mock.patch.dict('os.environ',
+                             {'STORESCRAPER_CACHE_DIR': cache_dir.name}):
+            extra_args = CachedCookieStore._extra_args_with_preflight({})
+            CachedCookieStore.preflight()
+
+            refreshed_args = CachedCookieStore._refreshed_preflight_args(
+                extra_args)
+            # Later calls use the new cached preflight
+            cached_args = CachedCookieStore._extra_args_with_preflight({})
+
+        self.assertEqual(3, refreshed_args['cookie'])
+        self.assertEqual(3, cached_args['cookie'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import ast
+import os
+import unittest
+
+from storescraper import stores
+
+
+class StoreModulesTestCase(unittest.TestCase):
+    def test_every_store_is_defined_in_its_module(self):
+        # Checked from the source of the store modules, so the test doesn't
+        # need the dependencies of every store
+        stores_path = os.path.dirname(stores.__file__)
+
+        for store_name, module_name in stores.STORE_MODULES.items():
+            module_path = os.path.join(
+                stores_path, '{}.py'.format(module_name))
+
+            with open(module_path, encoding='utf-8') as f:
+                module_ast = ast.parse(f.read())
+
+            class_names = [node.name for node in module_ast.body
+                           if isinstance(node, ast.ClassDef)]
+            self.assertIn(store_name, class_names, module_path)
+
+    def test_store_names_match_exports(self):
+        self.assertEqual(stores.store_names(), stores.__all__)
+        self.assertIn('MercadoLibreArgentinaWesternDigital',
+                      stores.store_names())
+
+
+if __name__ == '__main__':
+    unittest.main()